@@ -65,6 +65,10 @@ def test_benchmark_config(
             executor=ThreadPoolConfig(max_thread=4),
             transformer=NullTransformerConfig(),
             filter=FilterConfig(),
-            run=RunConfig(log_file_name=None, run_dir=str(tmp_path)),
+            run=RunConfig(
+                log_file_name=None,
+                run_dir=str(tmp_path),
+                run_dir_format=str(tmp_path / 'runs' / '{name}-{timestamp}'),
+            ),
             workflow=TestWorkflowConfig(tasks=3),
         )
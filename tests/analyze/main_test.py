@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+
+from webs.analyze.main import main
+from webs.run.config import BenchmarkConfig
+from webs.run.main import run
+
+
+def test_main(
+    test_benchmark_config: BenchmarkConfig,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: pathlib.Path,
+) -> None:
+    test_benchmark_config.run.run_dir_format = str(tmp_path / '{name}')
+    run(test_benchmark_config)
+    run_dir = pathlib.Path(test_benchmark_config.get_run_dir())
+
+    trace = tmp_path / 'trace.json'
+    assert (
+        main(
+            [
+                str(run_dir),
+                '--bins',
+                '2',
+                '--percentiles',
+                '50',
+                '--trace',
+                str(trace),
+            ],
+        )
+        == 0
+    )
+    output = capsys.readouterr().out
+    assert 'Makespan' in output
+    assert 'Latency percentiles: compute' in output
+    assert 'Critical path' in output
+
+    with open(trace) as f:
+        events = json.load(f)
+    assert any(event['ph'] == 'X' for event in events)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import pathlib
+from typing import Any
+
+import pytest
+
+from webs.analyze.metrics import critical_path
+from webs.analyze.metrics import get_workers
+from webs.analyze.metrics import latency_percentiles
+from webs.analyze.metrics import load_run
+from webs.analyze.metrics import makespan
+from webs.analyze.metrics import overhead
+from webs.analyze.metrics import payload_sizes
+from webs.analyze.metrics import resource_usage
+from webs.analyze.metrics import throughput
+from webs.analyze.metrics import utilization
+from webs.columnar import json_to_columnar
+from webs.columnar import read_json_records
+
+
+def _record(
+    task_id: str,
+    parents: list[str],
+    submit: float,
+    start: float,
+    end: float,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    return {
+        'task_id': task_id,
+        'function_name': task_id.rstrip('0123456789'),
+        'parent_task_ids': parents,
+        'submit_time': submit,
+        'received_time': end + 0.1,
+        'execution': {
+            'hostname': 'host',
+            'execution_start_time': start,
+            'execution_end_time': end,
+            'task_start_time': start + 0.1,
+            'task_end_time': end - 0.1,
+            'input_transform_start_time': start,
+            'input_transform_end_time': start + 0.1,
+            'result_transform_start_time': end - 0.1,
+            'result_transform_end_time': end,
+        },
+        'cache_hit': False,
+        'speculative_copies': 0,
+        'retries': 0,
+        'first_failure_time': None,
+        **kwargs,
+    }
+
+
+@pytest.fixture(params=('json', 'columnar'))
+def run_dir(
+    request: pytest.FixtureRequest,
+    tmp_path: pathlib.Path,
+) -> pathlib.Path:
+    # Diamond DAG where the right branch is slower.
+    records = [
+        _record('a', [], 0, 0.1, 1.1),
+        _record('left', ['a'], 1.2, 1.3, 2.3),
+        _record('right', ['a'], 1.2, 1.3, 3.3),
+        _record('d', ['left', 'right'], 1.2, 3.5, 4.5),
+    ]
+    config = {
+        'name': 'test',
+        'executor': {'max_threads': 2},
+        'run': {
+            'task_record_file_name': 'tasks.json',
+            'task_record_logger': request.param,
+        },
+    }
+    with open(tmp_path / 'config.json', 'w') as f:
+        json.dump(config, f)
+    with open(tmp_path / 'tasks.json', 'w') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+    if request.param == 'columnar':
+        json_to_columnar(tmp_path / 'tasks.json', tmp_path / 'tasks')
+        (tmp_path / 'tasks.json').unlink()
+    return tmp_path
+
+
+def test_metrics(run_dir: pathlib.Path) -> None:
+    config, tasks = load_run(run_dir)
+    assert get_workers(config) == 2  # noqa: PLR2004
+    assert get_workers({}) is None
+    assert len(tasks) == 4  # noqa: PLR2004
+
+    assert makespan(tasks) == pytest.approx(4.6)
+    assert throughput(tasks, bins=4)['tasks'].sum() == len(tasks)
+
+    usage = utilization(tasks, get_workers(config))
+    assert usage.peak_concurrency == 2  # noqa: PLR2004
+    assert usage.busy == pytest.approx(5)
+    assert usage.utilization == pytest.approx(5 / (2 * 4.6))
+
+    latencies = latency_percentiles(tasks, (50, 100))
+    assert latencies.loc['d', 'tasks'] == 1
+    assert latencies.loc['d', ('queue', 'p100')] == pytest.approx(2.3)
+    assert latencies.loc['d', ('compute', 'p50')] == pytest.approx(0.8)
+    assert latencies.loc['d', ('return', 'p50')] == pytest.approx(0.1)
+
+    path = critical_path(tasks)
+    assert list(path['task_id']) == ['a', 'right', 'd']
+    path_overhead = overhead(path)
+    assert path_overhead.wall == pytest.approx(4.6)
+    assert path_overhead.work == pytest.approx(0.8 + 1.8 + 0.8)
+    assert path_overhead.overhead == pytest.approx(4.6 - 3.4)
+    # The child d is submitted before its parents complete so its queue
+    # time starts when the result of the right parent is received.
+    assert path_overhead.phases['queue'] == pytest.approx(0.3)
+    assert path_overhead.gaps == pytest.approx(0)
+
+
+def test_metrics_empty(tmp_path: pathlib.Path) -> None:
+    (tmp_path / 'tasks.json').touch()
+    tasks = read_json_records(tmp_path / 'tasks.json')
+    assert len(critical_path(tasks)) == 0
+    assert overhead(tasks).wall == 0
+    assert makespan(tasks) == 0
+
+
+def test_resource_usage(tmp_path: pathlib.Path) -> None:
+    resources = {
+        'user_time': 0.3,
+        'system_time': 0.1,
+        'max_rss_delta': 1024,
+        'voluntary_context_switches': 2,
+        'involuntary_context_switches': 10,
+        'read_bytes': 100,
+        'write_bytes': 0,
+    }
+    records = [_record('a', [], 0, 0, 1.2), _record('b', [], 0, 0, 1.2)]
+    records[0]['execution']['resources'] = resources
+    with open(tmp_path / 'tasks.json', 'w') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+
+    tasks = read_json_records(tmp_path / 'tasks.json')
+    usage = resource_usage(tasks)
+    assert list(usage.index) == ['a']
+    assert usage.loc['a', 'tasks'] == 1
+    assert usage.loc['a', 'cpu_utilization'] == pytest.approx(0.4)
+    assert usage.loc['a', 'involuntary_context_switches'] == 10  # noqa: PLR2004
+
+    records[0]['execution'].pop('resources')
+    with open(tmp_path / 'tasks.json', 'w') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+    assert len(resource_usage(read_json_records(tmp_path / 'tasks.json'))) == 0
+
+
+def test_payload_sizes(tmp_path: pathlib.Path) -> None:
+    records = [
+        _record('a1', [], 0, 0, 1.2),
+        _record('a2', [], 0, 0, 1.2),
+        _record('b', [], 0, 0, 1.2),
+    ]
+    records[0]['execution']['payload'] = {
+        'args_bytes': 100,
+        'args_transformed_bytes': 1000,
+        'result_bytes': 50,
+        'result_transformed_bytes': 0,
+    }
+    records[1]['execution']['payload'] = {
+        'args_bytes': 300,
+        'args_transformed_bytes': 3000,
+        'result_bytes': 50,
+        'result_transformed_bytes': 0,
+    }
+    with open(tmp_path / 'tasks.json', 'w') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+
+    tasks = read_json_records(tmp_path / 'tasks.json')
+    sizes = payload_sizes(tasks)
+    assert list(sizes.index) == ['a']
+    assert sizes.loc['a', 'tasks'] == 2  # noqa: PLR2004
+    assert sizes.loc['a', 'args_bytes'] == 200  # noqa: PLR2004
+    # 4000 bytes resolved in 0.2 seconds of input transforms.
+    assert sizes.loc['a', 'input_transform_rate'] == pytest.approx(20000)
+    assert sizes.loc['a', 'result_transform_rate'] == 0
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import math
+import pathlib
+import threading
+from typing import Any
+
+import pandas
+import pytest
+
+from webs.columnar import columnar_to_json
+from webs.columnar import ColumnarRecordLogger
+from webs.columnar import json_to_columnar
+from webs.columnar import read_columnar
+from webs.columnar import read_json_records
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    records = []
+    for i in range(count):
+        execution = {
+            'hostname': f'host-{i % 2}',
+            'execution_start_time': i + 0.1,
+            'execution_end_time': i + 0.9,
+            'task_start_time': i + 0.2,
+            'task_end_time': i + 0.8,
+            'input_transform_start_time': i + 0.1,
+            'input_transform_end_time': i + 0.2,
+            'result_transform_start_time': i + 0.8,
+            'result_transform_end_time': i + 0.9,
+        }
+        records.append(
+            {
+                'task_id': f'task-{i}',
+                'function_name': 'even' if i % 2 == 0 else 'odd',
+                'parent_task_ids': [
+                    f'task-{p}' for p in range(max(0, i - 2), i)
+                ],
+                'submit_time': float(i),
+                'received_time': i + 1.0,
+                'execution': execution,
+                'cache_hit': i == 1,
+                'speculative_copies': 0,
+                'retries': i % 3,
+                'first_failure_time': i + 0.5 if i % 3 else None,
+            },
+        )
+    return records
+
+
+def test_columnar_json_round_trip(tmp_path: pathlib.Path) -> None:
+    records = _records(10)
+    records[0]['execution']['resources'] = {
+        'user_time': 0.5,
+        'system_time': 0.1,
+        'max_rss_delta': 4096,
+        'voluntary_context_switches': 3,
+        'involuntary_context_switches': 7,
+        'read_bytes': 100,
+        'write_bytes': None,
+    }
+    records[1]['execution'].update(clock_offset=0.25, clock_offset_error=0.1)
+    records[2]['execution']['payload'] = {
+        'args_bytes': 120,
+        'args_transformed_bytes': 0,
+        'result_bytes': 64,
+        'result_transformed_bytes': None,
+    }
+    json_path = tmp_path / 'tasks.json'
+    with open(json_path, 'w') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+
+    columnar_path = tmp_path / 'tasks'
+    json_to_columnar(json_path, columnar_path, chunk_size=3)
+    assert len(list(columnar_path.glob('*.npz'))) == 4  # noqa: PLR2004
+
+    converted_path = tmp_path / 'converted.json'
+    columnar_to_json(columnar_path, converted_path)
+    with open(converted_path) as f:
+        assert [json.loads(line) for line in f] == records
+
+
+def test_read_columnar(tmp_path: pathlib.Path) -> None:
+    records = _records(5)
+    records[-1]['execution'] = None
+    records[-1]['received_time'] = None
+
+    with ColumnarRecordLogger(tmp_path, chunk_size=2, compress=True) as logger:
+        for record in records:
+            logger.log(record)
+
+    df = read_columnar(tmp_path)
+    assert len(df) == len(records)
+    assert list(df['task_id']) == [r['task_id'] for r in records]
+    assert list(df['function_name'].cat.categories) == ['even', 'odd']
+    assert df.loc[df.index[3], 'parent_task_ids'] == list(df.index[1:3])
+    assert (
+        df['task_start_time'].iloc[1]
+        == records[1]['execution']['task_start_time']
+    )
+    assert math.isnan(df['received_time'].iloc[-1])
+    assert math.isnan(df['execution_start_time'].iloc[-1])
+    assert df['hostname'].isna().iloc[-1]
+    assert df['retries'].sum() == sum(r['retries'] for r in records)
+
+
+def test_columnar_record_logger_threads(tmp_path: pathlib.Path) -> None:
+    threads = 8
+    records = _records(threads * 500)
+
+    with ColumnarRecordLogger(tmp_path, chunk_size=64) as logger:
+        workers = [
+            threading.Thread(
+                target=lambda i: [
+                    logger.log(record) for record in records[i::threads]
+                ],
+                args=(i,),
+            )
+            for i in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    df = read_columnar(tmp_path)
+    assert len(df) == len(records)
+    task_ids = dict(zip(df.index, df['task_id']))
+    expected = {r['task_id']: r for r in records}
+    assert set(task_ids.values()) == set(expected)
+    for task_id, parents, hostname in zip(
+        df['task_id'],
+        df['parent_task_ids'],
+        df['hostname'],
+    ):
+        record = expected[task_id]
+        assert [task_ids[p] for p in parents] == record['parent_task_ids']
+        assert hostname == record['execution']['hostname']
+
+
+def test_read_json_records(tmp_path: pathlib.Path) -> None:
+    records = _records(5)
+    json_path = tmp_path / 'tasks.json'
+    with open(json_path, 'w') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+    json_to_columnar(json_path, tmp_path / 'tasks', chunk_size=2)
+
+    from_json = read_json_records(json_path, batch_size=2)
+    from_columnar = read_columnar(tmp_path / 'tasks')
+    # Strings are interned in the same order when the batch and chunk
+    # sizes are the same.
+    pandas.testing.assert_frame_equal(from_json, from_columnar)
+
+
+def test_columnar_record_logger_errors(tmp_path: pathlib.Path) -> None:
+    logger = ColumnarRecordLogger(tmp_path)
+    logger.log(_records(1)[0])
+    logger.close()
+    logger.close()
+
+    with pytest.raises(RuntimeError, match='closed'):
+        logger.log(_records(1)[0])
+
+    with pytest.raises(FileExistsError):
+        ColumnarRecordLogger(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        read_columnar(tmp_path / 'missing')
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pathlib
+import pickle
 
 from webs.data.file import PickleFileTransformer
 from webs.data.file import PickleFileTransformerConfig
@@ -8,7 +9,13 @@ from webs.data.file import PickleFileTransformerConfig
 
 def test_config() -> None:
     config = PickleFileTransformerConfig(file_dir='test')
-    config.get_transformer()
+    assert not config.get_transformer().out_of_band
+
+    config = PickleFileTransformerConfig(
+        file_dir='test',
+        file_out_of_band=True,
+    )
+    assert config.get_transformer().out_of_band
 
 
 def test_pickle_file_transformer(tmp_path: pathlib.Path) -> None:
@@ -18,3 +25,58 @@ def test_pickle_file_transformer(tmp_path: pathlib.Path) -> None:
     identifier = transformer.transform(obj)
     assert transformer.is_identifier(identifier)
     assert transformer.resolve(identifier) == obj
+
+
+def test_pickle_file_transformer_evict(tmp_path: pathlib.Path) -> None:
+    transformer = PickleFileTransformer(tmp_path)
+
+    identifier = transformer.transform([1, 2, 3])
+    assert identifier.path().exists()
+    transformer.evict(identifier)
+    assert not identifier.path().exists()
+    # Evicting twice is a no-op.
+    transformer.evict(identifier)
+
+
+def test_pickle_file_transformer_out_of_band(tmp_path: pathlib.Path) -> None:
+    transformer = PickleFileTransformer(
+        tmp_path,
+        out_of_band=True,
+        min_buffer_size=1000,
+    )
+
+    obj = {
+        'small': bytearray(b'a' * 10),
+        'large': bytearray(b'b' * 5000),
+        'buffer': pickle.PickleBuffer(bytearray(b'c' * 3000)),
+        'empty': bytearray(),
+    }
+    identifier = transformer.transform(obj)
+    with open(identifier.path(), 'rb') as f:
+        assert f.read(8) == b'WEBSOOB1'
+
+    resolved = transformer.resolve(identifier)
+    assert resolved['small'] == obj['small']
+    assert resolved['large'] == obj['large']
+    assert bytes(resolved['buffer']) == b'c' * 3000
+    assert resolved['empty'] == bytearray()
+
+    # Resolved buffers are writable copies of the file.
+    view = memoryview(resolved['buffer'])
+    view[0] = ord('x')
+    assert bytes(transformer.resolve(identifier)['buffer']) == b'c' * 3000
+    view.release()
+
+    transformer.evict(identifier)
+    assert not identifier.path().exists()
+
+
+def test_pickle_file_transformer_out_of_band_compatible(
+    tmp_path: pathlib.Path,
+) -> None:
+    in_band = PickleFileTransformer(tmp_path)
+    out_of_band = PickleFileTransformer(tmp_path, out_of_band=True)
+
+    obj = [1, 2, 3]
+    assert out_of_band.resolve(in_band.transform(obj)) == obj
+    assert out_of_band.resolve(out_of_band.transform(obj)) == obj
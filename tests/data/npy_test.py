@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pathlib
+
+import numpy
+import pytest
+
+from webs.data.npy import ArrayIdentifier
+from webs.data.npy import NumpyMmapTransformer
+from webs.data.npy import NumpyMmapTransformerConfig
+
+
+def test_config() -> None:
+    config = NumpyMmapTransformerConfig(npy_dir='test', npy_mmap_mode='c')
+    transformer = config.get_transformer()
+    assert transformer.mmap_mode == 'c'
+
+
+def test_numpy_mmap_transformer_array(tmp_path: pathlib.Path) -> None:
+    transformer = NumpyMmapTransformer(tmp_path)
+
+    array = numpy.arange(100, dtype=numpy.float64).reshape(10, 10)
+    identifier = transformer.transform(array)
+    assert isinstance(identifier, ArrayIdentifier)
+    assert transformer.is_identifier(identifier)
+    assert identifier.path().suffix == '.npy'
+
+    resolved = transformer.resolve(identifier)
+    assert isinstance(resolved, numpy.memmap)
+    assert numpy.array_equal(resolved, array)
+    assert numpy.array_equal(resolved[2:4, 5:], array[2:4, 5:])
+    with pytest.raises(ValueError, match='read-only'):
+        resolved[0, 0] = -1
+
+    transformer.evict(identifier)
+    assert not identifier.path().exists()
+    # Resolved arrays remain valid after eviction.
+    assert resolved.sum() == array.sum()
+
+
+def test_numpy_mmap_transformer_copy_on_write(tmp_path: pathlib.Path) -> None:
+    transformer = NumpyMmapTransformer(tmp_path, mmap_mode='c')
+
+    array = numpy.zeros(10, order='F')
+    identifier = transformer.transform(array)
+    resolved = transformer.resolve(identifier)
+    resolved[0] = 1
+    assert transformer.resolve(identifier)[0] == 0
+
+
+@pytest.mark.parametrize(
+    'obj',
+    ([1, 2, 3], numpy.array([{'a': 1}, None], dtype=object)),
+)
+def test_numpy_mmap_transformer_pickle_fallback(
+    obj: object,
+    tmp_path: pathlib.Path,
+) -> None:
+    transformer = NumpyMmapTransformer(tmp_path)
+
+    identifier = transformer.transform(obj)
+    assert not isinstance(identifier, ArrayIdentifier)
+    assert transformer.is_identifier(identifier)
+    resolved = transformer.resolve(identifier)
+    assert type(resolved) is type(obj)
+    assert list(resolved) == list(obj)  # type: ignore[call-overload]
+
+    transformer.evict(identifier)
+    assert not identifier.path().exists()
+
+
+def test_numpy_mmap_transformer_masked_array(tmp_path: pathlib.Path) -> None:
+    transformer = NumpyMmapTransformer(tmp_path)
+    array = numpy.ma.masked_array([1, 2, 3], mask=[False, True, False])
+
+    identifier = transformer.transform(array)
+    assert not isinstance(identifier, ArrayIdentifier)
+    resolved = transformer.resolve(identifier)
+    assert isinstance(resolved, numpy.ma.MaskedArray)
+    assert resolved.mask.tolist() == [False, True, False]
+    assert resolved.sum() == 4  # noqa: PLR2004
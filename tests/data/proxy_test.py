@@ -6,6 +6,7 @@ import pytest
 from proxystore.connectors.local import LocalConnector
 from proxystore.proxy import Proxy
 from proxystore.store import Store
+from proxystore.store.utils import get_key
 
 from webs.data.proxy import ProxyFileTransformerConfig
 from webs.data.proxy import ProxyTransformer
@@ -46,3 +47,18 @@ def test_proxy_transformer(extract: bool) -> None:
         resolved = transformer.resolve(identifier)
         assert isinstance(resolved, Proxy) != extract
         assert resolved == obj
+
+
+def test_proxy_transformer_evict() -> None:
+    with Store(
+        'test-proxy-transformer-evict',
+        LocalConnector(),
+        register=True,
+    ) as store:
+        transformer = ProxyTransformer(store)
+
+        identifier = transformer.transform([1, 2, 3])
+        key = get_key(identifier)
+        assert store.exists(key)
+        transformer.evict(identifier)
+        assert not store.exists(key)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import pickle
+import threading
 import uuid
+from concurrent.futures import Future
 from typing import Any
 from typing import TypeVar
 
 import pytest
+from dask.distributed import Client
 
 from webs.data.filter import ObjectTypeFilter
 from webs.data.null import NullTransformer
+from webs.data.transform import content_hash
 from webs.data.transform import TaskDataTransformer
 
 T = TypeVar('T')
@@ -36,6 +41,8 @@ def test_null_transformer() -> None:
     assert transformer.transform(obj) is obj
     with pytest.raises(NotImplementedError):
         transformer.resolve(obj)
+    with pytest.raises(NotImplementedError):
+        transformer.evict(obj)
 
 
 def test_task_data_transfomer() -> None:
@@ -96,3 +103,123 @@ def test_task_data_transfomer_mapping_filter() -> None:
     assert objs != identifiers
     assert objs.keys() == identifiers.keys()
     assert transformer.resolve_mapping(identifiers) == objs
+
+
+def test_task_data_transformer_skips_futures() -> None:
+    transformer = TaskDataTransformer(DictTransformer())
+
+    future: Future[Any] = Future()
+    assert transformer.transform(future) is future
+
+    with Client(n_workers=1, processes=False, dashboard_address=None) as c:
+        dask_future = c.submit(sum, [1, 2])
+        assert transformer.transform(dask_future) is dask_future
+
+
+class CountingTransformer(DictTransformer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.transforms = 0
+
+    def transform(self, obj: T) -> uuid.UUID:
+        self.transforms += 1
+        return super().transform(obj)
+
+    def resolve(self, identifier: uuid.UUID) -> Any:
+        return self.data[identifier]
+
+    def evict(self, identifier: uuid.UUID) -> None:
+        del self.data[identifier]
+
+
+def test_content_hash() -> None:
+    assert content_hash([1, 2, 3]) == content_hash([1, 2, 3])
+    assert content_hash([1, 2, 3]) != content_hash([1, 2, 4])
+    assert content_hash(threading.Lock()) is None
+
+
+def test_content_hash_out_of_band_buffers() -> None:
+    data = bytearray(b'\0' * 1000)
+    buffer = pickle.PickleBuffer(data)
+    assert content_hash(buffer) == content_hash(pickle.PickleBuffer(data))
+    data[0] = 1
+    assert content_hash(buffer) != content_hash(bytearray(1000))
+
+
+def test_task_data_transformer_dedup() -> None:
+    dict_transformer = CountingTransformer()
+    transformer = TaskDataTransformer(dict_transformer, dedup=True)
+
+    obj = {'values': list(range(10))}
+    first = transformer.transform(obj)
+    assert transformer.transform(obj) == first
+    # Equal content but a different object is also deduplicated.
+    assert transformer.transform({'values': list(range(10))}) == first
+    assert dict_transformer.transforms == 1
+
+    # Mutated objects are transformed again.
+    obj['values'].append(10)
+    second = transformer.transform(obj)
+    assert second != first
+    assert transformer.resolve(second) == obj
+    assert dict_transformer.transforms == 2  # noqa: PLR2004
+
+    # Unpicklable objects are not deduplicated.
+    lock = threading.Lock()
+    assert transformer.transform(lock) != transformer.transform(lock)
+
+
+def test_task_data_transformer_dedup_identity() -> None:
+    dict_transformer = CountingTransformer()
+    transformer = TaskDataTransformer(
+        dict_transformer,
+        dedup=True,
+        identity_cache_size=1,
+    )
+
+    a, b = b'a' * 100, b'b' * 100
+    identifier = transformer.transform(a)
+    assert transformer._by_identity[id(a)] == (a, identifier)
+    transformer.transform(b)
+    assert id(a) not in transformer._by_identity
+    assert transformer.transform(a) == identifier
+    assert dict_transformer.transforms == 2  # noqa: PLR2004
+
+
+def test_task_data_transformer_dedup_pickle() -> None:
+    transformer = TaskDataTransformer(CountingTransformer(), dedup=True)
+    first = transformer.transform('object')
+
+    copied = pickle.loads(pickle.dumps(transformer))
+    assert copied.dedup
+    assert len(copied._by_hash) == 0
+    assert copied.transform('object') != first
+
+
+def test_task_data_transformer_dedup_evict() -> None:
+    dict_transformer = CountingTransformer()
+    transformer = TaskDataTransformer(dict_transformer, dedup=True)
+
+    identifier = transformer.transform('object')
+    assert transformer.transform('object') == identifier
+    transformer.evict(identifier)
+    assert identifier not in dict_transformer.data
+    # Evicted identifiers are not reused.
+    assert transformer.transform('object') != identifier
+    assert dict_transformer.transforms == 2  # noqa: PLR2004
+
+
+def test_task_data_transformer_evict_on_resolve() -> None:
+    dict_transformer = CountingTransformer()
+    transformer = TaskDataTransformer(dict_transformer, evict_on_resolve=True)
+
+    identifier = transformer.transform('object')
+    assert transformer.resolve(identifier) == 'object'
+    assert len(dict_transformer.data) == 0
+
+    with pytest.raises(ValueError, match='incompatible'):
+        TaskDataTransformer(
+            dict_transformer,
+            dedup=True,
+            evict_on_resolve=True,
+        )
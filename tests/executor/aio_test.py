@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from webs.data.file import PickleFileTransformer
+from webs.data.transform import TaskDataTransformer
+from webs.executor.aio import as_completed
+from webs.executor.aio import AsyncWorkflowExecutor
+from webs.executor.aio import wait
+from webs.executor.cache import TaskCache
+from webs.executor.dag import DAGExecutor
+from webs.executor.workflow import WorkflowExecutor
+
+
+def test_await_task_future(workflow_executor: WorkflowExecutor) -> None:
+    async def _main() -> int:
+        task = workflow_executor.submit(sum, [1, 2, 3])
+        return await task
+
+    assert asyncio.run(_main()) == 6  # noqa: PLR2004
+
+
+def test_await_task_future_exception(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    async def _main() -> None:
+        await workflow_executor.submit(int, 'a')
+
+    with pytest.raises(ValueError, match='invalid literal'):
+        asyncio.run(_main())
+
+
+class _ThreadRecordingTransformer(PickleFileTransformer):
+    def __init__(self, cache_dir: pathlib.Path) -> None:
+        super().__init__(cache_dir)
+        self.resolve_threads: list[int] = []
+
+    def resolve(self, identifier: Any) -> Any:
+        self.resolve_threads.append(threading.get_ident())
+        return super().resolve(identifier)
+
+
+def test_await_task_future_resolve_off_loop(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    transformer = _ThreadRecordingTransformer(tmp_path)
+    cache = TaskCache()
+
+    async def _main() -> list[int]:
+        with WorkflowExecutor(
+            DAGExecutor(thread_executor),
+            data_transformer=TaskDataTransformer(transformer),
+            cache=cache,
+        ) as executor:
+            return await executor.submit(list, range(3))
+
+    assert asyncio.run(_main()) == [0, 1, 2]
+    # The main thread runs the event loop.
+    assert len(transformer.resolve_threads) > 0
+    assert threading.get_ident() not in transformer.resolve_threads
+    # The resolved result is still stored in the task cache.
+    assert len(cache) == 1
+
+
+def test_async_workflow_executor(workflow_executor: WorkflowExecutor) -> None:
+    async def _main() -> tuple[int, list[int]]:
+        async with AsyncWorkflowExecutor(workflow_executor) as executor:
+            task = executor.submit(sum, [1, 2, 3])
+            results = [r async for r in executor.map(abs, range(-5, 5))]
+            return await task, results
+
+    result, results = asyncio.run(_main())
+    assert result == 6  # noqa: PLR2004
+    assert results == [abs(x) for x in range(-5, 5)]
+
+
+def test_async_workflow_executor_map_timeout(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    async def _main() -> None:
+        executor = AsyncWorkflowExecutor(workflow_executor)
+        async for _ in executor.map(time.sleep, [0.1], timeout=0.001):
+            pass
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(_main())
+
+
+def test_async_as_completed(workflow_executor: WorkflowExecutor) -> None:
+    async def _main() -> None:
+        tasks = [
+            workflow_executor.submit(time.sleep, delay) for delay in (0.1, 0)
+        ]
+        completed = [task async for task in as_completed(tasks)]
+        assert completed == list(reversed(tasks))
+
+    asyncio.run(_main())
+
+
+def test_async_as_completed_timeout(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    async def _main() -> None:
+        tasks = [workflow_executor.submit(time.sleep, 0.1)]
+        async for _ in as_completed(tasks, timeout=0.001):
+            pass
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(_main())
+
+
+def test_async_wait(workflow_executor: WorkflowExecutor) -> None:
+    async def _main() -> None:
+        assert await wait([]) == (set(), set())
+
+        fast = workflow_executor.submit(time.sleep, 0)
+        slow = workflow_executor.submit(time.sleep, 0.1)
+        done, not_done = await wait(
+            [fast, slow],
+            return_when='FIRST_COMPLETED',
+        )
+        assert done == {fast}
+        assert not_done == {slow}
+
+        done, not_done = await wait([fast, slow])
+        assert done == {fast, slow}
+        assert len(not_done) == 0
+
+    asyncio.run(_main())
+
+
+def test_async_wait_first_exception(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    async def _main() -> None:
+        failed = workflow_executor.submit(int, 'a')
+        slow = workflow_executor.submit(time.sleep, 0.1)
+        done, not_done = await wait(
+            [failed, slow],
+            return_when='FIRST_EXCEPTION',
+        )
+        assert done == {failed}
+        assert not_done == {slow}
+
+        done, _ = await wait([slow], timeout=0.001)
+        assert len(done) == 0
+
+    asyncio.run(_main())
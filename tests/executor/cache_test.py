@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pathlib
+import threading
+from typing import Callable
+
+from webs.executor.cache import cache_key
+from webs.executor.cache import CacheKeyRef
+from webs.executor.cache import TaskCache
+
+
+def test_cache_key() -> None:
+    key = cache_key(sum, ([1, 2],), {'start': 0})
+    assert key is not None
+    assert key == cache_key(sum, ([1, 2],), {'start': 0})
+    assert key != cache_key(sum, ([1, 3],), {'start': 0})
+    assert key != cache_key(max, ([1, 2],), {'start': 0})
+    assert cache_key(sum, (CacheKeyRef('a'),), {}) != cache_key(
+        sum,
+        (CacheKeyRef('b'),),
+        {},
+    )
+    # Keyword argument order does not change the key.
+    assert cache_key(sum, (), {'a': 1, 'b': 2}) == cache_key(
+        sum,
+        (),
+        {'b': 2, 'a': 1},
+    )
+    # Unpicklable arguments cannot be cached.
+    assert cache_key(sum, (lambda: None,), {}) is None
+
+
+def _make_adder(n: int) -> Callable[[int], int]:
+    def add(x: int) -> int:
+        return x + n  # pragma: no cover
+
+    return add
+
+
+def _make_scaler(n: int) -> Callable[[int], int]:
+    def scale(x: int, factor: int = n) -> int:
+        return x * factor  # pragma: no cover
+
+    return scale
+
+
+def test_cache_key_captured_state() -> None:
+    # Functions from the same factory share a qualified name.
+    assert _make_adder(1).__qualname__ == _make_adder(2).__qualname__
+    key = cache_key(_make_adder(1), (1,), {})
+    assert key is not None
+    assert key == cache_key(_make_adder(1), (1,), {})
+    assert key != cache_key(_make_adder(2), (1,), {})
+    assert cache_key(_make_scaler(1), (1,), {}) != cache_key(
+        _make_scaler(2),
+        (1,),
+        {},
+    )
+    # Unpicklable captured values cannot be cached.
+    lock = threading.Lock()
+    assert cache_key(lambda: lock, (), {}) is None
+
+
+def test_cache_key_unordered_containers() -> None:
+    # Colliding elements are iterated in insertion order.
+    assert list({1, 9}) != list({9, 1})
+    key = cache_key(sum, ([{'a': 1, 'b': {1, 9}}],), {})
+    assert key == cache_key(sum, ([{'b': {9, 1}, 'a': 1}],), {})
+    assert cache_key(sum, ({1, 2},), {}) != cache_key(sum, ((1, 2),), {})
+    assert cache_key(sum, ({1, 2},), {}) != cache_key(
+        sum,
+        (frozenset({1, 2}),),
+        {},
+    )
+
+
+def test_task_cache_memory() -> None:
+    cache = TaskCache(max_memory_items=2)
+    assert cache.get('a') == (False, None)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == (True, 1)
+    # 'b' is the least recently used so is evicted.
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_task_cache_disk(tmp_path: pathlib.Path) -> None:
+    cache = TaskCache(tmp_path, max_memory_items=0)
+    cache.put('a', [1, 2, 3])
+    assert (tmp_path / 'a.pkl').exists()
+    assert cache.get('a') == (True, [1, 2, 3])
+
+    # The on-disk tier persists across cache instances.
+    cache = TaskCache(tmp_path, max_memory_items=0)
+    assert cache.get('a') == (True, [1, 2, 3])
+
+
+def test_task_cache_disk_eviction(tmp_path: pathlib.Path) -> None:
+    cache = TaskCache(tmp_path, max_memory_items=0, max_disk_bytes=100)
+    cache.put('a', b'x' * 60)
+    cache.put('b', b'x' * 60)
+    assert not (tmp_path / 'a.pkl').exists()
+    assert (tmp_path / 'b.pkl').exists()
+    assert 'a' not in cache
+
+    # Results larger than the on-disk tier are not written.
+    cache.put('c', b'x' * 200)
+    assert not (tmp_path / 'c.pkl').exists()
+
+
+def test_task_cache_corrupt_file(tmp_path: pathlib.Path) -> None:
+    (tmp_path / 'a.pkl').write_bytes(b'not a pickle')
+    cache = TaskCache(tmp_path)
+    assert cache.get('a') == (False, None)
+    assert not (tmp_path / 'a.pkl').exists()
+
+
+def test_task_cache_concurrent_put(tmp_path: pathlib.Path) -> None:
+    cache = TaskCache(tmp_path, max_memory_items=0)
+    threads = [
+        threading.Thread(target=cache.put, args=('a', list(range(1000))))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.get('a') == (True, list(range(1000)))
+    assert [path.name for path in tmp_path.iterdir()] == ['a.pkl']
+    assert cache._disk_bytes == (tmp_path / 'a.pkl').stat().st_size
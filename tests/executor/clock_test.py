@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from webs.executor.clock import ClockOffset
+from webs.executor.clock import ClockOffsetEstimator
+
+
+def test_clock_offset_estimator() -> None:
+    estimator = ClockOffsetEstimator()
+    assert estimator.get('host') is None
+
+    # The host clock is 10s ahead. The first task waited 1s in the queue
+    # and 0.2s to be received, so the offset is in [9.8, 11].
+    offset = estimator.update('host', 0, 11, 12, 2.2)
+    assert offset.offset == pytest.approx(10.4)
+    assert offset.error == pytest.approx(0.6)
+
+    # A task with less overhead tightens the bounds to [9.9, 10.1].
+    offset = estimator.update('host', 5, 15.1, 15.5, 5.6)
+    assert offset.offset == pytest.approx(10)
+    assert offset.error == pytest.approx(0.1)
+    assert estimator.get('host') == offset
+
+    # Tasks with more overhead do not loosen the bounds.
+    assert estimator.update('host', 20, 35, 36, 30) == pytest.approx(offset)
+
+    # Other hosts are estimated independently.
+    estimator.update('other', 0, 1, 2, 3)
+    assert estimator.offsets.keys() == {'host', 'other'}
+
+
+def test_clock_offset_estimator_inconsistent() -> None:
+    estimator = ClockOffsetEstimator()
+    estimator.update('host', 0, 10, 10, 0)
+    # The clock of the host was stepped back 5s so the bounds of the new
+    # task do not overlap the previous bounds.
+    offset = estimator.update('host', 1, 6, 6, 1)
+    assert offset == ClockOffset(5, 0)
+
+
+def test_clock_offset_estimator_window() -> None:
+    estimator = ClockOffsetEstimator(window=1)
+    estimator.update('host', 0, 10, 10, 0)
+    assert estimator.update('host', 0, 11, 12, 2) == pytest.approx((10.5, 0.5))
+
+    with pytest.raises(ValueError, match='Window'):
+        ClockOffsetEstimator(window=0)
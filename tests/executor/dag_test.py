@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import re
+import threading
 from concurrent.futures import CancelledError
 from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from typing import Generator
 
 import pytest
 
 from webs.executor.dag import _Task
 from webs.executor.dag import DAGExecutor
+from webs.executor.dag import task_priority
+from webs.executor.dag import TASK_PRIORITY_ATTRIBUTE
 
 
 @pytest.fixture()
@@ -168,3 +172,118 @@ def test_task_future_cancelled(
     assert task.task_future.cancel()
     with pytest.raises(CancelledError):
         client_future.result()
+
+
+def test_task_parent_already_failed(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    client_future: Future[int] = Future()
+    arg_future: Future[list[int]] = Future()
+    arg_future.set_exception(ValueError('test'))
+    task = _Task(thread_executor, sum, (arg_future,), {}, client_future)
+    with pytest.raises(ValueError, match='test'):
+        client_future.result()
+    assert task.task_future is None
+
+
+def test_task_duplicate_arg_future(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    client_future: Future[int] = Future()
+    arg_future: Future[int] = Future()
+    _Task(thread_executor, max, (arg_future, arg_future), {}, client_future)
+    arg_future.set_result(1)
+    assert client_future.result() == 1
+
+
+def test_task_priority_decorator() -> None:
+    @task_priority(3)
+    def _function() -> None:
+        pass
+
+    assert getattr(_function, TASK_PRIORITY_ATTRIBUTE) == 3  # noqa: PLR2004
+
+
+def test_dag_executor_max_running_value_error(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with pytest.raises(ValueError, match='max_running must be >= 1.'):
+        DAGExecutor(thread_executor, max_running=0)
+
+
+def _blocked_executor() -> tuple[DAGExecutor, threading.Event]:
+    # The single running slot is held until the event is set so that all
+    # later tasks are held in the ready queue.
+    executor = DAGExecutor(ThreadPoolExecutor(1), max_running=1)
+    event = threading.Event()
+    executor.submit(event.wait)
+    return executor, event
+
+
+def test_dag_executor_explicit_priority() -> None:
+    order: list[str] = []
+
+    @task_priority(1)
+    def _high(name: str) -> None:
+        order.append(name)
+
+    executor, event = _blocked_executor()
+    with executor:
+        low = executor.submit(order.append, 'low')
+        high = executor.submit(_high, 'high')
+        event.set()
+        low.result()
+        high.result()
+
+    assert order == ['high', 'low']
+
+
+def test_dag_executor_critical_path_priority() -> None:
+    order: list[str] = []
+
+    def _append(name: str, *parents: Any) -> str:
+        order.append(name)
+        return name
+
+    executor, event = _blocked_executor()
+    with executor:
+        leaf = executor.submit(_append, 'leaf')
+        head = executor.submit(_append, 'head')
+        middle = executor.submit(_append, 'middle', head)
+        tail = executor.submit(_append, 'tail', middle)
+        # The head of the chain was ready after the leaf but is on the
+        # critical path so is executed first.
+        event.set()
+        assert tail.result() == 'tail'
+        assert leaf.result() == 'leaf'
+
+    assert order[:2] == ['head', 'middle']
+
+
+def test_dag_executor_priority_exception() -> None:
+    executor, event = _blocked_executor()
+    with executor:
+        failed = executor.submit(sum, 'nan')
+        child = executor.submit(abs, failed)
+        event.set()
+        with pytest.raises(TypeError):
+            child.result()
+        assert executor.submit(abs, -1).result() == 1
+
+
+def test_dag_executor_priority_shutdown_cancel() -> None:
+    executor, event = _blocked_executor()
+    queued = executor.submit(abs, -1)
+    child = executor.submit(abs, queued)
+    event.set()
+    executor.shutdown(cancel_futures=True)
+    assert queued.cancelled() or queued.result() == 1
+    assert child.cancelled() or child.result() == 1
+
+
+def test_dag_executor_priority_shutdown_wait() -> None:
+    executor, event = _blocked_executor()
+    futures = [executor.submit(abs, -i) for i in range(5)]
+    event.set()
+    executor.shutdown(wait=True)
+    assert all(future.done() for future in futures)
@@ -35,6 +35,33 @@ def test_map_function(local_client: Client) -> None:
         assert tuple(results) == (5, 7, 9)
 
 
+def test_submit_many_function(local_client: Client) -> None:
+    with DaskDistributedExecutor(local_client) as executor:
+        # Uniform arguments use Client.map()
+        with mock.patch.object(
+            local_client,
+            'map',
+            wraps=local_client.map,
+        ) as mocked:
+            futures = executor.submit_many(
+                round,
+                [(1.75,), (2.25,)],
+                [{'ndigits': 1}, {'ndigits': 1}],
+            )
+            mocked.assert_called_once()
+        assert [f.result() for f in futures] == [1.8, 2.2]
+
+        # Non-uniform arguments fall back to Client.submit()
+        futures = executor.submit_many(
+            round,
+            [(1.75,), (2.25,)],
+            [{'ndigits': 1}, {}],
+        )
+        assert [f.result() for f in futures] == [1.8, 2]
+
+        assert executor.submit_many(round, [], []) == []
+
+
 @pytest.mark.parametrize(
     'config',
     (
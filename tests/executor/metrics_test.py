@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pathlib
+import time
+import urllib.request
+
+import pytest
+
+from webs.executor.metrics import MetricsFileWriter
+from webs.executor.metrics import MetricsServer
+from webs.executor.metrics import TaskMetrics
+from webs.executor.workflow import _HOSTNAME
+from webs.executor.workflow import _wall_time
+from webs.executor.workflow import ExecutionInfo
+from webs.executor.workflow import TaskInfo
+
+
+def _info(task_seconds: float) -> TaskInfo:
+    now = time.perf_counter_ns()
+    end = now + int(task_seconds * 1e9)
+    execution = ExecutionInfo(
+        _HOSTNAME,
+        _wall_time(now),
+        now,
+        end,
+        now,
+        end,
+        now,
+        now,
+        end,
+        end,
+    )
+    return TaskInfo('id', 'function', [], now, execution=execution)
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+        for line in text.splitlines()
+        if not line.startswith('#')
+    }
+
+
+def test_task_metrics_render() -> None:
+    metrics = TaskMetrics(buckets=(0.1, 1))
+    metrics.record(_info(0.01))
+    metrics.record(_info(0.5))
+    metrics.record(_info(5))
+    metrics.record_failure()
+
+    samples = _samples(metrics.render(submitted=5, in_flight=1))
+    assert samples['webs_tasks_submitted_total'] == 5  # noqa: PLR2004
+    assert samples['webs_tasks_completed_total'] == 3  # noqa: PLR2004
+    assert samples['webs_tasks_failed_total'] == 1
+    assert samples['webs_tasks_in_flight'] == 1
+    assert samples['webs_task_completion_rate'] > 0
+
+    task = 'webs_task_phase_seconds_{}{{phase="task"{}}}'
+    assert samples[task.format('bucket', ',le="0.1"')] == 1
+    assert samples[task.format('bucket', ',le="1"')] == 2  # noqa: PLR2004
+    assert samples[task.format('bucket', ',le="+Inf"')] == 3  # noqa: PLR2004
+    assert samples[task.format('count', '')] == 3  # noqa: PLR2004
+    assert samples[task.format('sum', '')] == pytest.approx(5.51)
+    assert samples['webs_task_phase_seconds_count{phase="queue"}'] == 3  # noqa: PLR2004
+
+
+def test_task_metrics_window() -> None:
+    metrics = TaskMetrics(window=0.05, slots=1)
+    metrics.record(_info(0))
+    time.sleep(0.15)
+
+    # Completions outside the window are only in the totals.
+    samples = _samples(metrics.render(submitted=1, in_flight=0))
+    assert samples['webs_tasks_completed_total'] == 1
+    assert samples['webs_task_completion_rate'] == 0
+    assert samples['webs_task_phase_seconds_count{phase="task"}'] == 0
+
+
+def test_task_metrics_validation() -> None:
+    with pytest.raises(ValueError, match='positive'):
+        TaskMetrics(window=0)
+
+
+def test_metrics_server() -> None:
+    with MetricsServer(lambda: 'metric 1\n') as server:
+        url = f'http://127.0.0.1:{server.port}/metrics'
+        with urllib.request.urlopen(url) as response:
+            assert response.read() == b'metric 1\n'
+
+
+def test_metrics_file_writer(tmp_path: pathlib.Path) -> None:
+    values = iter(range(100))
+    filepath = tmp_path / 'metrics.prom'
+    with MetricsFileWriter(
+        lambda: f'metric {next(values)}\n',
+        filepath,
+        interval=0.01,
+    ) as writer:
+        while not filepath.exists():
+            time.sleep(0.01)
+    writer.close()
+
+    with open(filepath) as f:
+        assert f.read().startswith('metric ')
+    assert list(tmp_path.iterdir()) == [filepath]
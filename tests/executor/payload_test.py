@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pickle
+import threading
+
+from webs.executor.payload import pickled_size
+from webs.executor.payload import total_pickled_size
+
+
+def test_pickled_size() -> None:
+    obj = {'values': list(range(100)), 'name': 'x' * 1000}
+    assert pickled_size(obj) == len(
+        pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+    assert pickled_size(threading.Lock()) is None
+
+
+def test_total_pickled_size() -> None:
+    objs = [b'\0' * 100, 'abc', 1]
+    sizes = [pickled_size(obj) for obj in objs]
+    assert total_pickled_size(objs) == sum(s for s in sizes if s is not None)
+    assert total_pickled_size([]) == 0
+    assert total_pickled_size([1, threading.Lock()]) is None
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import cProfile
+import pathlib
+
+import pytest
+
+from webs.executor.profiling import TaskProfiler
+
+
+def test_task_profiler_sample(tmp_path: pathlib.Path) -> None:
+    profiler = TaskProfiler(tmp_path, functions=['a'])
+    assert profiler.sample('a')
+    assert not profiler.sample('b')
+
+    assert TaskProfiler(tmp_path).sample('b')
+    assert not TaskProfiler(tmp_path, rate=0).sample('b')
+
+    with pytest.raises(ValueError, match='Rate'):
+        TaskProfiler(tmp_path, rate=2)
+
+
+def test_task_profiler_merge(tmp_path: pathlib.Path) -> None:
+    profiler = TaskProfiler(tmp_path)
+    assert profiler.merge() == {}
+
+    for function in (sum, sum, max):
+        profile = cProfile.Profile()
+        profile.runcall(function, [1, 2])
+        profiler.write(profile, function.__name__)
+
+    merged = profiler.merge()
+    assert merged == {
+        'max': tmp_path / 'max.prof',
+        'sum': tmp_path / 'sum.prof',
+    }
+    with open(tmp_path / 'sum.txt') as f:
+        assert f.readline() == 'Merged profiles of 2 tasks\n'
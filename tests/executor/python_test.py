@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
 from webs.executor.dag import DAGExecutor
 from webs.executor.python import ProcessPoolConfig
+from webs.executor.python import RestartingProcessPoolExecutor
 from webs.executor.python import ThreadPoolConfig
 
 
@@ -15,3 +21,13 @@ def test_process_pool_config() -> None:
     config = ProcessPoolConfig(max_threads=1)
     with config.get_executor() as executor:
         assert isinstance(executor, DAGExecutor)
+
+
+def test_restarting_process_pool_executor() -> None:
+    with RestartingProcessPoolExecutor(1) as executor:
+        future = executor.submit(os._exit, 1)
+        with pytest.raises(BrokenProcessPool):
+            future.result()
+
+        assert executor.submit(abs, -1).result() == 1
+        assert executor.restarts == 1
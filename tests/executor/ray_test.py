@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import Future
 
 import pytest
 
+from webs.executor.ray import _object_ref
 from webs.executor.ray import RayConfig
+from webs.executor.workflow import ChainStage
+from webs.executor.workflow import WorkflowExecutor
 
 
 @pytest.mark.skipif(
@@ -24,3 +28,31 @@ def test_ray_executor() -> None:
 
         output = executor.map(abs, [1, -1])
         assert list(output) == [1, 1]
+
+        futures = executor.submit_many(sum, [([1, 2],), ([3],)], [{}, {}])
+        assert [future.result() for future in futures] == [3, 3]
+
+
+def test_object_ref_client_side_future() -> None:
+    future: Future[int] = Future()
+    assert _object_ref(future) is future
+    assert _object_ref(1) == 1
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 12),
+    reason='Ray wheels for Python 3.12 are not available',
+)
+def test_ray_executor_workflow_client_side_futures() -> None:
+    config = RayConfig(ray_address='local', ray_num_cpus=2)
+
+    with WorkflowExecutor(config.get_executor(), fuse_chains=True) as executor:
+        parent = executor.submit(abs, -1)
+        assert executor.submit(abs, parent).result() == 1
+
+        # The stages of fused chains have client-side futures.
+        tasks = executor.chain(ChainStage(sum, [1, 2]), ChainStage(abs))
+        child = executor.submit(sum, [3], start=tasks[1])
+        assert child.result() == 6  # noqa: PLR2004
+        children = executor.submit_many(abs, [(tasks[1],), (parent,)])
+        assert [task.result() for task in children] == [3, 1]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import gc
+import logging
+import uuid
+from concurrent.futures import Future
+
+import pytest
+
+from webs.executor.references import ReferenceTracker
+
+
+class _Owner:
+    pass
+
+
+def _tracker(evicted: list[uuid.UUID]) -> ReferenceTracker:
+    return ReferenceTracker(
+        lambda obj: isinstance(obj, uuid.UUID),
+        evicted.append,
+    )
+
+
+def test_reference_tracker_tasks() -> None:
+    evicted: list[uuid.UUID] = []
+    tracker = _tracker(evicted)
+    identifier = uuid.uuid4()
+
+    first = tracker.acquire([identifier, 1, 'a'])
+    second = tracker.acquire([identifier])
+    assert first.identifiers == (identifier,)
+    assert tracker.count(identifier) == 2  # noqa: PLR2004
+
+    tracker.release(first)
+    assert tracker.count(identifier) == 1
+    assert evicted == []
+
+    future: Future[None] = Future()
+    tracker.release_when_done(future, second)
+    assert evicted == []
+    future.set_result(None)
+    assert evicted == [identifier]
+    assert tracker.evicted == 1
+    assert len(tracker) == 0
+
+
+def test_reference_tracker_hold() -> None:
+    evicted: list[uuid.UUID] = []
+    tracker = _tracker(evicted)
+    identifier = uuid.uuid4()
+
+    owner = _Owner()
+    tracker.hold(owner, 'not an identifier')
+    tracker.hold(owner, identifier)
+    references = tracker.acquire([identifier], parents=[owner])
+    # The owner is kept alive by the references of the pending task.
+    del owner
+    gc.collect()
+    assert tracker.count(identifier) == 2  # noqa: PLR2004
+
+    tracker.release(references)
+    assert tracker.count(identifier) == 1
+    del references
+    gc.collect()
+    assert evicted == [identifier]
+
+
+def test_reference_tracker_evict_error(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    def _evict(identifier: uuid.UUID) -> None:
+        raise RuntimeError()
+
+    tracker = ReferenceTracker(lambda obj: isinstance(obj, uuid.UUID), _evict)
+    references = tracker.acquire([uuid.uuid4()])
+    with caplog.at_level(logging.ERROR):
+        tracker.release(references)
+    assert 'Failed to evict' in caplog.text
+    assert tracker.evicted == 0
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pathlib
+import time
+
+from webs.executor.resources import ResourceSnapshot
+
+
+def test_resource_usage(tmp_path: pathlib.Path) -> None:
+    start = ResourceSnapshot.take()
+    deadline = time.process_time() + 0.05
+    while time.process_time() < deadline:
+        pass
+    with open(tmp_path / 'data', 'wb') as f:
+        f.write(b'\0' * 10000)
+    usage = start.usage(ResourceSnapshot.take())
+
+    assert usage.user_time + usage.system_time > 0
+    assert usage.max_rss_delta >= 0
+    assert usage.voluntary_context_switches >= 0
+    assert usage.involuntary_context_switches >= 0
+    assert usage.write_bytes is None or usage.write_bytes >= 10000  # noqa: PLR2004
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from webs.executor.retry import retry_policy
+from webs.executor.retry import RETRY_POLICY_ATTRIBUTE
+from webs.executor.retry import RetryEngine
+from webs.executor.retry import RetryPolicy
+
+
+class KilledWorker(Exception):  # noqa: N818
+    pass
+
+
+def _raise(exception: BaseException) -> None:
+    raise exception
+
+
+def test_retry_policy_delay() -> None:
+    policy = RetryPolicy(initial_delay=1, backoff_factor=2, max_delay=5)
+    assert [policy.delay(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_retry_policy_is_transient() -> None:
+    policy = RetryPolicy()
+    assert not policy.is_transient(ZeroDivisionError())
+    assert not policy.is_transient(ImportError())
+    assert policy.is_transient(BrokenProcessPool())
+    assert policy.is_transient(ConnectionResetError())
+    # Matched by name without importing Dask.
+    assert policy.is_transient(KilledWorker())
+
+    policy = RetryPolicy(transient=(ValueError,), permanent=(MemoryError,))
+    assert policy.is_transient(ValueError())
+    assert not policy.is_transient(MemoryError())
+
+
+def test_retry_policy_decorator() -> None:
+    policy = RetryPolicy(max_retries=1)
+    default = RetryPolicy()
+
+    @retry_policy(policy)
+    def _function() -> None:
+        pass
+
+    assert getattr(_function, RETRY_POLICY_ATTRIBUTE) is policy
+    assert RetryEngine(default).get_policy(_function) is policy
+    assert RetryEngine(default).get_policy(abs) is default
+    assert RetryEngine().get_policy(abs) is None
+
+
+def test_retry_engine_recovered() -> None:
+    engine = RetryEngine()
+    with ThreadPoolExecutor(1) as pool:
+        future = engine.track(
+            RetryPolicy(initial_delay=0.01),
+            pool.submit(_raise, ConnectionError()),
+            lambda: pool.submit(int, '1'),
+        )
+        assert future.result() == 1
+
+    assert future.retries == 1
+    assert future.first_failure_time is not None
+    assert engine.retries == 1
+    assert engine.recovered == 1
+    mean_time_to_recovery = engine.mean_time_to_recovery
+    assert mean_time_to_recovery is not None
+    assert mean_time_to_recovery > 0
+
+
+def test_retry_engine_permanent() -> None:
+    engine = RetryEngine()
+    with ThreadPoolExecutor(1) as pool:
+        future = engine.track(
+            RetryPolicy(initial_delay=0.01),
+            pool.submit(_raise, ZeroDivisionError()),
+            lambda: pool.submit(int, '1'),
+        )
+        with pytest.raises(ZeroDivisionError):
+            future.result()
+
+    assert future.retries == 0
+    assert engine.retries == 0
+    assert engine.mean_time_to_recovery is None
+
+
+def test_retry_engine_exhausted() -> None:
+    engine = RetryEngine()
+    with ThreadPoolExecutor(1) as pool:
+        future = engine.track(
+            RetryPolicy(max_retries=2, initial_delay=0.01),
+            pool.submit(_raise, ConnectionError()),
+            lambda: pool.submit(_raise, ConnectionError()),
+        )
+        with pytest.raises(ConnectionError):
+            future.result()
+
+    assert future.retries == 2  # noqa: PLR2004
+    assert engine.exhausted == 1
+    assert engine.recovered == 0
+
+
+def test_retry_engine_resubmit_error() -> None:
+    engine = RetryEngine()
+    with ThreadPoolExecutor(1) as pool:
+        future = engine.track(
+            RetryPolicy(initial_delay=0.01),
+            pool.submit(_raise, ConnectionError()),
+            lambda: _raise(RuntimeError('shutdown')),
+        )
+        with pytest.raises(RuntimeError, match='shutdown'):
+            future.result()
+
+
+def test_retry_future_cancel() -> None:
+    engine = RetryEngine()
+    attempt: Future[int] = Future()
+    future = engine.track(RetryPolicy(), attempt, Future)
+    assert future.cancel()
+    assert future.cancelled()
+    assert attempt.cancelled()
+
+    # Cancelled while waiting to be resubmitted.
+    attempt = Future()
+    future = engine.track(RetryPolicy(initial_delay=10), attempt, Future)
+    attempt.set_exception(ConnectionError())
+    assert future.cancel()
+    assert future.cancelled()
+    assert engine.retries == 0
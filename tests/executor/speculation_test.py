@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from webs.executor.speculation import SpeculativeFuture
+from webs.executor.speculation import StragglerMonitor
+
+
+def _fail(delay: float) -> None:
+    time.sleep(delay)
+    raise RuntimeError('failed')
+
+
+def test_straggler_monitor_threshold() -> None:
+    monitor = StragglerMonitor(percentile=50, multiple=2, min_samples=3)
+    assert monitor.threshold('f') is None
+    monitor.record('f', 1)
+    monitor.record('f', 3)
+    assert monitor.threshold('f') is None
+    monitor.record('f', 2)
+    assert monitor.threshold('f') == 4  # noqa: PLR2004
+    assert monitor.threshold('g') is None
+
+
+def test_straggler_monitor_value_error() -> None:
+    with pytest.raises(ValueError, match='percentile'):
+        StragglerMonitor(percentile=0)
+    with pytest.raises(ValueError, match='multiple'):
+        StragglerMonitor(multiple=0.5)
+
+
+def test_straggler_monitor_copy_wins() -> None:
+    monitor = StragglerMonitor(min_samples=1, interval=0.01)
+    monitor.record('f', 0.01)
+    with ThreadPoolExecutor(2) as pool:
+        future = monitor.track(
+            'f',
+            pool.submit(time.sleep, 0.5),
+            lambda: pool.submit(int, '1'),
+        )
+        assert future.result(timeout=0.4) == 1
+    monitor.close()
+
+    assert future.copies == 1
+    assert future.winner == 1
+    assert monitor.launched == 1
+    assert monitor.won == 1
+
+
+def test_straggler_monitor_no_samples() -> None:
+    monitor = StragglerMonitor(interval=0.01)
+    with ThreadPoolExecutor(2) as pool:
+        future = monitor.track(
+            'f',
+            pool.submit(time.sleep, 0.05),
+            lambda: pool.submit(int, '1'),
+        )
+        assert future.result() is None
+    monitor.close()
+
+    assert future.copies == 0
+    assert monitor.launched == 0
+
+
+def test_straggler_monitor_wait_for_success() -> None:
+    monitor = StragglerMonitor(min_samples=1, interval=0.01)
+    monitor.record('f', 0.01)
+    with ThreadPoolExecutor(2) as pool:
+        future = monitor.track(
+            'f',
+            pool.submit(_fail, 0.2),
+            lambda: pool.submit(lambda: time.sleep(0.3) or 1),
+        )
+        # The original fails first but the copy succeeds.
+        assert future.result() == 1
+    monitor.close()
+    assert monitor.won == 1
+
+
+def test_straggler_monitor_all_failed() -> None:
+    monitor = StragglerMonitor()
+    with ThreadPoolExecutor(1) as pool:
+        future = monitor.track('f', pool.submit(_fail, 0), lambda: None)
+        with pytest.raises(RuntimeError, match='failed'):
+            future.result()
+    monitor.close()
+
+
+def test_speculative_future_cancel() -> None:
+    attempt: Future[int] = Future()
+    monitor = StragglerMonitor()
+    future = monitor.track('f', attempt, lambda: None)
+    assert isinstance(future, SpeculativeFuture)
+    assert future.cancel()
+    assert future.cancelled()
+    assert attempt.cancelled()
+    monitor.close()
+
+    running: Future[int] = Future()
+    running.set_running_or_notify_cancel()
+    future = SpeculativeFuture(running)
+    assert not future.cancel()
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
+import gc
+import json
 import pathlib
+import queue
+import threading
 import time
 import uuid
 from concurrent.futures import Future
 from concurrent.futures import ThreadPoolExecutor
+from typing import Generator
+
+import pytest
+from dask.distributed import Future as DaskFuture
 
 from testing.record import SimpleRecordLogger
 from webs.data.file import PickleFileTransformer
+from webs.data.filter import ObjectTypeFilter
 from webs.data.null import NullTransformer
 from webs.data.transform import TaskDataTransformer
+from webs.executor.cache import TaskCache
+from webs.executor.clock import ClockOffset
+from webs.executor.clock import ClockOffsetEstimator
 from webs.executor.dag import DAGExecutor
+from webs.executor.dag import task_priority
+from webs.executor.dag import TASK_PRIORITY_ATTRIBUTE
 from webs.executor.dask import DaskDistributedExecutor
+from webs.executor.metrics import TaskMetrics
+from webs.executor.profiling import TaskProfiler
+from webs.executor.retry import retry_policy
+from webs.executor.retry import RetryEngine
+from webs.executor.retry import RetryFuture
+from webs.executor.retry import RetryPolicy
+from webs.executor.speculation import SpeculativeFuture
+from webs.executor.speculation import StragglerMonitor
+from webs.executor.workflow import _TaskChainWrapper
+from webs.executor.workflow import _TaskChunkWrapper
 from webs.executor.workflow import _TaskResult
 from webs.executor.workflow import _TaskWrapper
+from webs.executor.workflow import _uuid4_batch
 from webs.executor.workflow import as_completed
+from webs.executor.workflow import ChainStage
+from webs.executor.workflow import CompletionQueue
+from webs.executor.workflow import ExecutionInfo
+from webs.executor.workflow import PREVIOUS
 from webs.executor.workflow import TaskFuture
 from webs.executor.workflow import TaskInfo
 from webs.executor.workflow import wait
@@ -33,6 +62,99 @@ def test_task_wrapper_call() -> None:
     assert task([1, 2, 3], start=-6).result == 0
 
 
+def test_task_wrapper_resources() -> None:
+    transformer = TaskDataTransformer(NullTransformer())
+    task = _TaskWrapper(sum, data_transformer=transformer)
+    info = task([1, 2]).info
+    assert info.resources is None
+    assert 'resources' not in info.to_record()
+
+    task = _TaskWrapper(
+        sum,
+        data_transformer=transformer,
+        capture_resources=True,
+    )
+    info = task([1, 2]).info
+    assert info.resources is not None
+    assert info.to_record()['resources'] == info.resources._asdict()
+
+
+def test_task_wrapper_payload(tmp_path: pathlib.Path) -> None:
+    transformer = TaskDataTransformer(NullTransformer())
+    task = _TaskWrapper(sum, data_transformer=transformer)
+    info = task([1, 2]).info
+    assert info.payload is None
+    assert 'payload' not in info.to_record()
+
+    task = _TaskWrapper(
+        sum,
+        data_transformer=transformer,
+        capture_payload=True,
+    )
+    info = task([1, 2]).info
+    assert info.payload is not None
+    assert info.payload.args_bytes is not None
+    assert info.payload.args_bytes > 0
+    assert info.payload.args_transformed_bytes == 0
+    assert info.payload.result_bytes is not None
+    assert info.payload.result_bytes > 0
+    assert info.payload.result_transformed_bytes == 0
+    assert info.to_record()['payload'] == info.payload._asdict()
+
+    transformer = TaskDataTransformer(PickleFileTransformer(tmp_path))
+    task = _TaskWrapper(
+        lambda x: x * 2,
+        data_transformer=transformer,
+        capture_payload=True,
+    )
+    data = b'\0' * 10000
+    result = task(transformer.transform(data))
+    payload = result.info.payload
+    assert payload is not None
+    # The identifiers passed inline are much smaller than the data moved
+    # out-of-band.
+    assert payload.args_transformed_bytes is not None
+    assert payload.args_transformed_bytes > len(data)
+    assert payload.args_bytes is not None
+    assert payload.args_bytes < len(data)
+    assert payload.result_transformed_bytes is not None
+    assert payload.result_transformed_bytes > 2 * len(data)
+    assert payload.result_bytes is not None
+    assert payload.result_bytes < len(data)
+
+
+def test_task_wrapper_priority() -> None:
+    @task_priority(2)
+    def _high(x: int) -> int:
+        return x
+
+    @task_priority(1)
+    def _low(x: int) -> int:
+        return x
+
+    transformer = TaskDataTransformer(NullTransformer())
+    high = _TaskWrapper(_high, data_transformer=transformer)
+    low = _TaskWrapper(_low, data_transformer=transformer)
+    none = _TaskWrapper(max, data_transformer=transformer)
+    assert getattr(high, TASK_PRIORITY_ATTRIBUTE) == 2  # noqa: PLR2004
+    assert not hasattr(none, TASK_PRIORITY_ATTRIBUTE)
+
+    chunk = _TaskChunkWrapper(high, arity=1)
+    assert getattr(chunk, TASK_PRIORITY_ATTRIBUTE) == 2  # noqa: PLR2004
+    chain = _TaskChainWrapper([none, low], [((0,), {}), ((None,), {})])
+    assert getattr(chain, TASK_PRIORITY_ATTRIBUTE) == 1
+
+
+def test_uuid4_batch() -> None:
+    ids = _uuid4_batch(100)
+    assert len(set(ids)) == len(ids)
+    for task_id in ids:
+        parsed = uuid.UUID(task_id)
+        assert parsed.version == 4  # noqa: PLR2004
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == task_id
+
+
 def test_workflow_executor_submit(workflow_executor: WorkflowExecutor) -> None:
     task = workflow_executor.submit(sum, [1, 2, 3], start=-6)
     assert isinstance(task, TaskFuture)
@@ -41,12 +163,323 @@ def test_workflow_executor_submit(workflow_executor: WorkflowExecutor) -> None:
     assert workflow_executor.tasks_executed == 1
 
 
+def test_workflow_executor_submit_many(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    tasks = workflow_executor.submit_many(
+        sum,
+        [([1, 2, 3],), ([4, 5],), ([],)],
+        [{'start': -6}, {}, {'start': 1}],
+    )
+    assert all(isinstance(task, TaskFuture) for task in tasks)
+    assert [task.result() for task in tasks] == [0, 9, 1]
+    assert len({task.info.task_id for task in tasks}) == len(tasks)
+    assert workflow_executor.tasks_executed == len(tasks)
+
+    child = workflow_executor.submit_many(sum, [([1],)], [{'start': tasks[1]}])
+    assert child[0].result() == 10  # noqa: PLR2004
+    assert child[0].info.parent_task_ids == [tasks[1].info.task_id]
+
+    assert workflow_executor.submit_many(sum, []) == []
+
+
+def test_workflow_executor_submit_many_length_mismatch(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    with pytest.raises(ValueError, match='2 argument tuples but 1'):
+        workflow_executor.submit_many(sum, [([1],), ([2],)], [{}])
+
+
+@pytest.mark.parametrize('fuse_chains', (True, False))
+def test_workflow_executor_chain(
+    fuse_chains: bool,
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with SimpleRecordLogger() as logger:
+        with WorkflowExecutor(
+            DAGExecutor(thread_executor),
+            record_logger=logger,
+            fuse_chains=fuse_chains,
+        ) as executor:
+            parent = executor.submit(sum, [1, 2])
+            tasks = executor.chain(
+                ChainStage(sum, [1, 2, 3], start=parent),
+                ChainStage(abs),
+                ChainStage(max, -1, PREVIOUS),
+                ChainStage(pow, 2, exp=PREVIOUS),
+            )
+            assert [task.result() for task in tasks] == [9, 9, 9, 512]
+
+            parents = [task.info.parent_task_ids for task in tasks]
+            assert parents[0] == [parent.info.task_id]
+            for task, task_parents in zip(tasks, parents[1:]):
+                assert task_parents == [task.info.task_id]
+
+            assert executor.chain() == []
+            assert executor.tasks_executed == 1 + len(tasks)
+
+    assert len(logger.records) == 1 + len(tasks)
+
+
+@pytest.mark.parametrize('fuse_chains', (True, False))
+def test_workflow_executor_chain_exception(
+    fuse_chains: bool,
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    def _fail(x: int) -> int:
+        # Sleep so the whole chain is submitted before the failure.
+        time.sleep(0.01)
+        raise RuntimeError(x)
+
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        fuse_chains=fuse_chains,
+    ) as executor:
+        tasks = executor.chain(
+            ChainStage(abs, -1),
+            ChainStage(_fail),
+            ChainStage(abs),
+        )
+        assert tasks[0].result() == 1
+        for task in tasks[1:]:
+            with pytest.raises(RuntimeError, match='1'):
+                task.result()
+
+        with pytest.raises(ValueError, match='cannot reference PREVIOUS'):
+            executor.chain(ChainStage(abs, PREVIOUS))
+
+
 def test_workflow_executor_map(workflow_executor: WorkflowExecutor) -> None:
     x = [1, -1]
     assert list(workflow_executor.map(abs, x)) == [abs(v) for v in x]
     assert workflow_executor.tasks_executed == len(x)
 
 
+@pytest.mark.parametrize('chunksize', (2, 3, 10))
+def test_workflow_executor_map_chunksize(
+    chunksize: int,
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    values = list(range(-5, 5))
+    with SimpleRecordLogger() as logger:
+        with WorkflowExecutor(
+            DAGExecutor(thread_executor),
+            record_logger=logger,
+        ) as executor:
+            results = executor.map(abs, values, chunksize=chunksize)
+            assert list(results) == [abs(v) for v in values]
+            assert executor.tasks_executed == len(values)
+
+        assert len(logger.records) == len(values)
+        for record in logger.records:
+            execution = record['execution']
+            assert execution['task_start_time'] <= execution['task_end_time']
+
+
+def test_workflow_executor_map_chunksize_exception(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    results = workflow_executor.map(abs, [1, 'a', -1], chunksize=3)
+    assert next(results) == 1
+    with pytest.raises(TypeError, match='bad operand type'):
+        next(results)
+
+
+def test_workflow_executor_map_chunksize_value_error(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    with pytest.raises(ValueError, match='chunksize must be >= 1.'):
+        workflow_executor.map(abs, [], chunksize=0)
+
+
+@pytest.mark.parametrize('ordered', (True, False))
+def test_workflow_executor_imap(
+    ordered: bool,
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    max_in_flight = 3
+    consumed = 0
+
+    def _values() -> Generator[int, None, None]:
+        nonlocal consumed
+        for value in range(-10, 10):
+            consumed += 1
+            yield value
+
+    results = workflow_executor.imap(
+        abs,
+        _values(),
+        max_in_flight=max_in_flight,
+        ordered=ordered,
+        timeout=5,
+    )
+    # Only the first window of tasks is submitted before iterating.
+    assert consumed == max_in_flight
+    assert workflow_executor.tasks_executed == max_in_flight
+
+    expected = [abs(v) for v in range(-10, 10)]
+    if ordered:
+        assert list(results) == expected
+    else:
+        assert sorted(results) == sorted(expected)
+    assert workflow_executor.tasks_executed == len(expected)
+
+
+@pytest.mark.parametrize('ordered', (True, False))
+def test_workflow_executor_imap_max_in_flight(ordered: bool) -> None:
+    max_in_flight = 3
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _task(x: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return x
+
+    with WorkflowExecutor(DAGExecutor(ThreadPoolExecutor(8))) as executor:
+        results = executor.imap(
+            _task,
+            range(30),
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+        )
+        assert sorted(results) == list(range(30))
+
+    assert peak == max_in_flight
+
+
+def _double(x: int) -> int:
+    return 2 * x
+
+
+def test_workflow_executor_cache(thread_executor: ThreadPoolExecutor) -> None:
+    record_logger = SimpleRecordLogger()
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        record_logger=record_logger,
+        cache=TaskCache(),
+    ) as executor:
+        first = executor.submit(_double, 1)
+        first_child = executor.submit(_double, first)
+        assert first_child.result() == 4  # noqa: PLR2004
+        # Results are cached by a done callback which can run after result()
+        # returns in the client.
+        while len(executor.cache) < 2:  # noqa: PLR2004
+            time.sleep(0.001)
+
+        second = executor.submit(_double, 1)
+        assert second.done()
+        assert second.info.cache_hit
+        # The key of the child depends on the key of the parent.
+        second_child = executor.submit(_double, second)
+        assert second_child.info.cache_hit
+        assert second_child.result() == 4  # noqa: PLR2004
+        # Children of cache hits are executed with the cached result.
+        third = executor.submit(_double, second_child)
+        assert third.result() == 8  # noqa: PLR2004
+        assert not third.info.cache_hit
+
+        assert list(executor.map(_double, [1, 2], chunksize=2)) == [2, 4]
+
+    # Cache hits are not executed.
+    assert executor.tasks_executed == 4  # noqa: PLR2004
+    assert executor.cache is not None
+    assert executor.cache.hits == 3  # noqa: PLR2004
+    assert executor.cache.misses == 4  # noqa: PLR2004
+    assert sum(r['cache_hit'] for r in record_logger.records) == 3  # noqa: PLR2004
+
+
+def test_workflow_executor_cache_transformed_result(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    transformer = TaskDataTransformer(
+        PickleFileTransformer(tmp_path),
+        ObjectTypeFilter(list),
+    )
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        data_transformer=transformer,
+        cache=TaskCache(),
+    ) as executor:
+        task = executor.submit(list, range(3))
+        # Transformed results are not resolved by the done callback.
+        task.exception()
+        thread_executor.shutdown(wait=True)
+        assert executor.cache is not None
+        assert len(executor.cache) == 0
+
+        # The resolved result is cached once retrieved by the client.
+        assert task.result() == [0, 1, 2]
+        assert executor.cache.get(task._cache_key) == (True, [0, 1, 2])
+
+
+def test_task_future_add_done_callback(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    called: Future[TaskFuture[int]] = Future()
+    task = workflow_executor.submit(sum, [1, 2, 3])
+    task.add_done_callback(called.set_result)
+    assert called.result(timeout=5) is task
+    assert task.result() == 6  # noqa: PLR2004
+
+
+def test_completion_queue(workflow_executor: WorkflowExecutor) -> None:
+    completion_queue = CompletionQueue(
+        workflow_executor.submit(time.sleep, delay) for delay in (0.1, 0)
+    )
+    assert len(completion_queue) == 2  # noqa: PLR2004
+
+    first = completion_queue.get(timeout=5)
+    assert first.info.function_name == 'sleep'
+    completion_queue.add(workflow_executor.submit(abs, -1))
+    assert len(completion_queue) == 2  # noqa: PLR2004
+
+    results = [completion_queue.get(timeout=5).result() for _ in range(2)]
+    assert sorted(results, key=str) == sorted([None, 1], key=str)
+    assert len(completion_queue) == 0
+
+    with pytest.raises(queue.Empty):
+        completion_queue.get()
+    with pytest.raises(queue.Empty):
+        completion_queue.get_nowait()
+
+
+def test_completion_queue_timeout(workflow_executor: WorkflowExecutor) -> None:
+    task = workflow_executor.submit(time.sleep, 1)
+    completion_queue = CompletionQueue([task])
+    with pytest.raises(queue.Empty):
+        completion_queue.get(timeout=0.001)
+    assert len(completion_queue) == 1
+
+
+def test_workflow_executor_imap_timeout(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    results = workflow_executor.imap(
+        time.sleep,
+        [0.1],
+        max_in_flight=1,
+        ordered=False,
+        timeout=0.001,
+    )
+    with pytest.raises(TimeoutError):
+        next(results)
+
+
+def test_workflow_executor_imap_value_error(
+    workflow_executor: WorkflowExecutor,
+) -> None:
+    with pytest.raises(ValueError, match='max_in_flight must be >= 1.'):
+        workflow_executor.imap(abs, [], max_in_flight=0)
+
+
 def test_workflow_executor_dask(
     dask_executor: DaskDistributedExecutor,
 ) -> None:
@@ -56,6 +489,241 @@ def test_workflow_executor_dask(
 
         assert list(executor.map(abs, [1, -1])) == [1, 1]
 
+        tasks = executor.submit_many(sum, [([1, 2],), ([3],)])
+        assert [task.result() for task in tasks] == [3, 3]
+
+        assert list(executor.map(abs, [1, -1, -2], chunksize=2)) == [1, 1, 2]
+
+        executor.fuse_chains = True
+        parent = executor.submit(abs, -1)
+        tasks = executor.chain(ChainStage(sum, [1], parent), ChainStage(abs))
+        assert [task.result() for task in tasks] == [2, 2]
+
+
+def test_workflow_executor_dask_fused_chain_child(
+    dask_executor: DaskDistributedExecutor,
+) -> None:
+    with WorkflowExecutor(dask_executor, fuse_chains=True) as executor:
+        tasks = executor.chain(ChainStage(sum, [1, 2]), ChainStage(abs))
+        child = executor.submit(sum, [3], start=tasks[1])
+        assert child.result() == 6  # noqa: PLR2004
+        assert isinstance(child._future, Future)
+
+        children = executor.submit_many(abs, [(tasks[1],), (-1,)])
+        assert [task.result() for task in children] == [3, 1]
+
+
+def test_workflow_executor_dask_client_dependencies(
+    dask_executor: DaskDistributedExecutor,
+) -> None:
+    with WorkflowExecutor(
+        dask_executor,
+        native_dependencies=False,
+    ) as executor:
+        parent = executor.submit(sum, [1, 2])
+        child = executor.submit(sum, [parent.result()], start=parent)
+        assert child.result() == 6  # noqa: PLR2004
+        assert isinstance(child._future, Future)
+
+        tasks = executor.submit_many(abs, [(parent,), (-1,)])
+        assert [task.result() for task in tasks] == [3, 1]
+
+        assert list(executor.map(abs, [parent, -1], chunksize=2)) == [3, 1]
+
+        executor.fuse_chains = True
+        tasks = executor.chain(ChainStage(sum, [1], parent), ChainStage(abs))
+        assert [task.result() for task in tasks] == [4, 4]
+
+
+def test_workflow_executor_speculation(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    calls: list[str] = []
+
+    def _task(x: str) -> str:
+        calls.append(x)
+        if calls.count(x) == 1 and x == 'slow':
+            time.sleep(1)
+        return x
+
+    monitor = StragglerMonitor(min_samples=1, interval=0.01)
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        straggler_monitor=monitor,
+    ) as executor:
+        assert executor.submit(_task, 'fast').result() == 'fast'
+        # Wait for the execution time to be recorded by the done callback.
+        while monitor.threshold('_task') is None:
+            time.sleep(0.01)
+
+        start = time.perf_counter()
+        task = executor.submit(_task, 'slow')
+        child = executor.submit(_task, task)
+        assert child.result() == 'slow'
+        assert time.perf_counter() - start < 1
+
+    assert task.info.speculative_copies == 1
+    assert monitor.launched == 1
+    assert monitor.won == 1
+
+
+def test_workflow_executor_speculation_dask(
+    dask_executor: DaskDistributedExecutor,
+) -> None:
+    with WorkflowExecutor(
+        dask_executor,
+        straggler_monitor=StragglerMonitor(),
+    ) as executor:
+        parent = executor.submit(sum, [1, 2])
+        child = executor.submit(abs, parent)
+        assert isinstance(child._future, SpeculativeFuture)
+        assert child.result() == 3  # noqa: PLR2004
+
+        tasks = executor.submit_many(abs, [(parent,), (-1,)])
+        assert [task.result() for task in tasks] == [3, 1]
+
+
+def test_workflow_executor_retry(thread_executor: ThreadPoolExecutor) -> None:
+    calls: list[str] = []
+
+    @retry_policy(RetryPolicy(initial_delay=0.01))
+    def _flaky(x: int) -> int:
+        calls.append('flaky')
+        if calls.count('flaky') == 1:
+            raise ConnectionError()
+        return x
+
+    def _child(x: int) -> int:
+        calls.append('child')
+        return x
+
+    engine = RetryEngine()
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        retry_engine=engine,
+    ) as executor:
+        task = executor.submit(_flaky, 1)
+        child = executor.submit(_child, task)
+        assert child.result() == 1
+        assert isinstance(task._future, RetryFuture)
+
+        # Functions without a policy are not retried.
+        with pytest.raises(ZeroDivisionError):
+            executor.submit(divmod, 1, 0).result()
+
+    # Only the failed task was resubmitted.
+    assert calls == ['flaky', 'flaky', 'child']
+    assert task.info.retries == 1
+    assert task.info.first_failure_time is not None
+    assert engine.recovered == 1
+
+
+def test_workflow_executor_retry_dask(
+    dask_executor: DaskDistributedExecutor,
+) -> None:
+    engine = RetryEngine(RetryPolicy(initial_delay=0.01))
+    with WorkflowExecutor(dask_executor, retry_engine=engine) as executor:
+        parent = executor.submit(sum, [1, 2])
+        tasks = executor.submit_many(abs, [(parent,), (-1,)])
+        assert [task.result() for task in tasks] == [3, 1]
+        assert all(isinstance(task._future, RetryFuture) for task in tasks)
+
+
+def test_workflow_executor_metrics(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with pytest.raises(RuntimeError, match='without metrics'):
+        WorkflowExecutor(thread_executor).metrics_text()
+
+    with WorkflowExecutor(
+        thread_executor,
+        metrics=TaskMetrics(),
+    ) as executor:
+        executor.submit(abs, -1).result()
+        with pytest.raises(ZeroDivisionError):
+            executor.submit(divmod, 1, 0).result()
+        text = executor.metrics_text()
+
+    assert 'webs_tasks_submitted_total 2\n' in text
+    assert 'webs_tasks_completed_total 1\n' in text
+    assert 'webs_tasks_failed_total 1\n' in text
+    assert 'webs_tasks_in_flight 0\n' in text
+
+
+def test_workflow_executor_capture_resources(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with WorkflowExecutor(
+        thread_executor,
+        capture_resources=True,
+    ) as executor:
+        task = executor.submit(sum, [1, 2])
+        chunks = list(executor.map(abs, [-1, -2], chunksize=2))
+        assert task.result() == 3  # noqa: PLR2004
+        assert chunks == [1, 2]
+
+    assert task.info.execution is not None
+    assert task.info.execution.resources is not None
+
+
+def test_workflow_executor_capture_payload(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with WorkflowExecutor(
+        thread_executor,
+        capture_payload=True,
+    ) as executor:
+        task = executor.submit(sum, [1, 2])
+        chunks = list(executor.map(abs, [-1, -2], chunksize=2))
+        assert task.result() == 3  # noqa: PLR2004
+        assert chunks == [1, 2]
+
+    assert task.info.execution is not None
+    assert task.info.execution.payload is not None
+
+
+def test_workflow_executor_profiler(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    profiler = TaskProfiler(tmp_path, functions=['sum'])
+    with WorkflowExecutor(thread_executor, profiler=profiler) as executor:
+        tasks = [executor.submit(sum, [1, 2]) for _ in range(3)]
+        assert list(executor.map(abs, [-1, -2])) == [1, 2]
+        assert [task.result() for task in tasks] == [3, 3, 3]
+
+    assert len(list((tmp_path / 'tasks' / 'sum').iterdir())) == len(tasks)
+    assert (tmp_path / 'sum.prof').is_file()
+    assert not (tmp_path / 'abs.prof').exists()
+
+
+def test_workflow_executor_clock_estimator(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    estimator = ClockOffsetEstimator()
+    with SimpleRecordLogger() as logger:
+        with WorkflowExecutor(
+            thread_executor,
+            record_logger=logger,
+            clock_estimator=estimator,
+        ) as executor:
+            executor.submit(sum, [1, 2]).result()
+
+    # The worker shares the clock of the client.
+    ((_, offset),) = estimator.offsets.items()
+    assert abs(offset.offset) <= offset.error
+    (record,) = logger.records
+    execution = record['execution']
+    assert execution['clock_offset'] == offset.offset
+    assert (
+        record['submit_time']
+        <= execution['execution_start_time'] + offset.error
+    )
+    assert (
+        execution['execution_end_time']
+        <= record['received_time'] + offset.error
+    )
+
 
 def test_workflow_executor_map_timeout(
     workflow_executor: WorkflowExecutor,
@@ -76,6 +744,101 @@ def test_workflow_executor_data_transformer(
         assert task.result() == 0
 
 
+def test_workflow_executor_evict_unreferenced(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    transformer = TaskDataTransformer(
+        PickleFileTransformer(tmp_path),
+        ObjectTypeFilter(list, int),
+    )
+    executor = WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        data_transformer=transformer,
+        evict_unreferenced=True,
+    )
+    assert executor.references is not None
+
+    parent = executor.submit(sum, [1, 2, 3])
+    child = executor.submit(abs, parent)
+    batch = executor.submit_many(abs, [(parent,), (-1,)])
+    chunks = executor._submit_chunks(abs, [[parent, -2]], chunksize=2)
+    chain = executor.chain(ChainStage(abs, parent), ChainStage(abs, PREVIOUS))
+    tasks = [child, *batch, *chunks, *chain]
+    assert [task.result() for task in tasks] == [6, 6, 1, 6, 2, 6, 6]
+    assert parent.result() == 6  # noqa: PLR2004
+    # Wait for the compute executor to run all done callbacks.
+    thread_executor.shutdown(wait=True)
+
+    # Only the results of the live task futures are still stored.
+    assert len(executor.references) == len(tasks) + 1
+    assert len(list(tmp_path.iterdir())) == len(tasks) + 1
+
+    del parent, child, batch, chunks, chain, tasks
+    gc.collect()
+    assert len(executor.references) == 0
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_workflow_executor_evict_on_resolve_cache(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    transformer = TaskDataTransformer(
+        PickleFileTransformer(tmp_path),
+        ObjectTypeFilter(list),
+        evict_on_resolve=True,
+    )
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        data_transformer=transformer,
+        cache=TaskCache(),
+    ) as executor:
+        task = executor.submit(list, range(3))
+        assert task.result() == [0, 1, 2]
+        assert len(list(tmp_path.iterdir())) == 0
+
+        hit = executor.submit(list, range(3))
+        assert hit.info.cache_hit
+        assert hit.result() == [0, 1, 2]
+
+
+def test_workflow_executor_evict_on_resolve_attempts(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    transformer = TaskDataTransformer(
+        PickleFileTransformer(tmp_path),
+        evict_on_resolve=True,
+    )
+    with pytest.raises(ValueError, match='speculation and retries'):
+        WorkflowExecutor(
+            thread_executor,
+            data_transformer=transformer,
+            straggler_monitor=StragglerMonitor(),
+        )
+    with pytest.raises(ValueError, match='speculation and retries'):
+        WorkflowExecutor(
+            thread_executor,
+            data_transformer=transformer,
+            retry_engine=RetryEngine(RetryPolicy()),
+        )
+
+    @retry_policy(RetryPolicy())
+    def _task(x: int) -> int:
+        return x  # pragma: no cover
+
+    with WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        data_transformer=transformer,
+    ) as executor:
+        with pytest.raises(ValueError, match='retry policy'):
+            executor.submit(_task, 1)
+        with pytest.raises(ValueError, match='retry policy'):
+            executor.submit_many(_task, [(1,)])
+        assert executor.submit(abs, -1).result() == 1
+
+
 def test_workflow_executor_record_logging(
     thread_executor: ThreadPoolExecutor,
     tmp_path: pathlib.Path,
@@ -111,6 +874,64 @@ def test_as_completed_dask(dask_executor: DaskDistributedExecutor) -> None:
         assert completed_results == set(range(1, 6))
 
 
+def test_as_completed_dask_mixed_futures(
+    dask_executor: DaskDistributedExecutor,
+) -> None:
+    with WorkflowExecutor(dask_executor, fuse_chains=True) as executor:
+        chain = executor.chain(ChainStage(sum, [1, 2]), ChainStage(abs))
+        tasks = [*chain, executor.submit(sum, [1, 1])]
+        assert isinstance(chain[0]._future, Future)
+        assert isinstance(tasks[-1]._future, DaskFuture)
+        completed = list(as_completed(tasks))
+        assert {task.result() for task in completed} == {2, 3}
+        assert len(completed) == len(tasks)
+
+
+def test_task_info_to_record() -> None:
+    start = time.perf_counter_ns()
+    execution = ExecutionInfo(
+        'host',
+        time.time(),
+        *(start + i * 10**9 for i in range(8)),
+    )
+    info = TaskInfo(
+        'id',
+        'function',
+        ['parent'],
+        start,
+        received_ns=start + 10**9,
+        execution=execution,
+    )
+    assert not hasattr(info, '__dict__')
+
+    record = info.to_record()
+    json.dumps(record)
+    assert list(record) == [
+        'task_id',
+        'function_name',
+        'parent_task_ids',
+        'submit_time',
+        'received_time',
+        'execution',
+        'cache_hit',
+        'speculative_copies',
+        'retries',
+        'first_failure_time',
+    ]
+    received_time = record['received_time'] - record['submit_time']
+    assert received_time == pytest.approx(1, abs=1e-6)
+    times = list(record['execution'].values())[1:]
+    assert times[0] == execution.wall_time
+    assert times[1] == pytest.approx(execution.wall_time + 1, abs=1e-6)
+    assert execution.duration == 1
+
+    info.clock_offset = ClockOffset(2, 0.5)
+    corrected = info.to_record()['execution']
+    assert corrected['execution_start_time'] == execution.wall_time - 2
+    assert corrected['clock_offset'] == 2  # noqa: PLR2004
+    assert corrected['clock_offset_error'] == 0.5  # noqa: PLR2004
+
+
 def test_task_future_exception() -> None:
     future: Future[_TaskResult[int]] = Future()
 
@@ -159,3 +980,16 @@ def test_wait_dask(dask_executor: DaskDistributedExecutor) -> None:
         assert len(not_completed) == 0
         results = {task.result() for task in completed}
         assert results == set(range(1, 6))
+
+
+def test_wait_dask_mixed_futures(
+    dask_executor: DaskDistributedExecutor,
+) -> None:
+    with WorkflowExecutor(dask_executor, fuse_chains=True) as executor:
+        tasks = [
+            executor.submit(sum, [1, 1]),
+            *executor.chain(ChainStage(sum, [1, 2]), ChainStage(abs)),
+        ]
+        completed, not_completed = wait(tasks)
+        assert completed == set(tasks)
+        assert len(not_completed) == 0
@@ -3,7 +3,11 @@ from __future__ import annotations
 import json
 import pathlib
 
+import pytest
+
+from webs.record import AsyncJSONRecordLogger
 from webs.record import JSONRecordLogger
+from webs.record import MultiRecordLogger
 from webs.record import NullRecordLogger
 
 
@@ -23,6 +27,48 @@ def test_json_record_logger(tmp_path: pathlib.Path) -> None:
     assert json.loads(line_b) == dict_b
 
 
+def test_async_json_record_logger(tmp_path: pathlib.Path) -> None:
+    records = [{'index': i, 'values': [i, str(i)]} for i in range(1000)]
+
+    logfile = tmp_path / 'log.json'
+    with AsyncJSONRecordLogger(
+        logfile,
+        flush_interval=0.01,
+        batch_size=16,
+        max_queue_size=8,
+    ) as logger:
+        for record in records:
+            logger.log(record)
+
+    with open(logfile) as f:
+        assert [json.loads(line) for line in f] == records
+
+    with pytest.raises(RuntimeError, match='closed'):
+        logger.log({})
+    logger.close()
+
+
+def test_async_json_record_logger_bad_record(tmp_path: pathlib.Path) -> None:
+    logfile = tmp_path / 'log.json'
+    with AsyncJSONRecordLogger(logfile) as logger:
+        logger.log({'a': 1})
+        logger.log({'b': object()})
+        logger.log({'c': 3})
+
+    with open(logfile) as f:
+        assert [json.loads(line) for line in f] == [{'a': 1}, {'c': 3}]
+
+
 def test_null_record_logger() -> None:
     with NullRecordLogger() as logger:
         logger.log({})
+
+
+def test_multi_record_logger(tmp_path: pathlib.Path) -> None:
+    paths = [tmp_path / 'a.json', tmp_path / 'b.json']
+    with MultiRecordLogger(*map(JSONRecordLogger, paths)) as logger:
+        logger.log({'a': 1})
+
+    for path in paths:
+        with open(path) as f:
+            assert json.load(f) == {'a': 1}
@@ -1,9 +1,61 @@
 from __future__ import annotations
 
+import pathlib
+
+import pytest
+from pydantic import ValidationError
+
+from webs.columnar import ColumnarRecordLogger
+from webs.record import AsyncJSONRecordLogger
+from webs.record import JSONRecordLogger
+from webs.record import MultiRecordLogger
 from webs.run.config import BenchmarkConfig
+from webs.run.config import RunConfig
 
 
 def test_benchmark_config_paths(
     test_benchmark_config: BenchmarkConfig,
 ) -> None:
     test_benchmark_config.get_run_dir().exists()
+
+
+def test_run_config_get_record_logger(tmp_path: pathlib.Path) -> None:
+    filepath = str(tmp_path / 'tasks.json')
+    config = RunConfig(task_record_file_name=filepath)
+    with config.get_record_logger() as logger:
+        assert isinstance(logger, JSONRecordLogger)
+
+    config = RunConfig(
+        task_record_file_name=filepath,
+        task_record_logger='json-async',
+    )
+    with config.get_record_logger() as logger:
+        assert isinstance(logger, AsyncJSONRecordLogger)
+
+    config = RunConfig(
+        task_record_file_name=filepath,
+        task_record_logger='columnar',
+    )
+    with config.get_record_logger() as logger:
+        assert isinstance(logger, ColumnarRecordLogger)
+    assert (tmp_path / 'tasks').is_dir()
+
+    config = RunConfig(
+        task_record_file_name=filepath,
+        task_trace_file_name=str(tmp_path / 'trace.json'),
+    )
+    with config.get_record_logger() as logger:
+        assert isinstance(logger, MultiRecordLogger)
+    assert (tmp_path / 'trace.json').is_file()
+
+
+def test_run_config_transform_eviction() -> None:
+    RunConfig(transform_eviction='resolve')
+    RunConfig(transform_eviction='unreferenced', transform_dedup=True)
+
+    with pytest.raises(ValidationError, match='transform_dedup'):
+        RunConfig(transform_eviction='resolve', transform_dedup=True)
+    with pytest.raises(ValidationError, match='speculation and retries'):
+        RunConfig(transform_eviction='resolve', speculation=True)
+    with pytest.raises(ValidationError, match='speculation and retries'):
+        RunConfig(transform_eviction='resolve', retries=1)
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import json
+from typing import Any
 from unittest import mock
 
+import pytest
+
 from webs.executor.python import ThreadPoolConfig
+from webs.executor.workflow import WorkflowExecutor
+from webs.logging import RUN_LOG_LEVEL
 from webs.run.config import BenchmarkConfig
 from webs.run.main import main
 from webs.run.main import parse_args_to_config
 from webs.run.main import run
 
 
+def _read_task_records(config: BenchmarkConfig) -> list[dict[str, Any]]:
+    path = config.get_run_dir() / config.run.task_record_file_name
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
 @mock.patch('webs.run.main.parse_args_to_config')
 @mock.patch('webs.run.main.init_logging')
 def test_main(mock_parse, mock_logging) -> None:
@@ -27,6 +39,83 @@ def test_run(test_benchmark_config: BenchmarkConfig) -> None:
     run(test_benchmark_config)
 
 
+def test_run_task_cache(test_benchmark_config: BenchmarkConfig) -> None:
+    test_benchmark_config.run.task_cache = True
+    run(test_benchmark_config)
+    assert (test_benchmark_config.get_run_dir() / 'task-cache').is_dir()
+
+
+def test_run_speculation(
+    test_benchmark_config: BenchmarkConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    test_benchmark_config.run.speculation = True
+    with caplog.at_level(RUN_LOG_LEVEL, logger='webs.run'):
+        run(test_benchmark_config)
+    assert 'Speculative copies (launched=0, won=0)' in caplog.text
+
+
+def test_run_retries(test_benchmark_config: BenchmarkConfig) -> None:
+    test_benchmark_config.run.retries = 1
+    with mock.patch(
+        'webs.run.main.WorkflowExecutor',
+        wraps=WorkflowExecutor,
+    ) as mock_executor:
+        run(test_benchmark_config)
+    retry_engine = mock_executor.call_args.kwargs['retry_engine']
+    assert retry_engine.default_policy.max_retries == 1
+
+
+def test_run_capture_resources(
+    test_benchmark_config: BenchmarkConfig,
+) -> None:
+    test_benchmark_config.run.capture_resources = True
+    run(test_benchmark_config)
+    records = _read_task_records(test_benchmark_config)
+    assert len(records) == test_benchmark_config.workflow.tasks
+    for record in records:
+        assert record['execution']['resources']['user_time'] >= 0
+        assert record['execution'].get('payload') is None
+
+
+def test_run_capture_payload(test_benchmark_config: BenchmarkConfig) -> None:
+    test_benchmark_config.run.capture_payload = True
+    run(test_benchmark_config)
+    records = _read_task_records(test_benchmark_config)
+    assert len(records) == test_benchmark_config.workflow.tasks
+    for record in records:
+        assert record['execution']['payload']['args_bytes'] > 0
+        assert record['execution'].get('resources') is None
+
+
+def test_run_profile(test_benchmark_config: BenchmarkConfig) -> None:
+    test_benchmark_config.run.profile_functions = '*'
+    run(test_benchmark_config)
+    profiles = test_benchmark_config.get_run_dir() / 'profiles'
+    assert len(list(profiles.glob('*.prof'))) > 0
+
+
+def test_run_clock_offsets(
+    test_benchmark_config: BenchmarkConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    test_benchmark_config.run.clock_offsets = True
+    with caplog.at_level(RUN_LOG_LEVEL, logger='webs.run'):
+        run(test_benchmark_config)
+    assert 'Clock offset (host=' in caplog.text
+    for record in _read_task_records(test_benchmark_config):
+        assert record['execution']['clock_offset'] is not None
+
+
+def test_run_metrics(test_benchmark_config: BenchmarkConfig) -> None:
+    test_benchmark_config.run.metrics_port = 0
+    test_benchmark_config.run.metrics_file_name = 'metrics.prom'
+    run(test_benchmark_config)
+    metrics_file = test_benchmark_config.get_run_dir() / 'metrics.prom'
+    with open(metrics_file) as f:
+        assert 'webs_tasks_completed_total' in f.read()
+
+
 def test_parse_args_to_config(test_benchmark_config: BenchmarkConfig) -> None:
     argv = [
         test_benchmark_config.name,
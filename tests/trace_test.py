@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import threading
+from typing import Any
+
+from webs.trace import ChromeTraceRecordLogger
+from webs.trace import TraceEventBuilder
+from webs.trace import write_trace
+
+
+def _record(
+    task_id: str,
+    parents: list[str],
+    start: float,
+    end: float,
+    hostname: str = 'host',
+) -> dict[str, Any]:
+    return {
+        'task_id': task_id,
+        'function_name': 'function',
+        'parent_task_ids': parents,
+        'submit_time': start - 0.5,
+        'received_time': end + 0.5,
+        'execution': {
+            'hostname': hostname,
+            'execution_start_time': start,
+            'execution_end_time': end,
+            'task_start_time': start + 0.1,
+            'task_end_time': end - 0.1,
+            'input_transform_start_time': start,
+            'input_transform_end_time': start + 0.1,
+            'result_transform_start_time': end - 0.1,
+            'result_transform_end_time': end,
+        },
+        'cache_hit': False,
+        'speculative_copies': 0,
+        'retries': 0,
+        'first_failure_time': None,
+    }
+
+
+def _slices(events: list[dict[str, Any]], cat: str) -> list[Any]:
+    return [event for event in events if event.get('cat') == cat]
+
+
+def test_trace_event_builder_lanes() -> None:
+    builder = TraceEventBuilder()
+    events = [
+        *builder.events(_record('a', [], 0, 2)),
+        *builder.events(_record('b', [], 1, 3)),
+        *builder.events(_record('c', [], 2, 4)),
+        *builder.events(_record('d', [], 1, 2, hostname='other')),
+    ]
+    tasks = {
+        event['args']['task_id']: (event['pid'], event['tid'])
+        for event in _slices(events, 'task')
+    }
+    # Overlapping tasks use separate lanes and back-to-back tasks share one.
+    assert tasks == {'a': (0, 0), 'b': (0, 1), 'c': (0, 0), 'd': (1, 0)}
+
+    metadata = [event for event in events if event['ph'] == 'M']
+    assert [event['args']['name'] for event in metadata] == [
+        'host',
+        'lane 0',
+        'lane 1',
+        'other',
+        'lane 0',
+    ]
+
+    phases = _slices(events, 'phase')
+    assert len(phases) == 3 * len(tasks)
+    assert phases[0]['name'] == 'input_transform'
+    assert phases[0]['ts'] == 0
+    assert phases[0]['dur'] == 0.1 * 1e6
+
+
+def test_trace_event_builder_flows() -> None:
+    builder = TraceEventBuilder()
+    # The child is added before one of its parents.
+    events = [
+        *builder.events(_record('a', [], 0, 1)),
+        *builder.events(_record('c', ['a', 'b'], 2, 3)),
+        *builder.events(_record('b', [], 0, 1.5)),
+    ]
+    slices = {
+        event['args']['task_id']: event for event in _slices(events, 'task')
+    }
+    flows = _slices(events, 'dependency')
+    starts = {event['id']: event for event in flows if event['ph'] == 's'}
+    finishes = {event['id']: event for event in flows if event['ph'] == 'f'}
+    assert starts.keys() == finishes.keys() == {0, 1}
+    # Flows start within the parent slices and finish at the child slice.
+    for flow, parent in ((0, slices['a']), (1, slices['b'])):
+        end = parent['ts'] + parent['dur']
+        assert parent['ts'] < starts[flow]['ts'] < end
+        assert (starts[flow]['pid'], starts[flow]['tid']) == (
+            parent['pid'],
+            parent['tid'],
+        )
+        assert finishes[flow]['ts'] == slices['c']['ts']
+
+
+def test_trace_event_builder_skips_cache_hits() -> None:
+    builder = TraceEventBuilder()
+    record = _record('a', [], 0, 1)
+    record['cache_hit'] = True
+    assert builder.events(record) == []
+    record['execution'] = None
+    assert builder.events(record) == []
+
+
+def test_chrome_trace_record_logger(tmp_path: pathlib.Path) -> None:
+    filepath = tmp_path / 'trace.json'
+    with ChromeTraceRecordLogger(filepath) as logger:
+        logger.log(_record('a', [], 0, 1))
+        logger.log(_record('b', ['a'], 1, 2))
+
+    with open(filepath) as f:
+        events = json.load(f)
+    assert [event['args']['task_id'] for event in _slices(events, 'task')] == [
+        'a',
+        'b',
+    ]
+    assert [event['ph'] for event in _slices(events, 'dependency')] == [
+        's',
+        'f',
+    ]
+
+
+def test_chrome_trace_record_logger_threads(tmp_path: pathlib.Path) -> None:
+    filepath = tmp_path / 'trace.json'
+    threads, count = 8, 500
+
+    def _log(logger: ChromeTraceRecordLogger, thread: int) -> None:
+        for i in range(count):
+            task_id = f'{thread}-{i}'
+            parents = [f'{thread}-{i - 1}'] if i > 0 else []
+            logger.log(_record(task_id, parents, i, i + 1, f'host-{thread}'))
+
+    with ChromeTraceRecordLogger(filepath) as logger:
+        workers = [
+            threading.Thread(target=_log, args=(logger, thread))
+            for thread in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    with open(filepath) as f:
+        events = json.load(f)
+    assert len(_slices(events, 'task')) == threads * count
+    assert len(_slices(events, 'dependency')) == 2 * threads * (count - 1)
+
+
+def test_write_trace(tmp_path: pathlib.Path) -> None:
+    filepath = tmp_path / 'trace.json'
+    # Records are sorted by start time so the tasks fit in one lane.
+    write_trace(
+        [_record('b', [], 1, 2), _record('a', [], 0, 1)],
+        filepath,
+    )
+
+    with open(filepath) as f:
+        events = json.load(f)
+    assert {event['tid'] for event in _slices(events, 'task')} == {0}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from webs.executor.dag import DAGExecutor
+from webs.executor.retry import retry_policy
+from webs.executor.retry import RetryPolicy
+from webs.executor.workflow import WorkflowExecutor
+from webs.wf.failure.workflow import FlawExecutor
+
+
+@retry_policy(
+    RetryPolicy(
+        max_retries=1,
+        initial_delay=0.01,
+        transient=(ArithmeticError,),
+    ),
+)
+def _retried(x: int) -> int:
+    return x
+
+
+def _not_retried(x: int) -> int:
+    return x  # pragma: no cover
+
+
+def test_flaw_executor_retry_policy(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    # The first attempt fails and the retry succeeds.
+    with mock.patch('random.random', side_effect=[0.0, 1.0]), FlawExecutor(
+        0.5,
+        'divide_zero',
+        DAGExecutor(thread_executor),
+        None,
+    ) as executor:
+        future = executor.submit(_retried, 1)
+        assert future.result() == 1
+        assert future.info.function_name == '_retried'
+        assert future.info.retries == 1
+
+
+def test_flaw_executor_no_retry_policy(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with mock.patch('random.random', side_effect=[0.0]), FlawExecutor(
+        0.5,
+        'divide_zero',
+        DAGExecutor(thread_executor),
+        None,
+    ) as executor:
+        future = executor.submit(_not_retried, 1)
+        with pytest.raises(ZeroDivisionError):
+            future.result()
+
+
+def test_flaw_executor_from_executor(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    executor = WorkflowExecutor(
+        DAGExecutor(thread_executor),
+        fuse_chains=True,
+        capture_resources=True,
+        capture_payload=True,
+        evict_unreferenced=False,
+    )
+    flaw_executor = FlawExecutor.from_executor(0.0, 'divide_zero', executor)
+    assert flaw_executor.compute_executor is executor.compute_executor
+    assert flaw_executor.retry_engine is executor.retry_engine
+    assert flaw_executor.record_logger is executor.record_logger
+    assert flaw_executor.fuse_chains
+    assert flaw_executor.capture_resources
+    assert flaw_executor.capture_payload
+    assert flaw_executor.references is None
@@ -108,3 +108,9 @@ def test_run_sequential(workflow_executor: WorkflowExecutor) -> None:
     runtime = time.perf_counter() - start
 
     assert runtime >= task_count * task_sleep
+
+
+def test_run_reduce_batch_submit(workflow_executor: WorkflowExecutor) -> None:
+    task_count = 3
+    run_reduce(workflow_executor, task_count, 0, 0, batch_submit=True)
+    assert workflow_executor.tasks_executed == task_count + 1
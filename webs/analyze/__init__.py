@@ -0,0 +1,7 @@
+"""Analysis of the task records of a run.
+
+Usage:
+    ```bash
+    python -m webs.analyze runs/{name}-{timestamp}
+    ```
+"""
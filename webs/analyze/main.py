@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from typing import Sequence
+
+# Missing optional dependencies are reported by load_run().
+with contextlib.suppress(ImportError):
+    import pandas
+
+from webs.analyze.metrics import critical_path
+from webs.analyze.metrics import get_workers
+from webs.analyze.metrics import iter_records
+from webs.analyze.metrics import latency_percentiles
+from webs.analyze.metrics import load_run
+from webs.analyze.metrics import makespan
+from webs.analyze.metrics import overhead
+from webs.analyze.metrics import payload_sizes
+from webs.analyze.metrics import resource_usage
+from webs.analyze.metrics import throughput
+from webs.analyze.metrics import utilization
+from webs.trace import write_trace
+
+# Show at most this many tasks of the critical path individually.
+_MAX_PATH_TASKS = 20
+
+
+def _percentiles(value: str) -> list[float]:
+    return [float(p) for p in value.split(',')]
+
+
+def _float(value: float) -> str:
+    return f'{value:.6f}'
+
+
+def _section(title: str) -> str:
+    return f'\n{title}\n{"-" * len(title)}'
+
+
+def report(
+    run_dir: str,
+    *,
+    bins: int = 10,
+    percentiles: Sequence[float] = (50, 90, 99),
+    workers: int | None = None,
+) -> str:
+    """Create the analysis report of a run.
+
+    Args:
+        run_dir: Run directory.
+        bins: Number of time intervals of the throughput table.
+        percentiles: Percentiles of the latency tables.
+        workers: Number of workers. If `None`, the number is read from the
+            executor config of the run or, if not set, is the peak number of
+            tasks executing at once.
+
+    Returns:
+        Report text.
+    """
+    config, tasks = load_run(run_dir)
+    workers = get_workers(config) if workers is None else workers
+    span = makespan(tasks)
+
+    lines = [
+        f'Run: {config.get("name", "unknown")} ({run_dir})',
+        f'Tasks: {len(tasks)} ({int(tasks["cache_hit"].sum())} cache hits)',
+        f'Makespan: {span:.3f}s',
+        f'Throughput: {len(tasks) / span if span > 0 else 0:.2f} tasks/s',
+    ]
+
+    lines.append(_section('Throughput over time (seconds since start)'))
+    lines.append(throughput(tasks, bins).to_string(index=False))
+
+    usage = utilization(tasks, workers)
+    lines.append(_section('Worker utilization'))
+    lines.extend(
+        [
+            f'Workers: {usage.workers}',
+            f'Peak concurrency: {usage.peak_concurrency}',
+            f'Busy: {usage.busy:.3f}s',
+            f'Utilization: {usage.utilization:.1%}',
+        ],
+    )
+    if len(usage.hosts) > 0:
+        lines.append(
+            usage.hosts.rename('busy (s)').to_string(float_format=_float),
+        )
+
+    with pandas.option_context('display.width', 200):
+        for phase, table in latency_percentiles(tasks, percentiles).T.groupby(
+            level=0,
+            sort=False,
+        ):
+            if phase == 'tasks':
+                continue
+            lines.append(_section(f'Latency percentiles: {phase} (s)'))
+            lines.append(table.droplevel(0).T.to_string())
+
+    resources = resource_usage(tasks)
+    if len(resources) > 0:
+        lines.append(_section('Resource usage of task functions'))
+        with pandas.option_context('display.width', 200):
+            lines.append(resources.to_string(float_format=_float))
+
+    payloads = payload_sizes(tasks)
+    if len(payloads) > 0:
+        lines.append(_section('Payload sizes of task functions'))
+        with pandas.option_context('display.width', 200):
+            lines.append(payloads.to_string(float_format='{:.0f}'.format))
+
+    path = critical_path(tasks)
+    path_overhead = overhead(path)
+    lines.append(_section('Critical path'))
+    lines.extend(
+        [
+            f'Tasks: {len(path)}',
+            f'Wall time: {path_overhead.wall:.3f}s',
+            f'Task work: {path_overhead.work:.3f}s '
+            f'({path_overhead.work / path_overhead.wall:.1%})'
+            if path_overhead.wall > 0
+            else f'Task work: {path_overhead.work:.3f}s',
+            f'Framework overhead: {path_overhead.overhead:.3f}s',
+            f'Gaps between tasks: {path_overhead.gaps:.3f}s',
+        ],
+    )
+    if len(path_overhead.phases) > 0:
+        lines.append(
+            path_overhead.phases.rename('total (s)').to_string(
+                float_format=_float,
+            ),
+        )
+    if 0 < len(path) <= _MAX_PATH_TASKS:
+        lines.append(
+            path[['task_id', 'function_name']].to_string(index=False),
+        )
+    elif len(path) > 0:
+        lines.append(
+            path['function_name']
+            .value_counts()
+            .rename('tasks on path')
+            .to_string(),
+        )
+
+    return '\n'.join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:  # noqa: D103
+    argv = argv if argv is not None else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description='Analyze the task records of a workflow run.',
+        prog='python -m webs.analyze',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument('run_dir', help='run directory')
+    parser.add_argument(
+        '--bins',
+        type=int,
+        default=10,
+        help='number of time intervals of the throughput table',
+    )
+    parser.add_argument(
+        '--percentiles',
+        type=_percentiles,
+        default='50,90,99',
+        help='comma separated percentiles of the latency tables',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help=(
+            'number of workers (defaults to the executor config of the run '
+            'or the peak concurrency)'
+        ),
+    )
+    parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        help='also write the task records to a Chrome trace file',
+    )
+    args = parser.parse_args(argv)
+
+    if args.trace is not None:
+        write_trace(iter_records(args.run_dir), args.trace)
+
+    print(
+        report(
+            args.run_dir,
+            bins=args.bins,
+            percentiles=args.percentiles,
+            workers=args.workers,
+        ),
+    )
+    return 0
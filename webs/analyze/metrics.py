@@ -0,0 +1,521 @@
+"""Vectorized metrics of task records.
+
+The functions in this module operate on the `DataFrame` of task records
+returned by [`load_run()`][webs.analyze.metrics.load_run] (see
+[`read_columnar()`][webs.columnar.read_columnar] for the layout). All
+metrics are computed with NumPy and pandas array operations rather than
+per-task Python loops so runs with millions of tasks can be analyzed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import pathlib
+from typing import Any
+from typing import Iterator
+from typing import NamedTuple
+from typing import Sequence
+
+try:
+    import numpy
+
+    NUMPY_IMPORT_ERROR = None
+except ImportError as e:  # pragma: no cover
+    NUMPY_IMPORT_ERROR = e
+
+try:
+    import pandas
+
+    PANDAS_IMPORT_ERROR = None
+except ImportError as e:  # pragma: no cover
+    PANDAS_IMPORT_ERROR = e
+
+from webs.columnar import iter_columnar
+from webs.columnar import read_columnar
+from webs.columnar import read_json_records
+from webs.record import Record
+
+PHASES = {
+    'queue': ('submit_time', 'execution_start_time'),
+    'input_transform': (
+        'input_transform_start_time',
+        'input_transform_end_time',
+    ),
+    'compute': ('task_start_time', 'task_end_time'),
+    'result_transform': (
+        'result_transform_start_time',
+        'result_transform_end_time',
+    ),
+    'return': ('execution_end_time', 'received_time'),
+}
+"""Phases of the lifetime of a task and the record fields bounding each."""
+
+WORKER_CONFIG_KEYS = (
+    'max_processes',
+    'max_threads',
+    'dask_workers',
+    'parsl_workers',
+    'ray_num_cpus',
+)
+"""Executor config keys which set the number of workers."""
+
+
+def check_dependencies() -> None:
+    """Check that the optional dependencies of the analysis are installed.
+
+    Raises:
+        ImportError: If NumPy or pandas is not installed.
+    """
+    for error in (NUMPY_IMPORT_ERROR, PANDAS_IMPORT_ERROR):
+        if error is not None:  # pragma: no cover
+            raise ImportError(
+                'Analyzing task records requires NumPy and pandas. Install '
+                'them with the analyze extras option.\n'
+                '  $ pip install .[analyze]',
+            ) from error
+
+
+def _read_config(
+    run_dir: pathlib.Path | str,
+) -> tuple[dict[str, Any], pathlib.Path, bool]:
+    # Get the run config, task record path, and if the records are columnar.
+    run_dir = pathlib.Path(run_dir)
+    with open(run_dir / 'config.json') as f:
+        config = json.load(f)
+
+    run_config = config.get('run', {})
+    path = run_dir / run_config.get('task_record_file_name', 'tasks.json')
+    if run_config.get('task_record_logger', 'json') == 'columnar':
+        return config, path.with_suffix(''), True
+    return config, path, False
+
+
+def load_run(
+    run_dir: pathlib.Path | str,
+) -> tuple[dict[str, Any], pandas.DataFrame]:
+    """Load the config and task records of a run.
+
+    The task record file name and format are read from the run config in
+    `config.json`. Runs which predate the `task_record_logger` option are
+    assumed to have JSON records.
+
+    Args:
+        run_dir: Run directory.
+
+    Returns:
+        Tuple of the run config and the `DataFrame` of task records.
+
+    Raises:
+        ImportError: If NumPy or pandas is not installed.
+    """
+    check_dependencies()
+    config, path, columnar = _read_config(run_dir)
+    if columnar:
+        return config, read_columnar(path)
+    return config, read_json_records(path)
+
+
+def iter_records(run_dir: pathlib.Path | str) -> Iterator[Record]:
+    """Iterate over the task records of a run.
+
+    Unlike [`load_run()`][webs.analyze.metrics.load_run], the records are
+    in the format logged by the
+    [`WorkflowExecutor`][webs.executor.workflow.WorkflowExecutor].
+
+    Args:
+        run_dir: Run directory.
+
+    Yields:
+        Task records.
+    """
+    _, path, columnar = _read_config(run_dir)
+    if columnar:
+        yield from iter_columnar(path)
+        return
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def get_workers(config: dict[str, Any]) -> int | None:
+    """Get the number of workers of the executor of a run config.
+
+    Returns:
+        Number of workers or `None` if it is not set in the config.
+    """
+    executor = config.get('executor', {})
+    for key in WORKER_CONFIG_KEYS:
+        if executor.get(key) is not None:
+            return int(executor[key])
+    return None
+
+
+def makespan(tasks: pandas.DataFrame) -> float:
+    """Seconds from the first task submission to the last task received."""
+    if len(tasks) == 0:
+        return 0.0
+    return float(
+        numpy.nanmax(tasks['received_time'].to_numpy())
+        - numpy.nanmin(tasks['submit_time'].to_numpy()),
+    )
+
+
+def phase_durations(tasks: pandas.DataFrame) -> pandas.DataFrame:
+    """Get the seconds each task spent in each phase.
+
+    Returns:
+        `DataFrame` with one column per phase in
+        [`PHASES`][webs.analyze.metrics.PHASES].
+    """
+    return pandas.DataFrame(
+        {
+            phase: tasks[end].to_numpy() - tasks[start].to_numpy()
+            for phase, (start, end) in PHASES.items()
+        },
+        index=tasks.index,
+    )
+
+
+def latency_percentiles(
+    tasks: pandas.DataFrame,
+    percentiles: Sequence[float] = (50, 90, 99),
+) -> pandas.DataFrame:
+    """Get percentiles of the phase durations of each function.
+
+    Tasks which were cache hits are excluded.
+
+    Args:
+        tasks: Task records.
+        percentiles: Percentiles in [0, 100].
+
+    Returns:
+        `DataFrame` indexed by function name with a column for each phase \
+        and percentile.
+    """
+    executed = ~tasks['cache_hit'].to_numpy()
+    durations = phase_durations(tasks)[executed]
+    functions = tasks['function_name'][executed]
+    quantiles = (
+        durations.groupby(functions, observed=True)
+        .quantile([p / 100 for p in percentiles])
+        .unstack()
+    )
+    quantiles.columns = pandas.MultiIndex.from_tuples(
+        [(phase, f'p{round(q * 100, 4):g}') for phase, q in quantiles.columns],
+    )
+    counts = functions.value_counts(sort=False)
+    quantiles.insert(0, 'tasks', counts.reindex(quantiles.index))
+    return quantiles
+
+
+def throughput(tasks: pandas.DataFrame, bins: int = 10) -> pandas.DataFrame:
+    """Get the number of tasks completed over time.
+
+    Args:
+        tasks: Task records.
+        bins: Number of equal width time intervals.
+
+    Returns:
+        `DataFrame` with the start and end of each interval in seconds \
+        since the first task submission, the number of tasks received in \
+        the interval, and the tasks per second.
+    """
+    start = numpy.nanmin(tasks['submit_time'].to_numpy())
+    received = tasks['received_time'].to_numpy() - start
+    received = received[~numpy.isnan(received)]
+    counts, edges = numpy.histogram(
+        received,
+        bins=bins,
+        range=(0, max(makespan(tasks), 1e-9)),
+    )
+    widths = numpy.diff(edges)
+    return pandas.DataFrame(
+        {
+            'start': edges[:-1],
+            'end': edges[1:],
+            'tasks': counts,
+            'tasks_per_second': counts / widths,
+        },
+    )
+
+
+def resource_usage(tasks: pandas.DataFrame) -> pandas.DataFrame:
+    """Summarize the resource usage of each function.
+
+    The CPU utilization of a task is the CPU time of the task divided by the
+    duration of the task function. A utilization well below one with many
+    involuntary context switches suggests the task was starved of CPU
+    (e.g., the host was oversubscribed) while a low utilization with many
+    voluntary context switches or bytes read suggests the task was waiting
+    on I/O.
+
+    Returns:
+        `DataFrame` indexed by function name with the number of tasks with \
+        resource usage, the median CPU utilization, the mean context \
+        switches, the maximum peak memory growth, and the mean bytes read \
+        and written. Empty if resource usage was not captured.
+    """
+    captured = tasks[tasks['user_time'].notna().to_numpy()]
+    cpu = captured['user_time'] + captured['system_time']
+    duration = captured['task_end_time'] - captured['task_start_time']
+    usage = pandas.DataFrame(
+        {
+            'cpu_utilization': (cpu / duration.where(duration > 0)),
+            'voluntary_context_switches': captured[
+                'voluntary_context_switches'
+            ],
+            'involuntary_context_switches': captured[
+                'involuntary_context_switches'
+            ],
+            'max_rss_delta': captured['max_rss_delta'],
+            'read_bytes': captured['read_bytes'],
+            'write_bytes': captured['write_bytes'],
+        },
+        index=captured.index,
+    )
+    grouped = usage.groupby(captured['function_name'], observed=True)
+    return pandas.DataFrame(
+        {
+            'tasks': grouped.size(),
+            'cpu_utilization': grouped['cpu_utilization'].median(),
+            'voluntary_context_switches': grouped[
+                'voluntary_context_switches'
+            ].mean(),
+            'involuntary_context_switches': grouped[
+                'involuntary_context_switches'
+            ].mean(),
+            'max_rss_delta': grouped['max_rss_delta'].max(),
+            'read_bytes': grouped['read_bytes'].mean(),
+            'write_bytes': grouped['write_bytes'].mean(),
+        },
+    )
+
+
+def payload_sizes(tasks: pandas.DataFrame) -> pandas.DataFrame:
+    """Summarize the payload sizes of each function.
+
+    The transform rates are the bytes moved out-of-band by the data
+    transformer divided by the time spent resolving the arguments or
+    transforming the result, respectively, over all tasks of the function.
+    Comparing the rates and sizes of functions helps choose the minimum
+    object size transformed by a size filter.
+
+    Returns:
+        `DataFrame` indexed by function name with the number of tasks with \
+        payload sizes, the mean inline and transformed bytes of the \
+        arguments and result, and the input and result transform rates in \
+        bytes per second. Empty if payload sizes were not captured.
+    """
+    captured = tasks[tasks['args_bytes'].notna().to_numpy()]
+    grouped = captured.groupby('function_name', observed=True)
+
+    def _rate(size: str, start: str, end: str) -> pandas.Series:
+        seconds = (captured[end] - captured[start]).groupby(
+            captured['function_name'],
+            observed=True,
+        )
+        total = seconds.sum()
+        return grouped[size].sum() / total.where(total > 0)
+
+    return pandas.DataFrame(
+        {
+            'tasks': grouped.size(),
+            'args_bytes': grouped['args_bytes'].mean(),
+            'args_transformed_bytes': grouped['args_transformed_bytes'].mean(),
+            'result_bytes': grouped['result_bytes'].mean(),
+            'result_transformed_bytes': grouped[
+                'result_transformed_bytes'
+            ].mean(),
+            'input_transform_rate': _rate(
+                'args_transformed_bytes',
+                'input_transform_start_time',
+                'input_transform_end_time',
+            ),
+            'result_transform_rate': _rate(
+                'result_transformed_bytes',
+                'result_transform_start_time',
+                'result_transform_end_time',
+            ),
+        },
+    )
+
+
+class Utilization(NamedTuple):
+    """Worker utilization of a run.
+
+    Attributes:
+        busy: Total seconds tasks were executing on workers.
+        peak_concurrency: Maximum number of tasks executing at once.
+        workers: Number of workers used to compute `utilization`.
+        utilization: Fraction of the available worker time spent executing
+            tasks.
+        hosts: Seconds tasks were executing on each host.
+    """
+
+    busy: float
+    peak_concurrency: int
+    workers: int
+    utilization: float
+    hosts: pandas.Series
+
+
+def utilization(
+    tasks: pandas.DataFrame,
+    workers: int | None = None,
+) -> Utilization:
+    """Compute the worker utilization of a run.
+
+    Args:
+        tasks: Task records.
+        workers: Number of workers. If `None`, the peak number of tasks
+            executing at once is used.
+    """
+    executed = tasks[~tasks['cache_hit'].to_numpy()].dropna(
+        subset=['execution_start_time', 'execution_end_time'],
+    )
+    starts = executed['execution_start_time'].to_numpy()
+    ends = executed['execution_end_time'].to_numpy()
+    durations = ends - starts
+
+    # Sort start (+1) and end (-1) events with ends first on ties so
+    # back-to-back tasks on one worker are not counted as concurrent.
+    times = numpy.concatenate([starts, ends])
+    deltas = numpy.concatenate(
+        [numpy.ones(len(starts)), -numpy.ones(len(ends))],
+    )
+    order = numpy.lexsort((deltas, times))
+    concurrency = numpy.cumsum(deltas[order])
+    peak = int(concurrency.max()) if len(concurrency) > 0 else 0
+
+    workers = peak if workers is None else workers
+    busy = float(durations.sum())
+    span = makespan(tasks)
+    available = workers * span
+    hosts = (
+        pandas.Series(durations, index=executed.index)
+        .groupby(executed['hostname'], observed=True)
+        .sum()
+    )
+    return Utilization(
+        busy=busy,
+        peak_concurrency=peak,
+        workers=workers,
+        utilization=busy / available if available > 0 else 0.0,
+        hosts=hosts,
+    )
+
+
+def critical_path(tasks: pandas.DataFrame) -> pandas.DataFrame:
+    """Get the critical path of a run.
+
+    The critical path is found by starting at the last task received and
+    repeatedly stepping to the parent of the current task which was received
+    last (i.e., the parent which delayed the current task the most) until a
+    task with no parents is reached.
+
+    Returns:
+        Task records of the tasks on the critical path in execution order.
+    """
+    count = len(tasks)
+    if count == 0:
+        return tasks
+
+    # Map interned task IDs to row positions.
+    index = tasks.index.to_numpy()
+    positions = numpy.full(index.max() + 1, -1, dtype=numpy.int64)
+    positions[index] = numpy.arange(count)
+
+    parent_lists = tasks['parent_task_ids'].tolist()
+    parent_counts = numpy.fromiter(
+        map(len, parent_lists),
+        dtype=numpy.int64,
+        count=count,
+    )
+    parent_ids = numpy.fromiter(
+        itertools.chain.from_iterable(parent_lists),
+        dtype=numpy.int64,
+        count=int(parent_counts.sum()),
+    )
+    children = numpy.repeat(numpy.arange(count), parent_counts)
+    parents = numpy.full(len(parent_ids), -1, dtype=numpy.int64)
+    known = parent_ids <= index.max()
+    parents[known] = positions[parent_ids[known]]
+    children, parents = children[parents >= 0], parents[parents >= 0]
+
+    # For each child, find the parent received last.
+    received = tasks['received_time'].to_numpy()
+    received = numpy.where(numpy.isnan(received), -numpy.inf, received)
+    order = numpy.lexsort((received[parents], children))
+    children, parents = children[order], parents[order]
+    critical_parent = numpy.full(count, -1, dtype=numpy.int64)
+    if len(children) > 0:
+        last = numpy.append(children[1:] != children[:-1], True)
+        critical_parent[children[last]] = parents[last]
+
+    path = [int(numpy.argmax(received))]
+    while critical_parent[path[-1]] >= 0 and len(path) <= count:
+        path.append(int(critical_parent[path[-1]]))
+    return tasks.iloc[path[::-1]]
+
+
+class Overhead(NamedTuple):
+    """Framework overhead of a set of tasks.
+
+    Attributes:
+        wall: Seconds from the first submission to the last result
+            received.
+        work: Seconds spent executing task functions.
+        overhead: Seconds not spent executing task functions.
+        gaps: Seconds not spent in any phase of a task (e.g., between a
+            parent result being received and the child being submitted).
+        phases: Total seconds spent in each phase.
+    """
+
+    wall: float
+    work: float
+    overhead: float
+    gaps: float
+    phases: pandas.Series
+
+
+def overhead(path: pandas.DataFrame) -> Overhead:
+    """Compute the framework overhead along a critical path.
+
+    The queue time of a task on the path is measured from when the result
+    of the previous task on the path was received if that is later than
+    when the task was submitted, so the phases of the tasks do not overlap.
+
+    Args:
+        path: Task records of the tasks on a critical path in execution
+            order (see
+            [`critical_path()`][webs.analyze.metrics.critical_path]).
+    """
+    if len(path) == 0:
+        return Overhead(0.0, 0.0, 0.0, 0.0, pandas.Series(dtype=float))
+    wall = float(
+        path['received_time'].to_numpy()[-1]
+        - path['submit_time'].to_numpy()[0],
+    )
+    durations = phase_durations(path)
+    submitted = path['submit_time'].to_numpy()
+    ready = numpy.concatenate(
+        [
+            submitted[:1],
+            numpy.maximum(
+                submitted[1:],
+                path['received_time'].to_numpy()[:-1],
+            ),
+        ],
+    )
+    durations['queue'] = path['execution_start_time'].to_numpy() - ready
+    phases = durations.sum()
+    work = float(phases['compute'])
+    return Overhead(
+        wall=wall,
+        work=work,
+        overhead=wall - work,
+        gaps=wall - float(phases.sum()),
+        phases=phases,
+    )
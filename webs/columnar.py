@@ -0,0 +1,598 @@
+"""Columnar binary task record format.
+
+Task records (see
+[`TaskInfo.to_record()`][webs.executor.workflow.TaskInfo.to_record]) are
+written by the
+[`ColumnarRecordLogger`][webs.columnar.ColumnarRecordLogger] to a directory
+of NumPy `.npz` chunks with one array per field. Strings (task IDs,
+function names, and hostnames) are interned as integer indices into a
+string table, and the parent task IDs of each task are stored as a flat
+array of indices with an offset array. Each chunk contains only the strings
+first seen in that chunk so the string table is the concatenation of the
+tables of all chunks.
+
+Records can be loaded into a `pandas.DataFrame` with
+[`read_columnar()`][webs.columnar.read_columnar] and converted to and from
+the JSON lines format of the
+[`JSONRecordLogger`][webs.record.JSONRecordLogger] with
+[`json_to_columnar()`][webs.columnar.json_to_columnar] and
+[`columnar_to_json()`][webs.columnar.columnar_to_json].
+
+Note:
+    This module requires NumPy, and reading records into a `DataFrame`
+    requires pandas.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import pathlib
+import sys
+import threading
+from types import TracebackType
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+try:
+    import numpy
+
+    NUMPY_IMPORT_ERROR = None
+except ImportError as e:  # pragma: no cover
+    NUMPY_IMPORT_ERROR = e
+
+try:
+    import pandas
+
+    PANDAS_IMPORT_ERROR = None
+except ImportError as e:  # pragma: no cover
+    PANDAS_IMPORT_ERROR = e
+
+from webs.record import Record
+
+COLUMNAR_FORMAT_VERSION = 1
+"""Version of the columnar format written to each chunk."""
+
+TIME_FIELDS = ('submit_time', 'received_time', 'first_failure_time')
+"""Time fields of a task record."""
+
+EXECUTION_TIME_FIELDS = (
+    'execution_start_time',
+    'execution_end_time',
+    'task_start_time',
+    'task_end_time',
+    'input_transform_start_time',
+    'input_transform_end_time',
+    'result_transform_start_time',
+    'result_transform_end_time',
+)
+"""Time fields of the `execution` field of a task record."""
+
+RESOURCE_FIELDS = (
+    'user_time',
+    'system_time',
+    'max_rss_delta',
+    'voluntary_context_switches',
+    'involuntary_context_switches',
+    'read_bytes',
+    'write_bytes',
+)
+"""Fields of the optional `resources` field of the `execution` field.
+
+See [`ResourceUsage`][webs.executor.resources.ResourceUsage]. Resource
+fields are stored as floats which are `NaN` if resources were not captured.
+"""
+
+CLOCK_OFFSET_FIELDS = ('clock_offset', 'clock_offset_error')
+"""Optional clock offset fields of the `execution` field.
+
+See [`ClockOffset`][webs.executor.clock.ClockOffset]. The fields are `NaN`
+if clock offsets were not estimated.
+"""
+
+PAYLOAD_FIELDS = (
+    'args_bytes',
+    'args_transformed_bytes',
+    'result_bytes',
+    'result_transformed_bytes',
+)
+"""Fields of the optional `payload` field of the `execution` field.
+
+See [`PayloadSize`][webs.executor.payload.PayloadSize]. Payload fields are
+stored as floats which are `NaN` if payload sizes were not captured.
+"""
+
+_OPTIONAL_FIELDS = (*RESOURCE_FIELDS, *CLOCK_OFFSET_FIELDS, *PAYLOAD_FIELDS)
+
+_CHUNK_GLOB = 'chunk-*.npz'
+
+
+def _nan_if_none(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _none_if_nan(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _records_to_columns(
+    records: Sequence[Record],
+    intern: Callable[[str], int],
+) -> dict[str, Any]:
+    # Convert task records to columns with strings interned by intern().
+    count = len(records)
+
+    parent_counts = [len(r['parent_task_ids']) for r in records]
+    parent_offsets = numpy.zeros(count + 1, dtype=numpy.int64)
+    numpy.cumsum(parent_counts, out=parent_offsets[1:])
+    executions = [r['execution'] for r in records]
+
+    columns: dict[str, Any] = {
+        'task_id': numpy.fromiter(
+            (intern(r['task_id']) for r in records),
+            dtype=numpy.int64,
+            count=count,
+        ),
+        'function_name': numpy.fromiter(
+            (intern(r['function_name']) for r in records),
+            dtype=numpy.int64,
+            count=count,
+        ),
+        'parent_task_ids': numpy.fromiter(
+            (intern(p) for r in records for p in r['parent_task_ids']),
+            dtype=numpy.int64,
+            count=int(parent_offsets[-1]),
+        ),
+        'parent_offsets': parent_offsets,
+        'hostname': numpy.fromiter(
+            (-1 if e is None else intern(e['hostname']) for e in executions),
+            dtype=numpy.int64,
+            count=count,
+        ),
+        'cache_hit': numpy.fromiter(
+            (r.get('cache_hit', False) for r in records),
+            dtype=numpy.bool_,
+            count=count,
+        ),
+        'speculative_copies': numpy.fromiter(
+            (r.get('speculative_copies', 0) for r in records),
+            dtype=numpy.int32,
+            count=count,
+        ),
+        'retries': numpy.fromiter(
+            (r.get('retries', 0) for r in records),
+            dtype=numpy.int32,
+            count=count,
+        ),
+    }
+    for field in TIME_FIELDS:
+        columns[field] = numpy.fromiter(
+            (_nan_if_none(r.get(field)) for r in records),
+            dtype=numpy.float64,
+            count=count,
+        )
+    for field in EXECUTION_TIME_FIELDS:
+        columns[field] = numpy.fromiter(
+            (math.nan if e is None else e[field] for e in executions),
+            dtype=numpy.float64,
+            count=count,
+        )
+    for field in CLOCK_OFFSET_FIELDS:
+        columns[field] = numpy.fromiter(
+            (
+                math.nan if e is None else _nan_if_none(e.get(field))
+                for e in executions
+            ),
+            dtype=numpy.float64,
+            count=count,
+        )
+    resources = [None if e is None else e.get('resources') for e in executions]
+    for field in RESOURCE_FIELDS:
+        columns[field] = numpy.fromiter(
+            (
+                math.nan if r is None else _nan_if_none(r[field])
+                for r in resources
+            ),
+            dtype=numpy.float64,
+            count=count,
+        )
+    payloads = [None if e is None else e.get('payload') for e in executions]
+    for field in PAYLOAD_FIELDS:
+        columns[field] = numpy.fromiter(
+            (
+                math.nan if p is None else _nan_if_none(p[field])
+                for p in payloads
+            ),
+            dtype=numpy.float64,
+            count=count,
+        )
+    return columns
+
+
+class ColumnarRecordLogger:
+    """Columnar task record logger.
+
+    Records are buffered and written as a chunk of columns once `chunk_size`
+    records have been logged and when the logger is closed.
+
+    Note:
+        All methods are thread-safe. Chunks are written while holding the
+        lock of the logger because the string table of each chunk depends
+        on the strings interned by the previous chunks.
+
+    Args:
+        path: Directory to write chunks to.
+        chunk_size: Number of records per chunk.
+        compress: Compress the chunks.
+
+    Raises:
+        FileExistsError: If `path` already contains chunks.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | str,
+        *,
+        chunk_size: int = 65536,
+        compress: bool = False,
+    ) -> None:
+        if NUMPY_IMPORT_ERROR is not None:  # pragma: no cover
+            raise NUMPY_IMPORT_ERROR
+
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        if any(self.path.glob(_CHUNK_GLOB)):
+            raise FileExistsError(
+                f'Directory {self.path} already contains record chunks.',
+            )
+        self.chunk_size = chunk_size
+        self.compress = compress
+
+        self._buffer: list[Record] = []
+        self._chunks = 0
+        self._strings: dict[str, int] = {}
+        self._new_strings: list[str] = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _intern(self, string: str) -> int:
+        index = self._strings.get(string)
+        if index is None:
+            index = len(self._strings)
+            self._strings[string] = index
+            self._new_strings.append(string)
+        return index
+
+    def log(self, record: Record) -> None:
+        """Log a task record.
+
+        The record must not be modified after being logged. Fields added to
+        task records in later versions (e.g., `retries`) are optional.
+
+        Raises:
+            RuntimeError: If the logger is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Cannot log a record to a closed logger.')
+            self._buffer.append(record)
+            if len(self._buffer) >= self.chunk_size:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write the buffered records as a chunk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if len(self._buffer) == 0:
+            return
+        records, self._buffer = self._buffer, []
+        columns = _records_to_columns(records, self._intern)
+
+        strings = [s.encode() for s in self._new_strings]
+        self._new_strings = []
+        columns['strings'] = numpy.array(strings, dtype=numpy.bytes_)
+        columns['version'] = numpy.array(COLUMNAR_FORMAT_VERSION)
+
+        save = numpy.savez_compressed if self.compress else numpy.savez
+        save(self.path / f'chunk-{self._chunks:06d}.npz', **columns)
+        self._chunks += 1
+
+    def close(self) -> None:
+        """Write any buffered records and close the logger."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush()
+
+
+def _read_columns(path: pathlib.Path | str) -> dict[str, Any]:
+    # Read and concatenate the columns of all chunks in a directory.
+    if NUMPY_IMPORT_ERROR is not None:  # pragma: no cover
+        raise NUMPY_IMPORT_ERROR
+
+    chunks: list[dict[str, Any]] = []
+    for chunk_path in sorted(pathlib.Path(path).glob(_CHUNK_GLOB)):
+        with numpy.load(chunk_path) as chunk:
+            version = int(chunk['version'])
+            if version != COLUMNAR_FORMAT_VERSION:
+                raise ValueError(
+                    f'Unsupported columnar format version {version} in '
+                    f'{chunk_path}.',
+                )
+            columns = {
+                name: chunk[name] for name in chunk.files if name != 'version'
+            }
+        # Chunks written by older versions do not have the optional fields.
+        for field in _OPTIONAL_FIELDS:
+            if field not in columns:
+                columns[field] = numpy.full(
+                    len(columns['task_id']),
+                    math.nan,
+                )
+        chunks.append(columns)
+
+    if len(chunks) == 0:
+        raise FileNotFoundError(f'No columnar record chunks found in {path}.')
+
+    columns = _concatenate_columns(chunks)
+    columns['strings'] = numpy.char.decode(columns['strings'], 'utf-8')
+    return columns
+
+
+def _concatenate_columns(chunks: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    # Concatenate the columns of chunks where the parent offsets of each
+    # chunk are relative to the chunk.
+    columns = {
+        name: numpy.concatenate([chunk[name] for chunk in chunks])
+        for name in chunks[0]
+        if name != 'parent_offsets'
+    }
+    counts = numpy.concatenate(
+        [numpy.diff(chunk['parent_offsets']) for chunk in chunks],
+    )
+    offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+    columns['parent_offsets'] = offsets
+    return columns
+
+
+def _categorical(codes: Any, strings: Any) -> Any:
+    # Build a categorical with only the strings used by the codes. Codes
+    # of -1 are missing values.
+    used, codes = numpy.unique(codes, return_inverse=True)
+    if len(used) > 0 and used[0] == -1:
+        used = used[1:]
+        codes = codes - 1
+    return pandas.Categorical.from_codes(codes, categories=strings[used])
+
+
+def read_columnar(path: pathlib.Path | str) -> pandas.DataFrame:
+    """Read columnar task records into a `DataFrame`.
+
+    The `DataFrame` has one row per task and is indexed by the interned
+    integer ID of each task. The `task_id`, `function_name`, and `hostname`
+    columns are categorical. The `parent_task_ids` column contains lists of
+    the interned IDs of the parents of each task which can be used to index
+    the `DataFrame`. The fields of the `execution` field of the records are
+    flattened into columns, and missing values are `NaN`.
+
+    Args:
+        path: Directory of columnar record chunks.
+
+    Returns:
+        `DataFrame` of the task records.
+
+    Raises:
+        FileNotFoundError: If no chunks are found in `path`.
+        ValueError: If a chunk has an unsupported format version.
+    """
+    if PANDAS_IMPORT_ERROR is not None:  # pragma: no cover
+        raise PANDAS_IMPORT_ERROR
+
+    return _columns_to_dataframe(_read_columns(path))
+
+
+def read_json_records(
+    path: pathlib.Path | str,
+    *,
+    batch_size: int = 65536,
+) -> pandas.DataFrame:
+    """Read JSON lines task records into a `DataFrame`.
+
+    The `DataFrame` has the same layout as the `DataFrame` returned by
+    [`read_columnar()`][webs.columnar.read_columnar].
+
+    Args:
+        path: JSON lines file written by a
+            [`JSONRecordLogger`][webs.record.JSONRecordLogger].
+        batch_size: Number of records to convert to columns at a time.
+
+    Returns:
+        `DataFrame` of the task records.
+    """
+    if NUMPY_IMPORT_ERROR is not None:  # pragma: no cover
+        raise NUMPY_IMPORT_ERROR
+    if PANDAS_IMPORT_ERROR is not None:  # pragma: no cover
+        raise PANDAS_IMPORT_ERROR
+
+    strings: dict[str, int] = {}
+
+    def _intern(string: str) -> int:
+        return strings.setdefault(string, len(strings))
+
+    chunks: list[dict[str, Any]] = []
+    records: list[Record] = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+            if len(records) >= batch_size:
+                chunks.append(_records_to_columns(records, _intern))
+                records = []
+    chunks.append(_records_to_columns(records, _intern))
+
+    columns = _concatenate_columns(chunks)
+    columns['strings'] = numpy.array(list(strings), dtype=numpy.str_)
+    return _columns_to_dataframe(columns)
+
+
+def _columns_to_dataframe(columns: dict[str, Any]) -> pandas.DataFrame:
+    strings = columns['strings']
+    # Slicing a list is much faster than splitting the array into one
+    # array per task.
+    offsets = columns['parent_offsets'].tolist()
+    parents = columns['parent_task_ids'].tolist()
+    data = {
+        'task_id': _categorical(columns['task_id'], strings),
+        'function_name': _categorical(columns['function_name'], strings),
+        'parent_task_ids': [
+            parents[start:end] for start, end in zip(offsets[:-1], offsets[1:])
+        ],
+        'submit_time': columns['submit_time'],
+        'received_time': columns['received_time'],
+        'hostname': _categorical(columns['hostname'], strings),
+    }
+    for field in (*EXECUTION_TIME_FIELDS, *_OPTIONAL_FIELDS):
+        data[field] = columns[field]
+    for field in (
+        'cache_hit',
+        'speculative_copies',
+        'retries',
+        'first_failure_time',
+    ):
+        data[field] = columns[field]
+
+    index = pandas.Index(columns['task_id'], name='task_index')
+    return pandas.DataFrame(data, index=index)
+
+
+def iter_columnar(path: pathlib.Path | str) -> Iterator[Record]:
+    """Iterate over the task records of a columnar record directory.
+
+    Args:
+        path: Directory of columnar record chunks.
+
+    Yields:
+        Task records in the format logged by the
+        [`WorkflowExecutor`][webs.executor.workflow.WorkflowExecutor].
+    """
+    columns = _read_columns(path)
+    strings = columns['strings'].tolist()
+    offsets = columns['parent_offsets'].tolist()
+    parents = columns['parent_task_ids'].tolist()
+    lists = {name: columns[name].tolist() for name in columns}
+    for i, task_id in enumerate(lists['task_id']):
+        hostname = lists['hostname'][i]
+        execution = (
+            None
+            if hostname == -1
+            else {
+                'hostname': strings[hostname],
+                **{field: lists[field][i] for field in EXECUTION_TIME_FIELDS},
+            }
+        )
+        if execution is not None and not math.isnan(lists['user_time'][i]):
+            resources = {
+                field: _none_if_nan(lists[field][i])
+                for field in RESOURCE_FIELDS
+            }
+            # Resource fields other than the CPU times are counts.
+            execution['resources'] = {
+                field: value
+                if value is None or field.endswith('_time')
+                else int(value)
+                for field, value in resources.items()
+            }
+        if execution is not None and not math.isnan(lists['clock_offset'][i]):
+            for field in CLOCK_OFFSET_FIELDS:
+                execution[field] = lists[field][i]
+        if execution is not None and any(
+            not math.isnan(lists[field][i]) for field in PAYLOAD_FIELDS
+        ):
+            execution['payload'] = {
+                field: (
+                    None
+                    if math.isnan(lists[field][i])
+                    else int(lists[field][i])
+                )
+                for field in PAYLOAD_FIELDS
+            }
+        yield {
+            'task_id': strings[task_id],
+            'function_name': strings[lists['function_name'][i]],
+            'parent_task_ids': [
+                strings[p] for p in parents[offsets[i] : offsets[i + 1]]
+            ],
+            'submit_time': lists['submit_time'][i],
+            'received_time': _none_if_nan(lists['received_time'][i]),
+            'execution': execution,
+            'cache_hit': lists['cache_hit'][i],
+            'speculative_copies': lists['speculative_copies'][i],
+            'retries': lists['retries'][i],
+            'first_failure_time': _none_if_nan(
+                lists['first_failure_time'][i],
+            ),
+        }
+
+
+def json_to_columnar(
+    json_path: pathlib.Path | str,
+    columnar_path: pathlib.Path | str,
+    *,
+    chunk_size: int = 65536,
+    compress: bool = False,
+) -> None:
+    """Convert JSON lines task records to the columnar format.
+
+    Args:
+        json_path: JSON lines file written by a
+            [`JSONRecordLogger`][webs.record.JSONRecordLogger].
+        columnar_path: Directory to write columnar record chunks to.
+        chunk_size: Number of records per chunk.
+        compress: Compress the chunks.
+    """
+    with open(json_path) as f, ColumnarRecordLogger(
+        columnar_path,
+        chunk_size=chunk_size,
+        compress=compress,
+    ) as logger:
+        for line in f:
+            if line.strip():
+                logger.log(json.loads(line))
+
+
+def columnar_to_json(
+    columnar_path: pathlib.Path | str,
+    json_path: pathlib.Path | str,
+) -> None:
+    """Convert columnar task records to JSON lines.
+
+    Args:
+        columnar_path: Directory of columnar record chunks.
+        json_path: JSON lines file to write records to. The file is
+            overwritten if it exists.
+    """
+    with open(json_path, 'w') as f:
+        for record in iter_columnar(columnar_path):
+            f.write(json.dumps(record) + '\n')
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
 import webs.data.file
+import webs.data.npy
 import webs.data.null
 import webs.data.proxy
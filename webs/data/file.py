@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import mmap
 import pathlib
 import pickle
+import struct
 import uuid
 from typing import Any
 from typing import NamedTuple
@@ -15,16 +17,33 @@ from webs.data.transform import TransformerConfig
 
 T = TypeVar('T')
 
+# Header of files written with out-of-band buffers: magic bytes followed by
+# the offset and length of the metadata. Pickled files start with the
+# PROTO opcode (0x80) so cannot be confused with the magic bytes.
+_MAGIC = b'WEBSOOB1'
+_HEADER = struct.Struct('<8sQQ')
+# Segments are aligned so they can be memory mapped.
+_ALIGNMENT = mmap.ALLOCATIONGRANULARITY
+
 
 @register(name='file')
 class PickleFileTransformerConfig(TransformerConfig):
     """Pickle file transformer config."""
 
     file_dir: str = Field(description='Object file directory')
+    file_out_of_band: bool = Field(
+        False,
+        description=(
+            'pickle with protocol 5 and write large buffers as raw segments'
+        ),
+    )
 
     def get_transformer(self) -> PickleFileTransformer:
         """Create a transformer instance from the config."""
-        return PickleFileTransformer(self.file_dir)
+        return PickleFileTransformer(
+            self.file_dir,
+            out_of_band=self.file_out_of_band,
+        )
 
     @field_validator('file_dir', mode='before')
     @classmethod
@@ -48,18 +67,43 @@ class Identifier(NamedTuple):
         return self.cache_dir / str(self.obj_id)
 
 
+def _write_all(f: Any, data: memoryview) -> None:
+    # Raw file writes may be partial.
+    while len(data) > 0:
+        data = data[f.write(data) :]
+
+
 class PickleFileTransformer:
     """Pickle file object transformer.
 
+    With out-of-band buffers enabled, objects are pickled with protocol 5
+    and large buffers which support out-of-band pickling (e.g.,
+    NumPy arrays and [`PickleBuffer`][pickle.PickleBuffer]) are written as
+    raw segments of the file rather than copied into the pickled bytes.
+    Segments are aligned to the memory page size so that, when the object
+    is resolved, each buffer is rebuilt from a copy-on-write memory map of
+    its segment rather than read into an intermediate copy. Pages of a
+    buffer are only read when accessed. The pickled bytes and the location
+    of each segment are stored after the segments. Files written without
+    out-of-band buffers can always be resolved.
+
     Args:
         cache_dir: Directory to store pickled objects in.
+        out_of_band: Write large buffers out-of-band.
+        min_buffer_size: Minimum size in bytes of a buffer to write
+            out-of-band. Smaller buffers are pickled in-band.
     """
 
     def __init__(
         self,
         cache_dir: pathlib.Path | str,
+        *,
+        out_of_band: bool = False,
+        min_buffer_size: int = 65536,
     ) -> None:
         self.cache_dir = pathlib.Path(cache_dir).resolve()
+        self.out_of_band = out_of_band
+        self.min_buffer_size = min_buffer_size
 
     def is_identifier(self, obj: Any) -> bool:
         """Check if the object is an identifier instance."""
@@ -79,10 +123,68 @@ class PickleFileTransformer:
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
         with open(filepath, 'wb', buffering=0) as f:
-            pickle.dump(obj, f)
+            if self.out_of_band:
+                self._dump_out_of_band(obj, f)
+            else:
+                pickle.dump(obj, f)
 
         return identifier
 
+    def _dump_out_of_band(self, obj: Any, f: Any) -> None:
+        buffers: list[memoryview] = []
+
+        def _buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+            raw = buffer.raw()
+            if raw.nbytes < self.min_buffer_size:
+                return True
+            buffers.append(raw)
+            return False
+
+        data = pickle.dumps(obj, protocol=5, buffer_callback=_buffer_callback)
+
+        segments: list[tuple[int, int]] = []
+        offset = _HEADER.size
+        for buffer in buffers:
+            # Seeking past the end leaves a hole rather than writing padding.
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+            f.seek(offset)
+            _write_all(f, buffer)
+            segments.append((offset, buffer.nbytes))
+            offset += buffer.nbytes
+
+        metadata = pickle.dumps(
+            (data, segments),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        f.seek(offset)
+        _write_all(f, memoryview(metadata))
+        f.seek(0)
+        _write_all(
+            f,
+            memoryview(_HEADER.pack(_MAGIC, offset, len(metadata))),
+        )
+
+    def _load_out_of_band(self, f: Any, header: bytes) -> Any:
+        _, offset, length = _HEADER.unpack(header)
+        f.seek(offset)
+        data, segments = pickle.loads(f.read(length))
+
+        # Copy-on-write maps of the segments are writable like the original
+        # buffers but pages are only read from the file when accessed and
+        # are only copied when written to.
+        buffers = [
+            mmap.mmap(
+                f.fileno(),
+                segment_length,
+                access=mmap.ACCESS_COPY,
+                offset=segment_offset,
+            )
+            if segment_length > 0
+            else bytearray()
+            for segment_offset, segment_length in segments
+        ]
+        return pickle.loads(data, buffers=buffers)
+
     def resolve(self, identifier: Identifier) -> Any:
         """Resolve an object from an identifier.
 
@@ -94,5 +196,17 @@ class PickleFileTransformer:
         """
         filepath = identifier.path()
         with open(filepath, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if header.startswith(_MAGIC):
+                return self._load_out_of_band(f, header)
+            f.seek(0)
             obj = pickle.load(f)
         return obj
+
+    def evict(self, identifier: Identifier) -> None:
+        """Delete the file of an identifier.
+
+        Args:
+            identifier: Identifier to an object.
+        """
+        identifier.path().unlink(missing_ok=True)
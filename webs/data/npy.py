@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import pathlib
+import uuid
+from typing import Any
+from typing import Literal
+from typing import NamedTuple
+from typing import TypeVar
+
+from pydantic import Field
+from pydantic import field_validator
+
+try:
+    import numpy
+
+    NUMPY_IMPORT_ERROR = None
+except ImportError as e:  # pragma: no cover
+    NUMPY_IMPORT_ERROR = e
+
+from webs.data.config import register
+from webs.data.file import Identifier
+from webs.data.file import PickleFileTransformer
+from webs.data.transform import TransformerConfig
+
+T = TypeVar('T')
+
+
+@register(name='npy-mmap')
+class NumpyMmapTransformerConfig(TransformerConfig):
+    """Memory-mapped NumPy array transformer config."""
+
+    npy_dir: str = Field(description='array file directory')
+    npy_mmap_mode: Literal['r', 'c'] = Field(
+        'r',
+        description=(
+            'memory map mode of resolved arrays (r for read-only or c for '
+            'copy-on-write)'
+        ),
+    )
+
+    def get_transformer(self) -> NumpyMmapTransformer:
+        """Create a transformer instance from the config."""
+        return NumpyMmapTransformer(self.npy_dir, mmap_mode=self.npy_mmap_mode)
+
+    @field_validator('npy_dir', mode='before')
+    @classmethod
+    def _resolve_npy_dir(cls, path: str) -> str:
+        return str(pathlib.Path(path).resolve())
+
+
+class ArrayIdentifier(NamedTuple):
+    """Array identifier.
+
+    Attributes:
+        cache_dir: Array directory.
+        obj_id: Array ID.
+    """
+
+    cache_dir: pathlib.Path
+    obj_id: uuid.UUID
+
+    def path(self) -> pathlib.Path:
+        """Get path to the array."""
+        return self.cache_dir / f'{self.obj_id}.npy'
+
+
+class NumpyMmapTransformer:
+    """Memory-mapped NumPy array transformer.
+
+    NumPy arrays are saved as `.npy` files and are resolved as memory-mapped
+    arrays (see [`numpy.load()`][numpy.load]) so the pages of an array are
+    only read from the file when accessed. A task which reads part of an
+    array (e.g., a tile of a matrix) only reads that part from the file,
+    and arrays larger than the memory of a worker can be passed to tasks.
+    Other objects, including arrays of Python objects which cannot be
+    memory-mapped and instances of array subclasses (e.g., masked arrays)
+    whose attributes are not saved in `.npy` files, are pickled as with the
+    [`PickleFileTransformer`][webs.data.file.PickleFileTransformer].
+
+    Args:
+        cache_dir: Directory to store arrays and pickled objects in.
+        mmap_mode: Mode of the memory map of resolved arrays. Resolved
+            arrays are read-only with `'r'`. With `'c'`, resolved arrays
+            can be written to but changes are not written to the file.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: pathlib.Path | str,
+        *,
+        mmap_mode: Literal['r', 'c'] = 'r',
+    ) -> None:
+        if NUMPY_IMPORT_ERROR is not None:  # pragma: no cover
+            raise NUMPY_IMPORT_ERROR
+
+        self.cache_dir = pathlib.Path(cache_dir).resolve()
+        self.mmap_mode = mmap_mode
+        self._pickle = PickleFileTransformer(self.cache_dir)
+
+    def is_identifier(self, obj: Any) -> bool:
+        """Check if the object is an identifier instance."""
+        return isinstance(obj, (ArrayIdentifier, Identifier))
+
+    def transform(self, obj: T) -> ArrayIdentifier | Identifier:
+        """Transform the object into an identifier.
+
+        Args:
+            obj: Object to transform.
+
+        Returns:
+            Identifier object that can be used to resolve `obj`.
+        """
+        # Subclasses of ndarray (e.g., masked arrays) are not preserved by
+        # numpy.save() so they are pickled instead.
+        if (
+            not isinstance(obj, numpy.ndarray)
+            or type(obj) is not numpy.ndarray
+            or obj.dtype.hasobject
+        ):
+            return self._pickle.transform(obj)
+
+        identifier = ArrayIdentifier(self.cache_dir, uuid.uuid4())
+        filepath = identifier.path()
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filepath, 'wb') as f:
+            numpy.save(f, obj, allow_pickle=False)
+
+        return identifier
+
+    def resolve(self, identifier: ArrayIdentifier | Identifier) -> Any:
+        """Resolve an object from an identifier.
+
+        Args:
+            identifier: Identifier to an object.
+
+        Returns:
+            The resolved object.
+        """
+        if isinstance(identifier, Identifier):
+            return self._pickle.resolve(identifier)
+        return numpy.load(identifier.path(), mmap_mode=self.mmap_mode)
+
+    def evict(self, identifier: ArrayIdentifier | Identifier) -> None:
+        """Delete the file of an identifier.
+
+        Resolved arrays remain valid after the file is deleted.
+
+        Args:
+            identifier: Identifier to an object.
+        """
+        identifier.path().unlink(missing_ok=True)
@@ -52,3 +52,13 @@ class NullTransformer:
         raise NotImplementedError(
             f'{self.__class__.__name__} does not support identifiers',
         )
+
+    def evict(self, identifier: Any) -> NoReturn:
+        """Evict the object of an identifier.
+
+        Args:
+            identifier: Identifier to an object.
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__} does not support identifiers',
+        )
@@ -12,6 +12,7 @@ from proxystore.connectors.redis import RedisConnector
 from proxystore.proxy import extract
 from proxystore.proxy import Proxy
 from proxystore.store import Store
+from proxystore.store.utils import get_key
 from pydantic import Field
 from pydantic import field_validator
 
@@ -123,3 +124,15 @@ class ProxyTransformer:
             on the setting of `extract_target`.
         """
         return extract(identifier) if self.extract_target else identifier
+
+    def evict(self, identifier: Proxy[T]) -> None:
+        """Evict the object of an identifier from the store.
+
+        Warning:
+            Proxies of the object which were not yet resolved can no longer
+            be resolved.
+
+        Args:
+            identifier: Identifier to an object.
+        """
+        self.store.evict(get_key(identifier))
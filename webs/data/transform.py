@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import abc
+import collections
+import hashlib
+import pickle
+import threading
 from concurrent.futures import Future
 from typing import Any
 from typing import Generic
@@ -10,6 +14,8 @@ from typing import Protocol
 from typing import runtime_checkable
 from typing import TypeVar
 
+from dask.distributed import Future as DaskFuture
+
 from webs.config import Config
 from webs.data.filter import Filter
 from webs.data.filter import NullFilter
@@ -18,6 +24,53 @@ K = TypeVar('K')
 T = TypeVar('T')
 IdentifierT = TypeVar('IdentifierT')
 
+# Types whose instances cannot change so an object which was transformed
+# before can be matched by identity alone.
+_IMMUTABLE_TYPES = (bytes, str, int, float, complex, frozenset, range)
+
+
+class _HashWriter:
+    # File-like object which hashes the bytes written.
+    __slots__ = ('hasher',)
+
+    def __init__(self, hasher: Any) -> None:
+        self.hasher = hasher
+
+    def write(self, data: bytes) -> int:
+        self.hasher.update(data)
+        return len(data)
+
+
+def content_hash(obj: Any) -> bytes | None:
+    """Compute a hash of the content of an object.
+
+    The object is pickled with protocol 5 into a hash so large buffers which
+    support out-of-band pickling (e.g., NumPy arrays) are hashed in place
+    rather than copied into the pickled bytes. Objects with equal pickled
+    bytes have equal hashes.
+
+    Returns:
+        BLAKE2b digest of the object or `None` if the object cannot be \
+        pickled.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+
+    def _buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        raw = buffer.raw()
+        hasher.update(len(raw).to_bytes(8, 'little'))
+        hasher.update(raw)
+        return False
+
+    try:
+        pickle.Pickler(
+            _HashWriter(hasher),
+            protocol=5,
+            buffer_callback=_buffer_callback,
+        ).dump(obj)
+    except Exception:
+        return None
+    return hasher.digest()
+
 
 class TransformerConfig(Config, abc.ABC):
     """Data transformer configuration abstract base class."""
@@ -58,6 +111,17 @@ class Transformer(Protocol[IdentifierT]):
         """
         ...
 
+    def evict(self, identifier: IdentifierT) -> None:
+        """Evict the object of an identifier.
+
+        The identifier, and any copies of it, cannot be resolved after the
+        object is evicted.
+
+        Args:
+            identifier: Identifier to an object.
+        """
+        ...
+
 
 class TaskDataTransformer(Generic[IdentifierT]):
     """Task data transformer.
@@ -67,31 +131,122 @@ class TaskDataTransformer(Generic[IdentifierT]):
     [`Filter`][webs.data.filter.Filter] into useful methods for transforming
     the positional arguments, keyword arguments, and results of tasks.
 
+    With deduplication enabled, an object is only transformed the first
+    time it is seen and the identifier is reused for any later object with
+    the same content (see
+    [`content_hash()`][webs.data.transform.content_hash]).
+    Instances of immutable built-in types which were transformed recently
+    are matched by identity without hashing. Deduplication requires that
+    identifiers can be resolved more than once. The deduplication state is
+    local to each process and is not pickled with the transformer.
+
+    With eviction on resolve, the object of an identifier is evicted once
+    the identifier is resolved so each transformed object must be resolved
+    exactly once (e.g., an argument passed to a single task whose result is
+    retrieved once).
+
     Args:
         transformer: Object transformer.
         filter_: A filter which when called on an object returns `True` if
             the object should be transformed.
+        dedup: Reuse the identifier of objects which were already
+            transformed.
+        identity_cache_size: Maximum number of recently transformed
+            immutable objects to match by identity. The objects are kept
+            alive while in the cache.
+        evict_on_resolve: Evict the object of an identifier after resolving
+            the identifier.
+
+    Raises:
+        ValueError: If both `dedup` and `evict_on_resolve` are enabled.
     """
 
     def __init__(
         self,
         transformer: Transformer[IdentifierT],
         filter_: Filter | None = None,
+        *,
+        dedup: bool = False,
+        identity_cache_size: int = 64,
+        evict_on_resolve: bool = False,
     ) -> None:
+        if dedup and evict_on_resolve:
+            raise ValueError(
+                'Deduplication and eviction on resolve are incompatible '
+                'because deduplicated identifiers are resolved many times.',
+            )
         self.transformer = transformer
         self.filter_ = NullFilter() if filter_ is None else filter_
+        self.dedup = dedup
+        self.identity_cache_size = identity_cache_size
+        self.evict_on_resolve = evict_on_resolve
+        self._init_dedup()
+
+    def _init_dedup(self) -> None:
+        self._by_hash: dict[bytes, IdentifierT] = {}
+        # Content hash of each identifier in _by_hash by identity.
+        self._hash_of: dict[int, bytes] = {}
+        self._by_identity: collections.OrderedDict[
+            int,
+            tuple[Any, IdentifierT],
+        ] = collections.OrderedDict()
+        self._dedup_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in ('_by_hash', '_hash_of', '_by_identity', '_dedup_lock'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_dedup()
 
     def transform(self, obj: T) -> T | IdentifierT:
         """Transform an object.
 
         Transforms `obj` into an identifier if it passes the filter check.
-        The identifier can later be used to resolve the object.
+        The identifier can later be used to resolve the object. Futures are
+        never transformed because they are resolved by the compute executor.
         """
-        if self.filter_(obj) and not isinstance(obj, Future):
+        if self.filter_(obj) and not isinstance(obj, (Future, DaskFuture)):
+            if self.dedup:
+                return self._transform_dedup(obj)
             return self.transformer.transform(obj)
         else:
             return obj
 
+    def _transform_dedup(self, obj: T) -> IdentifierT:
+        immutable = type(obj) in _IMMUTABLE_TYPES
+        if immutable:
+            with self._dedup_lock:
+                cached = self._by_identity.get(id(obj))
+                if cached is not None and cached[0] is obj:
+                    self._by_identity.move_to_end(id(obj))
+                    return cached[1]
+
+        key = content_hash(obj)
+        if key is None:
+            return self.transformer.transform(obj)
+
+        with self._dedup_lock:
+            identifier = self._by_hash.get(key)
+        if identifier is None:
+            # Concurrent transforms of equal objects may each store the
+            # object but only the first identifier is kept.
+            identifier = self.transformer.transform(obj)
+            with self._dedup_lock:
+                identifier = self._by_hash.setdefault(key, identifier)
+                self._hash_of[id(identifier)] = key
+
+        if immutable and self.identity_cache_size > 0:
+            with self._dedup_lock:
+                self._by_identity[id(obj)] = (obj, identifier)
+                self._by_identity.move_to_end(id(obj))
+                while len(self._by_identity) > self.identity_cache_size:
+                    self._by_identity.popitem(last=False)
+        return identifier
+
     def transform_iterable(
         self,
         iterable: Iterable[T],
@@ -110,7 +265,10 @@ class TaskDataTransformer(Generic[IdentifierT]):
         passed object.
         """
         if self.transformer.is_identifier(obj):
-            return self.transformer.resolve(obj)
+            resolved = self.transformer.resolve(obj)
+            if self.evict_on_resolve:
+                self.transformer.evict(obj)
+            return resolved
         else:
             return obj
 
@@ -121,3 +279,19 @@ class TaskDataTransformer(Generic[IdentifierT]):
     def resolve_mapping(self, mapping: Mapping[K, Any]) -> dict[K, Any]:
         """Resolve each value in a mapping."""
         return {k: self.resolve(v) for k, v in mapping.items()}
+
+    def evict(self, identifier: IdentifierT) -> None:
+        """Evict the object of an identifier.
+
+        The identifier is also forgotten by the deduplication so later
+        objects with the same content are transformed again.
+        """
+        if self.dedup:
+            with self._dedup_lock:
+                key = self._hash_of.pop(id(identifier), None)
+                if key is not None:
+                    del self._by_hash[key]
+                for obj_id, (_, cached) in list(self._by_identity.items()):
+                    if cached is identifier:
+                        del self._by_identity[obj_id]
+        self.transformer.evict(identifier)
@@ -0,0 +1,327 @@
+"""Asyncio front-end for the workflow executor.
+
+[`TaskFuture`][webs.executor.workflow.TaskFuture] instances are awaitable
+within a running event loop. This module provides an
+[`AsyncWorkflowExecutor`][webs.executor.aio.AsyncWorkflowExecutor] and
+asyncio-native [`as_completed()`][webs.executor.aio.as_completed] and
+[`wait()`][webs.executor.aio.wait] which are notified by task done callbacks
+rather than blocking a thread per waiter.
+
+Example:
+    ```python
+    async def main(executor: WorkflowExecutor) -> None:
+        async with AsyncWorkflowExecutor(executor) as aexecutor:
+            train = aexecutor.submit(train_model, data)
+            sims = [aexecutor.submit(simulate, x) for x in batch]
+            async for task in as_completed(sims):
+                ...
+            model = await train
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+from types import TracebackType
+from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import Iterable
+from typing import Literal
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+if sys.version_info >= (3, 10):  # pragma: >=3.10 cover
+    from typing import ParamSpec
+else:  # pragma: <3.10 cover
+    from typing_extensions import ParamSpec
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from webs.executor.workflow import TaskFuture
+    from webs.executor.workflow import WorkflowExecutor
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+def completion_future(
+    task: TaskFuture[T],
+    loop: asyncio.AbstractEventLoop | None = None,
+) -> asyncio.Future[TaskFuture[T]]:
+    """Create an asyncio future which is set when a task completes.
+
+    The asyncio future is set to the task itself, rather than the task
+    result, so that completion can be awaited without resolving (and
+    possibly transferring) the task result.
+
+    Args:
+        task: Task to observe.
+        loop: Event loop to create the future in. Defaults to the running
+            event loop.
+
+    Returns:
+        Future set to `task` once `task` completes or is cancelled.
+    """
+    loop = asyncio.get_running_loop() if loop is None else loop
+    future: asyncio.Future[TaskFuture[T]] = loop.create_future()
+
+    def _set_result() -> None:
+        if not future.done():
+            future.set_result(task)
+
+    def _callback(_: TaskFuture[T]) -> None:
+        # The callback is invoked by the compute executor in another thread
+        # so the future must be set in the thread of the event loop. The
+        # loop may have been closed before the task completed.
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_set_result)
+
+    task.add_done_callback(_callback)
+    return future
+
+
+async def result(task: TaskFuture[T]) -> T:
+    """Wait for a task to complete and return its result.
+
+    This is the implementation of `await task`. If the result was
+    transformed into an identifier, the result is resolved (and stored in
+    the task cache) in the default executor of the event loop so the I/O of
+    the data transformer does not block the event loop.
+
+    Raises:
+        Exception: Any exception raised by the task.
+    """
+    await completion_future(task)
+    task_result = task._future.result()
+    if task._data_transformer.transformer.is_identifier(task_result.result):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, task.result)
+    return task.result()
+
+
+async def as_completed(
+    tasks: Iterable[TaskFuture[T]],
+    timeout: float | None = None,
+) -> AsyncGenerator[TaskFuture[T], None]:
+    """Asynchronously yield tasks as they complete.
+
+    Asyncio equivalent of
+    [`as_completed()`][webs.executor.workflow.as_completed].
+
+    Args:
+        tasks: Tasks to wait on.
+        timeout: Seconds to wait on all tasks to complete. `None` means no
+            limit.
+
+    Yields:
+        Each task in `tasks` as it completes.
+
+    Raises:
+        TimeoutError: If all tasks have not completed within `timeout`
+            seconds.
+    """
+    loop = asyncio.get_running_loop()
+    completed: asyncio.Queue[TaskFuture[T]] = asyncio.Queue()
+    pending = 0
+    for task in tasks:
+        completion_future(task, loop).add_done_callback(
+            lambda f: completed.put_nowait(f.result()),
+        )
+        pending += 1
+
+    end_time = None if timeout is None else loop.time() + timeout
+    while pending > 0:
+        remaining = None if end_time is None else end_time - loop.time()
+        try:
+            task = await asyncio.wait_for(completed.get(), remaining)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f'{pending} tasks did not complete within {timeout} seconds.',
+            ) from None
+        pending -= 1
+        yield task
+
+
+def _raised(task: TaskFuture[Any]) -> bool:
+    return not task._future.cancelled() and task.exception() is not None
+
+
+async def wait(
+    tasks: Iterable[TaskFuture[T]],
+    timeout: float | None = None,
+    return_when: Literal[
+        'FIRST_COMPLETED',
+        'FIRST_EXCEPTION',
+        'ALL_COMPLETED',
+    ] = 'ALL_COMPLETED',
+) -> tuple[set[TaskFuture[T]], set[TaskFuture[T]]]:
+    """Asynchronously wait for tasks to finish.
+
+    Asyncio equivalent of [`wait()`][webs.executor.workflow.wait].
+
+    Args:
+        tasks: Tasks to wait on.
+        timeout: Seconds to wait on tasks to complete. `None` means no limit.
+        return_when: Indicate when this function should return. Same as
+            [`asyncio.wait()`][asyncio.wait].
+
+    Returns:
+        Tuple containing the set of tasks that completed (finished or \
+        cancelled) before the wait completed and the set of tasks that \
+        did not complete.
+    """
+    task_list = list(tasks)
+    if len(task_list) == 0:
+        return set(), set()
+
+    loop = asyncio.get_running_loop()
+    futures = {completion_future(task, loop): task for task in task_list}
+    if return_when == 'FIRST_EXCEPTION':
+        # Completion futures never raise so an exception must be detected
+        # from the underlying task.
+        done_futures: set[asyncio.Future[Any]] = set()
+        pending_futures = set(futures)
+        end_time = None if timeout is None else loop.time() + timeout
+        while len(pending_futures) > 0:
+            remaining = None if end_time is None else end_time - loop.time()
+            finished, pending_futures = await asyncio.wait(
+                pending_futures,
+                timeout=remaining,
+                return_when='FIRST_COMPLETED',
+            )
+            done_futures.update(finished)
+            if len(finished) == 0 or any(
+                _raised(futures[f]) for f in finished
+            ):
+                break
+    else:
+        done_futures, pending_futures = await asyncio.wait(
+            futures,
+            timeout=timeout,
+            return_when=return_when,
+        )
+
+    for future in pending_futures:
+        future.cancel()
+    return (
+        {futures[f] for f in done_futures},
+        {futures[f] for f in pending_futures},
+    )
+
+
+class AsyncWorkflowExecutor:
+    """Asyncio front-end for a workflow executor.
+
+    Tasks are submitted to the wrapped
+    [`WorkflowExecutor`][webs.executor.workflow.WorkflowExecutor] and the
+    returned [`TaskFuture`][webs.executor.workflow.TaskFuture] can be awaited
+    so a single event loop can overlap waiting on many phases of a workflow.
+
+    Args:
+        executor: Workflow executor to submit tasks to.
+    """
+
+    def __init__(self, executor: WorkflowExecutor) -> None:
+        self.executor = executor
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        await self.shutdown()
+
+    @property
+    def tasks_executed(self) -> int:
+        """Total number of tasks submitted for execution."""
+        return self.executor.tasks_executed
+
+    def submit(
+        self,
+        function: Callable[P, T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> TaskFuture[T]:
+        """Schedule the callable to be executed.
+
+        Arguments which are task futures are passed to the compute executor
+        as dependencies, same as
+        [`WorkflowExecutor.submit()`][webs.executor.workflow.WorkflowExecutor.submit].
+
+        Returns:
+            Awaitable [`TaskFuture`][webs.executor.workflow.TaskFuture] \
+            representing the execution of the callable.
+        """
+        return self.executor.submit(function, *args, **kwargs)
+
+    async def map(
+        self,
+        function: Callable[..., T],
+        *iterables: Iterable[Any],
+        timeout: float | None = None,
+    ) -> AsyncGenerator[T, None]:
+        """Asynchronously map a function onto iterables of arguments.
+
+        Tasks are submitted immediately and results are yielded in the order
+        of the arguments.
+
+        Args:
+            function: A callable that will take as many arguments as there
+                are passed iterables.
+            iterables: Variable number of iterables.
+            timeout: The maximum number of seconds to wait. If None, then
+                there is no limit on the wait time.
+
+        Yields:
+            Results of the tasks in order.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be
+                generated before the given timeout.
+        """
+        tasks = self.executor.submit_many(function, list(zip(*iterables)))
+        # Reverse to keep finishing order and pop from the end in O(1).
+        tasks.reverse()
+        loop = asyncio.get_running_loop()
+        end_time = None if timeout is None else loop.time() + timeout
+        try:
+            while len(tasks) > 0:
+                task = tasks.pop()
+                remaining = (
+                    None if end_time is None else end_time - loop.time()
+                )
+                try:
+                    yield await asyncio.wait_for(result(task), remaining)
+                except asyncio.TimeoutError:
+                    raise TimeoutError() from None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def shutdown(self, cancel_futures: bool = False) -> None:
+        """Shutdown the wrapped executor without blocking the event loop.
+
+        Args:
+            cancel_futures: Cancel all pending futures that the executor
+                has not started running.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self.executor.shutdown(
+                wait=True,
+                cancel_futures=cancel_futures,
+            ),
+        )
@@ -0,0 +1,295 @@
+"""Content-addressed task result memoization cache.
+
+A [`TaskCache`][webs.executor.cache.TaskCache] maps a key derived from a
+task's function and arguments to the result of the task. Results are stored
+in a bounded in-memory LRU tier and, optionally, a size-bounded on-disk tier
+which persists across runs when a shared directory is used.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import threading
+from typing import Any
+from typing import Callable
+from typing import Mapping
+from typing import NamedTuple
+from typing import Sequence
+
+logger = logging.getLogger(__name__)
+
+_KEY_PICKLE_PROTOCOL = 4
+
+
+class CacheKeyRef(NamedTuple):
+    """Placeholder for the result of a parent task within a cache key.
+
+    Arguments which are task futures are replaced with the cache key of the
+    parent task so the key of a child task does not depend on the result of
+    the parent being available.
+
+    Attributes:
+        key: Cache key of the parent task.
+    """
+
+    key: str
+
+
+class _Unordered(NamedTuple):
+    # Canonical form of a set or dict within a cache key.
+    type_name: str
+    items: tuple[bytes, ...]
+
+
+def _canonical(obj: Any) -> Any:
+    # Replace sets and dicts, including those nested in lists and tuples,
+    # with their pickled elements in sorted order so the key does not
+    # depend on iteration order (e.g., the order of a set of strings varies
+    # with hash randomization and a dict keeps its insertion order).
+    kind = type(obj)
+    if kind is list or kind is tuple:
+        return kind(_canonical(item) for item in obj)
+    if kind is set or kind is frozenset:
+        return _Unordered(
+            kind.__name__,
+            tuple(sorted(_canonical_bytes(item) for item in obj)),
+        )
+    if kind is dict:
+        return _Unordered(
+            kind.__name__,
+            tuple(sorted(_canonical_bytes(item) for item in obj.items())),
+        )
+    return obj
+
+
+def _canonical_bytes(obj: Any) -> bytes:
+    return pickle.dumps(_canonical(obj), protocol=_KEY_PICKLE_PROTOCOL)
+
+
+def _captured_state(function: Callable[..., Any]) -> tuple[Any, ...]:
+    # Functions created by separate calls of the same factory share a
+    # qualified name but may capture different values in their closure or
+    # default arguments.
+    closure = getattr(function, '__closure__', None) or ()
+    return (
+        tuple(cell.cell_contents for cell in closure),
+        getattr(function, '__defaults__', None),
+        getattr(function, '__kwdefaults__', None),
+    )
+
+
+def cache_key(
+    function: Callable[..., Any],
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+) -> str | None:
+    """Compute the cache key of a task.
+
+    The key is the SHA-256 digest of the pickled fully qualified name of
+    `function`, the values captured by the closure and default arguments of
+    `function`, and the arguments. Arguments should already have task
+    futures replaced with [`CacheKeyRef`][webs.executor.cache.CacheKeyRef]
+    objects.
+
+    Sets and dicts passed as arguments, or nested in lists and tuples
+    passed as arguments, are pickled in a canonical order so equal
+    arguments have the same key. Other objects are pickled as is so an
+    object whose pickle depends on iteration order (e.g., an object with a
+    set of strings attribute) may have a different key in each run.
+
+    Returns:
+        Hex digest key or `None` if the task cannot be cached because the \
+        function has no qualified name or the captured values or arguments \
+        cannot be pickled.
+    """
+    qualname = getattr(function, '__qualname__', None)
+    if qualname is None:
+        return None
+    name = f'{getattr(function, "__module__", None)}.{qualname}'
+    try:
+        data = _canonical_bytes(
+            (name, _captured_state(function), tuple(args), dict(kwargs)),
+        )
+    except Exception:
+        return None
+    return hashlib.sha256(data).hexdigest()
+
+
+class TaskCache:
+    """Two-tier task result cache.
+
+    The in-memory tier holds up to `max_memory_items` results and evicts the
+    least recently used result. If `cache_dir` is provided, results are also
+    pickled to files in the directory named by their key. The total size of
+    the files is bounded by `max_disk_bytes` with the least recently used
+    files evicted first. Files in `cache_dir` from previous runs are reused.
+
+    Note:
+        All methods are thread-safe because results are typically stored
+        by done callbacks invoked in the threads of the compute executor.
+        Results are pickled and files are read and written without holding
+        the lock of the cache.
+
+    Note:
+        Results in the in-memory tier are returned without copying so each
+        lookup of a key returns the same object. Results should not be
+        mutated by the caller.
+
+    Attributes:
+        hits: Number of lookups which found a result.
+        misses: Number of lookups which did not find a result.
+
+    Args:
+        cache_dir: Optional directory for the on-disk tier.
+        max_memory_items: Maximum number of results in the in-memory tier.
+        max_disk_bytes: Maximum total bytes of the on-disk tier.
+    """
+
+    def __init__(
+        self,
+        cache_dir: pathlib.Path | str | None = None,
+        *,
+        max_memory_items: int = 1024,
+        max_disk_bytes: int = 2**30,
+    ) -> None:
+        self.cache_dir = (
+            None if cache_dir is None else pathlib.Path(cache_dir).resolve()
+        )
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._memory: collections.OrderedDict[str, Any] = (
+            collections.OrderedDict()
+        )
+        # Maps keys to file sizes in least to most recently used order.
+        self._disk: collections.OrderedDict[str, int] = (
+            collections.OrderedDict()
+        )
+        self._disk_bytes = 0
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            files = sorted(
+                (f.stat().st_mtime, f.stem, f.stat().st_size)
+                for f in self.cache_dir.glob('*.pkl')
+            )
+            for _, key, size in files:
+                self._disk[key] = size
+                self._disk_bytes += size
+            self._evict_disk()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._memory or key in self._disk
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory.keys() | self._disk.keys())
+
+    def _path(self, key: str) -> pathlib.Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / f'{key}.pkl'
+
+    def _evict_memory(self) -> None:
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 0:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._path(key).unlink(missing_ok=True)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Get a result from the cache.
+
+        Args:
+            key: Cache key of the task.
+
+        Returns:
+            Tuple of whether the key was found and the result (or `None` if \
+            the key was not found).
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return True, self._memory[key]
+
+            if key not in self._disk:
+                self.misses += 1
+                return False, None
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            with self._lock:
+                # The file may have been evicted while reading.
+                if key in self._disk:
+                    logger.warning(f'Failed to load cache file {path}')
+                    self._disk_bytes -= self._disk.pop(key)
+                    path.unlink(missing_ok=True)
+                self.misses += 1
+            return False, None
+
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+                os.utime(path)
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            self._evict_memory()
+            self.hits += 1
+        return True, result
+
+    def put(self, key: str, result: Any) -> None:
+        """Store a result in the cache.
+
+        Args:
+            key: Cache key of the task.
+            result: Result of the task.
+        """
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            self._evict_memory()
+
+            if self.cache_dir is None or key in self._disk:
+                return
+
+        try:
+            data = pickle.dumps(result)
+        except Exception:
+            logger.warning(f'Failed to pickle result for cache key {key}')
+            return
+        if len(data) > self.max_disk_bytes:
+            return
+
+        # Write to a temporary file and rename so that concurrent writers
+        # and runs sharing the cache directory never read a partial file.
+        path = self._path(key)
+        tmp_path = path.with_suffix(
+            f'.{os.getpid()}.{threading.get_ident()}.tmp',
+        )
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            # The result may have been written concurrently by another put.
+            if key in self._disk:
+                return
+            self._disk[key] = len(data)
+            self._disk_bytes += len(data)
+            self._evict_disk()
@@ -0,0 +1,103 @@
+"""Estimation of the clock offsets of worker hosts.
+
+Worker timestamps in task records are read from the clock of the worker
+host while the submit and received times are read from the clock of the
+client, so clock skew between hosts distorts latencies measured across
+hosts. A [`ClockOffsetEstimator`][webs.executor.clock.ClockOffsetEstimator]
+estimates the offset of the clock of each worker host from the four
+timestamps of each task round trip, similar to NTP.
+
+A task submitted at client time `t0`, which started at host time `t1`,
+ended at host time `t2`, and was received at client time `t3` bounds the
+offset of the host clock (host time minus client time) by
+`t2 - t3 <= offset <= t1 - t0` because a task cannot start before it is
+submitted or be received before it ends. The bounds of the recent tasks of a
+host are intersected so the estimate is at least as tight as the bounds of
+the task with the smallest round trip overhead. The estimate is the midpoint
+of the bounds and the error is half their width.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+from typing import NamedTuple
+
+
+class ClockOffset(NamedTuple):
+    """Estimated clock offset of a host.
+
+    Attributes:
+        offset: Seconds the clock of the host is ahead of the clock of the
+            client. Subtract from host timestamps to get client timestamps.
+        error: Maximum seconds the true offset differs from `offset` by.
+    """
+
+    offset: float
+    error: float
+
+
+class ClockOffsetEstimator:
+    """Estimate the clock offset of each worker host from task round trips.
+
+    Args:
+        window: Number of recent tasks of each host whose bounds are
+            intersected. A smaller window adapts to clock drift faster.
+    """
+
+    def __init__(self, window: int = 64) -> None:
+        if window < 1:
+            raise ValueError('Window must be at least one.')
+        self.window = window
+        self._bounds: dict[str, collections.deque[tuple[float, float]]] = {}
+        self._offsets: dict[str, ClockOffset] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def offsets(self) -> dict[str, ClockOffset]:
+        """Current offset estimate of each host."""
+        with self._lock:
+            return dict(self._offsets)
+
+    def get(self, hostname: str) -> ClockOffset | None:
+        """Get the current offset estimate of a host or `None`."""
+        return self._offsets.get(hostname)
+
+    def update(
+        self,
+        hostname: str,
+        submit_time: float,
+        start_time: float,
+        end_time: float,
+        received_time: float,
+    ) -> ClockOffset:
+        """Update the offset of a host with a task round trip.
+
+        Args:
+            hostname: Host which executed the task.
+            submit_time: Client time the task was submitted.
+            start_time: Host time the task started executing.
+            end_time: Host time the task finished executing.
+            received_time: Client time the result was received.
+
+        Returns:
+            Updated offset estimate of the host.
+        """
+        bound = (end_time - received_time, start_time - submit_time)
+        with self._lock:
+            bounds = self._bounds.get(hostname)
+            if bounds is None:
+                bounds = collections.deque(maxlen=self.window)
+                self._bounds[hostname] = bounds
+            bounds.append(bound)
+            lower = max(b[0] for b in bounds)
+            upper = min(b[1] for b in bounds)
+            if lower > upper:
+                # The bounds are inconsistent (e.g., the clock of the host
+                # drifted or was stepped) so restart from this task.
+                bounds.clear()
+                bounds.append(bound)
+                lower, upper = bound
+            offset = ClockOffset((lower + upper) / 2, (upper - lower) / 2)
+            self._offsets[hostname] = offset
+        return offset
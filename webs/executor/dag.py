@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import functools
+import heapq
 import itertools
 import sys
+import threading
 from concurrent.futures import Executor
 from concurrent.futures import Future
+from concurrent.futures import wait as wait_python
 from types import TracebackType
 from typing import Any
 from typing import Callable
@@ -26,6 +29,36 @@ else:  # pragma: <3.11 cover
 
 P = ParamSpec('P')
 T = TypeVar('T')
+F = TypeVar('F', bound=Callable[..., Any])
+
+TASK_PRIORITY_ATTRIBUTE = 'task_priority'
+"""Name of the function attribute containing the explicit task priority."""
+
+
+def task_priority(priority: int) -> Callable[[F], F]:
+    """Set the explicit scheduling priority of a task function.
+
+    Tasks with a higher priority are submitted first by a
+    [`DAGExecutor`][webs.executor.dag.DAGExecutor] with a limit on running
+    tasks. Explicit priorities take precedence over the critical-path
+    priorities derived from the task graph.
+
+    Example:
+        ```python
+        @task_priority(10)
+        def potrf(tile: np.ndarray) -> np.ndarray:
+            ...
+        ```
+
+    Args:
+        priority: Priority of tasks of the decorated function.
+    """
+
+    def _decorator(function: F) -> F:
+        setattr(function, TASK_PRIORITY_ATTRIBUTE, priority)
+        return function
+
+    return _decorator
 
 
 def _get_chunks(
@@ -55,37 +88,76 @@ class _Task(Generic[P, T]):
         args: P.args,
         kwargs: P.kwargs,
         client_future: Future[T],
+        *,
+        ready_queue: _ReadyQueue | None = None,
     ) -> None:
         self.executor = executor
         self.function = function
         self.args = args
         self.kwargs = kwargs
         self.client_future = client_future
+        self.ready_queue = ready_queue
         self.task_future: Future[T] | None = None
         self.pending_futures: set[Future[Any]] = set()
+        self._registered = False
+        self._failed = False
+        self._lock = threading.Lock()
+
+        # Scheduling priority used by the ready queue. The bottom level is
+        # the length of the longest known path from this task to a task
+        # with no children.
+        self.explicit_priority: int = (
+            getattr(function, TASK_PRIORITY_ATTRIBUTE, None) or 0
+        )
+        self.bottom_level = 0
+        self.parents: list[_Task[Any, Any]] = []
+
+        # All futures are added to the pending set before any callbacks are
+        # registered because a callback is invoked immediately if the
+        # future is already done or completes during registration.
+        self.pending_futures.update(
+            arg for arg in [*args, *kwargs.values()] if isinstance(arg, Future)
+        )
+        for future in list(self.pending_futures):
+            future.add_done_callback(self._pending_future_callback)
 
-        for arg in [*args, *kwargs.values()]:
-            if isinstance(arg, Future) and not arg.done():
-                arg.add_done_callback(self._pending_future_callback)
-                self.pending_futures.add(arg)
+        with self._lock:
+            self._registered = True
+            ready = len(self.pending_futures) == 0 and not self._failed
 
-        if len(self.pending_futures) == 0:
-            self._submit()
+        if ready:
+            self._ready()
+
+    @property
+    def priority(self) -> tuple[int, int]:
+        return (self.explicit_priority, self.bottom_level)
 
     def _pending_future_callback(self, future: Future[Any]) -> None:
         assert future.done()
-        assert len(self.pending_futures) > 0
-        if future in self.pending_futures:
-            self.pending_futures.remove(future)
-        else:  # pragma: no cover
-            return
-
-        if future.cancelled():
+        failed = future.cancelled() or future.exception() is not None
+        with self._lock:
+            self.pending_futures.discard(future)
+            # Only the first failed parent is propagated to the client.
+            propagate = failed and not self._failed
+            self._failed = self._failed or failed
+            ready = (
+                self._registered
+                and len(self.pending_futures) == 0
+                and not self._failed
+            )
+
+        if propagate and future.cancelled():
             self.client_future.cancel()
-        elif future.exception() is not None:
+        elif propagate:
             self.client_future.set_exception(future.exception())
-        elif len(self.pending_futures) == 0:
+        elif ready:
+            self._ready()
+
+    def _ready(self) -> None:
+        if self.ready_queue is None:
             self._submit()
+        else:
+            self.ready_queue.push(self)
 
     def _task_future_callback(self, future: Future[T]) -> None:
         assert future.done()
@@ -96,12 +168,12 @@ class _Task(Generic[P, T]):
         else:
             self.client_future.set_result(future.result())
 
-    def _submit(self) -> None:
+    def _submit(self) -> bool:
         assert self.task_future is None
 
         if not self.client_future.set_running_or_notify_cancel():
             # client_future was cancelled so don't submit the task.
-            return
+            return False
 
         args = tuple(
             arg.result() if isinstance(arg, Future) else arg
@@ -114,6 +186,91 @@ class _Task(Generic[P, T]):
 
         self.task_future = self.executor.submit(self.function, *args, **kwargs)
         self.task_future.add_done_callback(self._task_future_callback)
+        return True
+
+
+class _ReadyQueue:
+    """Priority queue of tasks whose dependencies have completed.
+
+    At most `max_running` tasks are submitted to the wrapped executor at a
+    time. When a submitted task completes, the highest priority ready task
+    is submitted next. Ties are broken by the order tasks became ready.
+
+    Args:
+        max_running: Maximum number of tasks submitted to the wrapped
+            executor which have not completed.
+    """
+
+    def __init__(self, max_running: int) -> None:
+        if max_running < 1:
+            raise ValueError('max_running must be >= 1.')
+        self.max_running = max_running
+        self.running = 0
+        # A task may have multiple entries if its priority changes while
+        # queued. Stale entries are skipped when popped.
+        self._heap: list[tuple[int, int, int, _Task[Any, Any]]] = []
+        self._queued: set[_Task[Any, Any]] = set()
+        self._counter = itertools.count()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queued)
+
+    def _push_entry(self, task: _Task[Any, Any]) -> None:
+        explicit, level = task.priority
+        entry = (-explicit, -level, next(self._counter), task)
+        heapq.heappush(self._heap, entry)
+
+    def push(self, task: _Task[Any, Any]) -> None:
+        """Add a ready task to the queue and submit tasks if possible."""
+        with self._lock:
+            self._queued.add(task)
+            self._push_entry(task)
+        self._dispatch()
+
+    def reprioritize(self, task: _Task[Any, Any]) -> None:
+        """Update the position of a task after its priority increased."""
+        with self._lock:
+            if task in self._queued:
+                self._push_entry(task)
+
+    def _pop(self) -> _Task[Any, Any] | None:
+        while len(self._heap) > 0:
+            explicit, level, _, task = heapq.heappop(self._heap)
+            if task in self._queued and (-explicit, -level) == task.priority:
+                self._queued.remove(task)
+                return task
+        return None
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._lock:
+                if self.running >= self.max_running:
+                    return
+                task = self._pop()
+                if task is None:
+                    return
+                self.running += 1
+
+            # Submit outside of the lock because the done callback of the
+            # task future may be invoked immediately in this thread.
+            try:
+                submitted = task._submit()
+            except Exception as e:
+                task.client_future.set_exception(e)
+                submitted = False
+            if submitted:
+                assert task.task_future is not None
+                task.task_future.add_done_callback(self._task_done_callback)
+            else:
+                with self._lock:
+                    self.running -= 1
+
+    def _task_done_callback(self, future: Future[Any]) -> None:
+        with self._lock:
+            self.running -= 1
+        self._dispatch()
 
 
 class DAGExecutor(Executor):
@@ -125,13 +282,36 @@ class DAGExecutor(Executor):
     of a task have completed. In other words, child tasks will not be
     scheduled until the results of the child's parent tasks are available.
 
+    If `max_running` is set, ready tasks are held in a priority queue and
+    at most `max_running` tasks are submitted to the wrapped executor at a
+    time (typically the number of workers of the wrapped executor). The
+    priority of a task is its explicit priority (see
+    [`task_priority()`][webs.executor.dag.task_priority]) followed by its
+    bottom level, the length of the longest known path from the task to a
+    task without children. The bottom level of a task and its pending
+    ancestors is updated as children are submitted so that tasks on the
+    critical path of the known graph are submitted first.
+
     Args:
         executor: Executor to wrap.
+        max_running: Maximum number of tasks submitted to the wrapped
+            executor at a time. If `None`, tasks are submitted as soon as
+            they are ready.
+
+    Raises:
+        ValueError: If `max_running` is less than one.
     """
 
-    def __init__(self, executor: Executor) -> None:
+    def __init__(
+        self,
+        executor: Executor,
+        max_running: int | None = None,
+    ) -> None:
         self.executor = executor
         self._tasks: dict[Future[Any], _Task[Any, Any]] = {}
+        self._ready_queue = (
+            None if max_running is None else _ReadyQueue(max_running)
+        )
 
     def __enter__(self) -> Self:
         self.executor.__enter__()
@@ -146,7 +326,10 @@ class DAGExecutor(Executor):
         return self.executor.__exit__(exc_type, exc_value, exc_traceback)
 
     def _task_future_callback(self, future: Future[Any]) -> None:
-        self._tasks.pop(future)
+        task = self._tasks.pop(future)
+        # Release references to parents so completed parts of the graph
+        # can be garbage collected.
+        task.parents = []
 
     def submit(
         self,
@@ -167,11 +350,52 @@ class DAGExecutor(Executor):
             result of the execution of the callable.
         """
         client_future: Future[T] = Future()
-        task = _Task(self.executor, function, args, kwargs, client_future)
+        parents = (
+            []
+            if self._ready_queue is None
+            else [
+                parent
+                for parent in (
+                    self._tasks.get(arg)
+                    for arg in (*args, *kwargs.values())
+                    if isinstance(arg, Future)
+                )
+                if parent is not None
+            ]
+        )
+        task = _Task(
+            self.executor,
+            function,
+            args,
+            kwargs,
+            client_future,
+            ready_queue=self._ready_queue,
+        )
         self._tasks[client_future] = task
         client_future.add_done_callback(self._task_future_callback)
+        if self._ready_queue is not None:
+            task.parents = parents
+            self._update_bottom_levels(task)
         return client_future
 
+    def _update_bottom_levels(self, task: _Task[Any, Any]) -> None:
+        assert self._ready_queue is not None
+        with self._ready_queue._lock:
+            stack = [
+                (parent, task.bottom_level + 1) for parent in task.parents
+            ]
+            while len(stack) > 0:
+                parent, level = stack.pop()
+                # Ancestors of submitted tasks have completed so their
+                # priority no longer matters.
+                if parent.task_future is not None:
+                    continue
+                if level <= parent.bottom_level:
+                    continue
+                parent.bottom_level = level
+                self._ready_queue.reprioritize(parent)
+                stack.extend((p, level + 1) for p in parent.parents)
+
     def map(
         self,
         function: Callable[P, T],
@@ -232,6 +456,16 @@ class DAGExecutor(Executor):
             cancel_futures: Cancel all pending futures that the executor
                 has not started running. Only used in Python 3.9 and later.
         """
+        if self._ready_queue is not None:
+            # Tasks held in the ready queue have not been submitted to the
+            # wrapped executor yet so must be cancelled or waited on before
+            # the wrapped executor is shutdown.
+            if cancel_futures:
+                for future in list(self._tasks.copy()):
+                    future.cancel()
+            if wait:
+                wait_python(list(self._tasks.copy()))
+
         if sys.version_info >= (3, 9):  # pragma: >=3.9 cover
             self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
         else:  # pragma: <3.9 cover
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import inspect
 import sys
 from concurrent.futures import Executor
 from concurrent.futures import Future
+from typing import Any
 from typing import Callable
+from typing import cast
 from typing import Generator
 from typing import Iterable
 from typing import Iterator
 from typing import Optional
+from typing import Sequence
 from typing import TypeVar
 
 if sys.version_info >= (3, 10):  # pragma: >=3.10 cover
@@ -25,6 +29,12 @@ from webs.executor.config import register
 P = ParamSpec('P')
 T = TypeVar('T')
 
+# Keyword arguments consumed by Client.map() rather than passed to the
+# function being mapped.
+_CLIENT_MAP_PARAMETERS = frozenset(
+    inspect.signature(Client.map).parameters.keys(),
+)
+
 
 class DaskDistributedExecutor(Executor):
     """Dask task execution engine.
@@ -56,6 +66,53 @@ class DaskDistributedExecutor(Executor):
         """
         return self.client.submit(function, *args, **kwargs)
 
+    def submit_many(
+        self,
+        function: Callable[..., T],
+        arg_tuples: Sequence[tuple[Any, ...]],
+        kwargs_list: Sequence[dict[str, Any]],
+    ) -> list[Future[T]]:
+        """Schedule a batch of calls of the same callable.
+
+        The batch is submitted with a single call to `Client.map()` when all
+        of the tasks take the same number of positional arguments and the
+        same keyword arguments. Otherwise, each task is submitted
+        individually with `Client.submit()`.
+
+        Args:
+            function: Callable to execute.
+            arg_tuples: Sequence of positional arguments, one tuple per task.
+            kwargs_list: Sequence of keyword arguments, one mapping per task.
+
+        Returns:
+            List of [`Future`][concurrent.futures.Future]-like objects in \
+            the same order as `arg_tuples`.
+        """
+        if len(arg_tuples) == 0:
+            return []
+
+        kwargs = kwargs_list[0]
+        arity = len(arg_tuples[0])
+        if (
+            arity > 0
+            and all(len(args) == arity for args in arg_tuples)
+            and all(k == kwargs for k in kwargs_list)
+            and _CLIENT_MAP_PARAMETERS.isdisjoint(kwargs)
+        ):
+            futures = self.client.map(
+                function,
+                *zip(*arg_tuples),
+                pure=False,
+                **kwargs,
+            )
+        else:
+            futures = [
+                self.client.submit(function, *args, **kwargs)
+                for args, kwargs in zip(arg_tuples, kwargs_list)
+            ]
+        # Dask futures implement the interface of Python futures.
+        return cast('list[Future[T]]', futures)
+
     def map(
         self,
         function: Callable[P, T],
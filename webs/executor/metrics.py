@@ -0,0 +1,361 @@
+"""Live metrics of running workflows.
+
+A [`TaskMetrics`][webs.executor.metrics.TaskMetrics] passed to the
+[`WorkflowExecutor`][webs.executor.workflow.WorkflowExecutor] counts
+completed and failed tasks and keeps rolling histograms of the time tasks
+spent in each phase. Metrics are rendered in the
+[Prometheus text format](https://prometheus.io/docs/instrumenting/exposition_formats/)
+and exported by a [`MetricsServer`][webs.executor.metrics.MetricsServer]
+or a [`MetricsFileWriter`][webs.executor.metrics.MetricsFileWriter].
+
+Metrics are only updated when a task completes. The numbers of submitted
+and in-flight tasks are read from the executor when the metrics are
+rendered so submitting tasks is not slowed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import http.server
+import logging
+import os
+import pathlib
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import Callable
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from webs.executor.workflow import TaskInfo
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+"""Default upper bounds in seconds of the latency histogram buckets."""
+
+PHASES = ('queue', 'input_transform', 'task', 'result_transform')
+"""Task phases with a latency histogram."""
+
+
+class _Slot:
+    # Completions and phase latencies within one interval of the window.
+    __slots__ = ('buckets', 'completed', 'epoch', 'sums')
+
+    def __init__(self, buckets: int) -> None:
+        self.epoch = -1
+        self.completed = 0
+        self.buckets = [[0] * (buckets + 1) for _ in PHASES]
+        self.sums = [0.0] * len(PHASES)
+
+    def reset(self, epoch: int) -> None:
+        self.epoch = epoch
+        self.completed = 0
+        for counts in self.buckets:
+            counts[:] = [0] * len(counts)
+        self.sums = [0.0] * len(PHASES)
+
+
+class TaskMetrics:
+    """Counters and rolling latency histograms of completed tasks.
+
+    The window is divided into `slots` intervals and each completed task is
+    added to the interval of its completion time. Intervals which fall out
+    of the window are cleared when reused so rendering the metrics and
+    recording a task take constant time.
+
+    Args:
+        window: Seconds of the rolling window of the histograms and the
+            completion rate.
+        slots: Number of intervals the window is divided into.
+        buckets: Increasing upper bounds in seconds of the histogram
+            buckets.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 60.0,
+        slots: int = 12,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        if window <= 0 or slots < 1:
+            raise ValueError('Window and slots must be positive.')
+        self.window = window
+        self.buckets = tuple(buckets)
+        self.completed = 0
+        self.failed = 0
+        self._slot_width = window / slots
+        self._slots = [_Slot(len(self.buckets)) for _ in range(slots)]
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _slot(self, now: float) -> _Slot:
+        # Get the slot of the current interval. Must hold the lock.
+        epoch = int(now / self._slot_width)
+        slot = self._slots[epoch % len(self._slots)]
+        if slot.epoch != epoch:
+            slot.reset(epoch)
+        return slot
+
+    def record(self, info: TaskInfo) -> None:
+        """Record a completed task."""
+        execution = info.execution
+        if execution is None:
+            return
+        start = execution.wall_time
+        if info.clock_offset is not None:
+            start -= info.clock_offset.offset
+        durations = (
+            start - info.submit_time,
+            (
+                execution.input_transform_end_ns
+                - execution.input_transform_start_ns
+            )
+            / 1e9,
+            (execution.task_end_ns - execution.task_start_ns) / 1e9,
+            (
+                execution.result_transform_end_ns
+                - execution.result_transform_start_ns
+            )
+            / 1e9,
+        )
+        indices = [bisect.bisect_left(self.buckets, d) for d in durations]
+        now = time.monotonic()
+        with self._lock:
+            self.completed += 1
+            slot = self._slot(now)
+            slot.completed += 1
+            for phase, (index, duration) in enumerate(zip(indices, durations)):
+                slot.buckets[phase][index] += 1
+                slot.sums[phase] += duration
+
+    def record_failure(self) -> None:
+        """Record a failed task."""
+        with self._lock:
+            self.failed += 1
+
+    def render(self, *, submitted: int, in_flight: int) -> str:
+        """Render the metrics in the Prometheus text format.
+
+        Args:
+            submitted: Number of tasks submitted for execution.
+            in_flight: Number of submitted tasks which have not completed.
+
+        Returns:
+            Metrics text.
+        """
+        now = time.monotonic()
+        oldest = int(now / self._slot_width) - len(self._slots)
+        counts = [[0] * (len(self.buckets) + 1) for _ in PHASES]
+        sums = [0.0] * len(PHASES)
+        with self._lock:
+            completed, failed = self.completed, self.failed
+            recent = 0
+            for slot in self._slots:
+                if slot.epoch <= oldest:
+                    continue
+                recent += slot.completed
+                for phase in range(len(PHASES)):
+                    for index, count in enumerate(slot.buckets[phase]):
+                        counts[phase][index] += count
+                    sums[phase] += slot.sums[phase]
+
+        # Seconds covered by the slots in the window.
+        elapsed = max(
+            min(now - (oldest + 1) * self._slot_width, now - self._start),
+            1e-9,
+        )
+        window = f'{self.window:g}s'
+        lines = [
+            '# HELP webs_tasks_submitted_total Tasks submitted for execution.',
+            '# TYPE webs_tasks_submitted_total counter',
+            f'webs_tasks_submitted_total {submitted}',
+            '# HELP webs_tasks_completed_total Tasks completed successfully.',
+            '# TYPE webs_tasks_completed_total counter',
+            f'webs_tasks_completed_total {completed}',
+            '# HELP webs_tasks_failed_total Tasks which raised an exception.',
+            '# TYPE webs_tasks_failed_total counter',
+            f'webs_tasks_failed_total {failed}',
+            '# HELP webs_tasks_in_flight Submitted tasks not yet completed.',
+            '# TYPE webs_tasks_in_flight gauge',
+            f'webs_tasks_in_flight {in_flight}',
+            (
+                '# HELP webs_task_completion_rate Tasks completed per second '
+                f'over the last {window}.'
+            ),
+            '# TYPE webs_task_completion_rate gauge',
+            f'webs_task_completion_rate {recent / elapsed:g}',
+            (
+                '# HELP webs_task_phase_seconds Histogram of the seconds '
+                f'tasks completed in the last {window} spent in each phase.'
+            ),
+            '# TYPE webs_task_phase_seconds gauge',
+        ]
+        bounds = [f'{b:g}' for b in self.buckets] + ['+Inf']
+        for phase, name in enumerate(PHASES):
+            total = 0
+            for bound, count in zip(bounds, counts[phase]):
+                total += count
+                lines.append(
+                    f'webs_task_phase_seconds_bucket{{phase="{name}",'
+                    f'le="{bound}"}} {total}',
+                )
+            lines.append(
+                f'webs_task_phase_seconds_sum{{phase="{name}"}} '
+                f'{sums[phase]:g}',
+            )
+            lines.append(
+                f'webs_task_phase_seconds_count{{phase="{name}"}} {total}',
+            )
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """HTTP server of metrics in the Prometheus text format.
+
+    The server handles requests in a daemon thread. Metrics are rendered
+    for each request so are always current.
+
+    Args:
+        render: Callable which returns the metrics text.
+        host: Address to bind to.
+        port: Port to bind to. If `0`, an unused port is chosen.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        *,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        class _Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = render().encode()
+                self.send_response(200)
+                self.send_header(
+                    'Content-Type',
+                    'text/plain; version=0.0.4; charset=utf-8',
+                )
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                return
+
+        self._server = http.server.ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='webs-metrics-server',
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to."""
+        return self._server.server_address[1]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class MetricsFileWriter:
+    """Periodically rewrite a file with metrics in the Prometheus format.
+
+    The file is replaced atomically so readers never see a partial file.
+    The file is written a final time when the writer is closed.
+
+    Args:
+        render: Callable which returns the metrics text.
+        filepath: Metrics file path.
+        interval: Seconds between writes.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        filepath: pathlib.Path | str,
+        *,
+        interval: float = 10.0,
+    ) -> None:
+        self.render = render
+        self.filepath = pathlib.Path(filepath)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='webs-metrics-writer',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self) -> None:
+        """Write the current metrics to the file."""
+        temp = self.filepath.with_name(f'.{self.filepath.name}.tmp')
+        with open(temp, 'w') as f:
+            f.write(self.render())
+        os.replace(temp, self.filepath)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                logger.exception('Failed to write metrics file')
+
+    def close(self) -> None:
+        """Stop the writer and write the final metrics."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self.write()
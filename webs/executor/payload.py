@@ -0,0 +1,79 @@
+"""Payload size accounting of task executions.
+
+Sizes are the lengths of the pickled objects which approximate the bytes
+the compute executor moves to and from workers. Objects which cannot be
+pickled have no size. Arguments which the data transformer resolves lazily
+(e.g., proxies which are not extracted) are counted as the size of the
+lazy reference.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any
+from typing import Iterable
+from typing import NamedTuple
+
+
+class PayloadSize(NamedTuple):
+    """Serialized sizes of the data of a task.
+
+    Attributes:
+        args_bytes: Bytes of the arguments sent to the worker. Transformed
+            arguments are counted as the size of their identifiers.
+        args_transformed_bytes: Bytes of the arguments moved out-of-band by
+            the data transformer.
+        result_bytes: Bytes of the result returned by the worker. A
+            transformed result is counted as the size of its identifier.
+        result_transformed_bytes: Bytes of the result moved out-of-band by
+            the data transformer.
+    """
+
+    args_bytes: int | None
+    args_transformed_bytes: int | None
+    result_bytes: int | None
+    result_transformed_bytes: int | None
+
+
+class _ByteCounter:
+    # File-like object which counts the bytes written.
+    __slots__ = ('count',)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def write(self, data: bytes) -> int:
+        self.count += len(data)
+        return len(data)
+
+
+def pickled_size(obj: Any) -> int | None:
+    """Get the size in bytes of the pickled object.
+
+    The object is pickled to a counter so the pickled bytes are not kept
+    in memory.
+
+    Returns:
+        Size in bytes or `None` if the object cannot be pickled.
+    """
+    counter = _ByteCounter()
+    try:
+        pickle.Pickler(counter, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    except Exception:
+        return None
+    return counter.count
+
+
+def total_pickled_size(objs: Iterable[Any]) -> int | None:
+    """Get the total size in bytes of the pickled objects.
+
+    Returns:
+        Total size in bytes or `None` if any object cannot be pickled.
+    """
+    total = 0
+    for obj in objs:
+        size = pickled_size(obj)
+        if size is None:
+            return None
+        total += size
+    return total
@@ -0,0 +1,108 @@
+"""Sampled profiling of task functions.
+
+A [`TaskProfiler`][webs.executor.profiling.TaskProfiler] passed to the
+[`WorkflowExecutor`][webs.executor.workflow.WorkflowExecutor] is sent to
+the workers with each task. A sampled fraction of the tasks of the selected
+functions are executed under `cProfile` and the profile of each task is
+written to the profile directory by
+[`TaskProfiler.write()`][webs.executor.profiling.TaskProfiler.write].
+When the executor is shut down, the profiles of each function are merged
+with [`TaskProfiler.merge()`][webs.executor.profiling.TaskProfiler.merge].
+
+Note:
+    Workers on other hosts must be able to write to the profile directory
+    (e.g., the run directory is on a shared file system).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pathlib
+import pstats
+import random
+import uuid
+from typing import Collection
+
+logger = logging.getLogger(__name__)
+
+_TASK_PROFILES_DIR = 'tasks'
+
+
+class TaskProfiler:
+    """Profile a sample of the tasks of selected functions.
+
+    Args:
+        directory: Directory to write profiles to. Per-task profiles are
+            written to `{directory}/tasks/{function_name}/` and merged
+            profiles to `{directory}/{function_name}.prof` with a text
+            summary in `{directory}/{function_name}.txt`.
+        functions: Names of the functions to profile. If `None`, all
+            functions are profiled.
+        rate: Fraction of the tasks of the selected functions to profile.
+    """
+
+    def __init__(
+        self,
+        directory: pathlib.Path | str,
+        *,
+        functions: Collection[str] | None = None,
+        rate: float = 1.0,
+    ) -> None:
+        if not 0 <= rate <= 1:
+            raise ValueError('Rate must be in [0, 1].')
+        # Absolute so workers with a different working directory write to
+        # the same place.
+        self.directory = pathlib.Path(directory).resolve()
+        self.functions = None if functions is None else frozenset(functions)
+        self.rate = rate
+
+    def sample(self, function_name: str) -> bool:
+        """Check if a task of the function should be profiled."""
+        if self.functions is not None and function_name not in self.functions:
+            return False
+        return random.random() < self.rate
+
+    def write(self, profile: cProfile.Profile, function_name: str) -> None:
+        """Write the profile of a task of the function."""
+        directory = self.directory / _TASK_PROFILES_DIR / function_name
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(directory / f'{uuid.uuid4()}.prof')
+        except OSError:
+            logger.exception('Failed to write task profile')
+
+    def merge(self, top: int = 30) -> dict[str, pathlib.Path]:
+        """Merge the task profiles of each function.
+
+        Args:
+            top: Number of entries by cumulative time in the text summary.
+
+        Returns:
+            Mapping of function names to the path of the merged profile.
+        """
+        merged: dict[str, pathlib.Path] = {}
+        tasks_dir = self.directory / _TASK_PROFILES_DIR
+        if not tasks_dir.is_dir():
+            return merged
+
+        for function_dir in sorted(tasks_dir.iterdir()):
+            paths = sorted(str(p) for p in function_dir.glob('*.prof'))
+            if len(paths) == 0:
+                continue
+            summary = io.StringIO()
+            summary.write(f'Merged profiles of {len(paths)} tasks\n')
+            stats = pstats.Stats(*paths, stream=summary)
+
+            merged_path = self.directory / f'{function_dir.name}.prof'
+            stats.dump_stats(merged_path)
+            stats.sort_stats('cumulative').print_stats(top)
+            with open(merged_path.with_suffix('.txt'), 'w') as f:
+                f.write(summary.getvalue())
+            merged[function_dir.name] = merged_path
+            logger.info(
+                f'Merged {len(paths)} task profiles of {function_dir.name} '
+                f'to {merged_path}',
+            )
+        return merged
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import logging
 import multiprocessing
+import sys
+import threading
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+from typing import TypeVar
+
+if sys.version_info >= (3, 10):  # pragma: >=3.10 cover
+    from typing import ParamSpec
+else:  # pragma: <3.10 cover
+    from typing_extensions import ParamSpec
 
 from pydantic import Field
 
@@ -10,6 +23,80 @@ from webs.executor.config import ExecutorConfig
 from webs.executor.config import register
 from webs.executor.dag import DAGExecutor
 
+logger = logging.getLogger(__name__)
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+class RestartingProcessPoolExecutor(Executor):
+    """Process pool executor which is restarted if it breaks.
+
+    A [`ProcessPoolExecutor`][concurrent.futures.ProcessPoolExecutor] is
+    permanently broken once a worker process terminates abruptly (e.g., is
+    killed by the OOM killer) and all pending and future tasks raise a
+    [`BrokenProcessPool`][concurrent.futures.process.BrokenProcessPool]
+    error. This executor replaces a broken pool with a new pool when a task
+    is submitted so that failed tasks can be retried.
+
+    Args:
+        max_workers: Maximum number of processes.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers
+        self.restarts = 0
+        self._pool = ProcessPoolExecutor(max_workers)
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        function: Callable[P, T],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        """Schedule the callable to be executed.
+
+        Args:
+            function: Callable to execute.
+            args: Positional arguments.
+            kwargs: Keyword arguments.
+
+        Returns:
+            [`Future`][concurrent.futures.Future] object representing the \
+            result of the execution of the callable.
+        """
+        with self._lock:
+            try:
+                return self._pool.submit(function, *args, **kwargs)
+            except BrokenProcessPool:
+                logger.warning('Process pool is broken, starting a new pool')
+                self._pool.shutdown(wait=False)
+                self._pool = ProcessPoolExecutor(self.max_workers)
+                self.restarts += 1
+                return self._pool.submit(function, *args, **kwargs)
+
+    def shutdown(
+        self,
+        wait: bool = True,
+        *,
+        cancel_futures: bool = False,
+    ) -> None:
+        """Shutdown the executor.
+
+        Args:
+            wait: Wait on all pending futures to complete.
+            cancel_futures: Cancel all pending futures that the executor
+                has not started running. Only used in Python 3.9 and later.
+        """
+        with self._lock:
+            pool = self._pool
+        if sys.version_info >= (3, 9):  # pragma: >=3.9 cover
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+        else:  # pragma: <3.9 cover
+            pool.shutdown(wait=wait)
+
 
 @register(name='process-pool')
 class ProcessPoolConfig(ExecutorConfig):
@@ -25,8 +112,16 @@ class ProcessPoolConfig(ExecutorConfig):
     )
 
     def get_executor(self) -> DAGExecutor:
-        """Create an executor instance from the config."""
-        return DAGExecutor(ProcessPoolExecutor(self.max_processes))
+        """Create an executor instance from the config.
+
+        Ready tasks are submitted to the pool in priority order with at most
+        `max_processes` tasks submitted at a time. The pool is restarted if
+        a worker process terminates abruptly.
+        """
+        return DAGExecutor(
+            RestartingProcessPoolExecutor(self.max_processes),
+            max_running=self.max_processes,
+        )
 
 
 @register(name='thread-pool')
@@ -43,5 +138,12 @@ class ThreadPoolConfig(ExecutorConfig):
     )
 
     def get_executor(self) -> DAGExecutor:
-        """Create an executor instance from the config."""
-        return DAGExecutor(ThreadPoolExecutor(self.max_threads))
+        """Create an executor instance from the config.
+
+        Ready tasks are submitted to the pool in priority order with at most
+        `max_threads` tasks submitted at a time.
+        """
+        return DAGExecutor(
+            ThreadPoolExecutor(self.max_threads),
+            max_running=self.max_threads,
+        )
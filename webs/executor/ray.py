@@ -7,6 +7,7 @@ from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Optional
+from typing import Sequence
 from typing import TypeVar
 
 if sys.version_info >= (3, 10):  # pragma: >=3.10 cover
@@ -30,6 +31,13 @@ P = ParamSpec('P')
 T = TypeVar('T')
 
 
+def _object_ref(arg: Any) -> Any:
+    # Replace a Ray future with its object reference so Ray resolves the
+    # reference on the worker. Other futures (e.g., client-side futures of
+    # a WorkflowExecutor) do not have an object reference.
+    return getattr(arg, 'object_ref', arg) if isinstance(arg, Future) else arg
+
+
 class RayExecutor(Executor):
     """Ray execution engine.
 
@@ -68,38 +76,62 @@ class RayExecutor(Executor):
             [`Future`][concurrent.futures.Future]-like object representing \
             the result of the execution of the callable.
         """
-        args = cast(
-            P.args,
-            tuple(
-                arg.object_ref if isinstance(arg, Future) else arg  # type: ignore[attr-defined]
-                for arg in args
-            ),
-        )
+        args = cast(P.args, tuple(_object_ref(arg) for arg in args))
         kwargs = cast(
             P.kwargs,
-            {
-                k: v.object_ref if isinstance(v, Future) else v  # type: ignore[attr-defined]
-                for k, v in kwargs.items()
-            },
+            {k: _object_ref(v) for k, v in kwargs.items()},
         )
 
-        if function in self._remote:
-            remote = self._remote[function]
-        else:
-            # This wrapper is needed because Ray will raise a TypeError
-            # on certain function type that fail the inspect.isfunction
-            # and inspect.isclass checks in
-            # https://github.com/ray-project/ray/blob/6a8997cd720e2a92c5dc2763becf39e180b8c96e/python/ray/_private/worker.py#L3018-L3037
-            def _wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-                return function(*args, **kwargs)  # pragma: no cover
-
-            remote = ray.remote(_wrapper)
-            self._remote[function] = remote
-
+        remote = self._get_remote(function)
         object_ref = remote.remote(*args, **kwargs)
 
         return object_ref.future()
 
+    def submit_many(
+        self,
+        function: Callable[..., T],
+        arg_tuples: Sequence[tuple[Any, ...]],
+        kwargs_list: Sequence[dict[str, Any]],
+    ) -> list[Future[T]]:
+        """Schedule a batch of calls of the same callable.
+
+        The remote function for `function` is looked up (or created) once
+        for the whole batch.
+
+        Args:
+            function: Callable to execute.
+            arg_tuples: Sequence of positional arguments, one tuple per task.
+            kwargs_list: Sequence of keyword arguments, one mapping per task.
+
+        Returns:
+            List of [`Future`][concurrent.futures.Future]-like objects in \
+            the same order as `arg_tuples`.
+        """
+        remote = self._get_remote(function)
+        futures: list[Future[T]] = []
+        for args, kwargs in zip(arg_tuples, kwargs_list):
+            object_ref = remote.remote(
+                *(_object_ref(arg) for arg in args),
+                **{k: _object_ref(v) for k, v in kwargs.items()},
+            )
+            futures.append(object_ref.future())
+        return futures
+
+    def _get_remote(self, function: Callable[..., Any]) -> Any:
+        if function in self._remote:
+            return self._remote[function]
+
+        # This wrapper is needed because Ray will raise a TypeError
+        # on certain function type that fail the inspect.isfunction
+        # and inspect.isclass checks in
+        # https://github.com/ray-project/ray/blob/6a8997cd720e2a92c5dc2763becf39e180b8c96e/python/ray/_private/worker.py#L3018-L3037
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            return function(*args, **kwargs)  # pragma: no cover
+
+        remote = ray.remote(_wrapper)
+        self._remote[function] = remote
+        return remote
+
     def shutdown(
         self,
         wait: bool = True,
@@ -0,0 +1,141 @@
+"""Reference tracking of transformed task data.
+
+A [`ReferenceTracker`][webs.executor.references.ReferenceTracker] counts the
+references to each identifier created by the data transformer of a
+[`WorkflowExecutor`][webs.executor.workflow.WorkflowExecutor] and evicts
+the object of an identifier once nothing refers to it. An identifier is
+referred to by each pending task which was passed the identifier as an
+argument and by the live task future whose result is the identifier. A
+pending task also keeps the task futures of its parents alive so the
+results of the parents are not evicted before the task resolves them.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class References(NamedTuple):
+    """References held by a pending task.
+
+    Attributes:
+        identifiers: Identifiers passed as arguments to the task.
+        parents: Futures of the parent tasks.
+    """
+
+    identifiers: tuple[Any, ...]
+    parents: tuple[Any, ...]
+
+
+class ReferenceTracker:
+    """Count references to identifiers and evict unreferenced objects.
+
+    Identifiers are counted by identity so the same identifier object must
+    be passed to each task which refers to it (e.g., identifiers reused by
+    the deduplication of a
+    [`TaskDataTransformer`][webs.data.transform.TaskDataTransformer]).
+
+    Args:
+        is_identifier: Callable which checks if an object is an identifier.
+        evict: Callable which evicts the object of an identifier.
+    """
+
+    def __init__(
+        self,
+        is_identifier: Callable[[Any], bool],
+        evict: Callable[[Any], None],
+    ) -> None:
+        self.is_identifier = is_identifier
+        self.evict = evict
+        self.evicted = 0
+        self._counts: dict[int, list[Any]] = {}
+        # Held while transforming objects and acquiring the identifiers so
+        # an identifier reused by deduplication is not evicted in between.
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def count(self, identifier: Any) -> int:
+        """Get the number of references to an identifier."""
+        entry = self._counts.get(id(identifier))
+        return 0 if entry is None else entry[1]
+
+    def _acquire(self, identifier: Any) -> None:
+        entry = self._counts.get(id(identifier))
+        if entry is None:
+            self._counts[id(identifier)] = [identifier, 1]
+        else:
+            entry[1] += 1
+
+    def _release(self, identifier: Any) -> None:
+        with self.lock:
+            entry = self._counts[id(identifier)]
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self._counts[id(identifier)]
+            # Evicting while holding the lock prevents the identifier from
+            # being reused by a concurrent transform before it is evicted.
+            try:
+                self.evict(identifier)
+            except Exception:
+                logger.exception('Failed to evict transformed object')
+            else:
+                self.evicted += 1
+
+    def acquire(
+        self,
+        args: Iterable[Any],
+        parents: Iterable[Any] = (),
+    ) -> References:
+        """Acquire the references of a task.
+
+        Args:
+            args: Transformed arguments of the task.
+            parents: Futures of the parent tasks.
+
+        Returns:
+            References to release when the task completes.
+        """
+        with self.lock:
+            identifiers = tuple(arg for arg in args if self.is_identifier(arg))
+            for identifier in identifiers:
+                self._acquire(identifier)
+        return References(identifiers, tuple(parents))
+
+    def release(self, references: References) -> None:
+        """Release the references of a completed task."""
+        for identifier in references.identifiers:
+            self._release(identifier)
+
+    def release_when_done(
+        self,
+        future: Future[Any],
+        references: References,
+    ) -> None:
+        """Release the references of a task when its future is done."""
+        future.add_done_callback(lambda _: self.release(references))
+
+    def hold(self, owner: Any, result: Any) -> None:
+        """Hold a reference to a task result while its owner is alive.
+
+        Args:
+            owner: Object which refers to the result (e.g., a task future).
+                Must support weak references.
+            result: Task result which is only tracked if an identifier.
+        """
+        if not self.is_identifier(result):
+            return
+        with self.lock:
+            self._acquire(result)
+        weakref.finalize(owner, self._release, result)
@@ -0,0 +1,124 @@
+"""Resource usage of task executions.
+
+Resource usage is measured for the thread which executes a task where the
+platform supports it (`RUSAGE_THREAD` and `/proc/thread-self/io` on Linux)
+so concurrent tasks in thread pools are not attributed to each other.
+Otherwise, the usage of the whole process is measured. The peak resident
+set size is always for the whole process.
+
+Note:
+    This module requires the Unix-only `resource` module. I/O counters are
+    only available on Linux.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import NamedTuple
+
+try:
+    import resource
+
+    RESOURCE_IMPORT_ERROR = None
+except ImportError as e:  # pragma: no cover
+    RESOURCE_IMPORT_ERROR = e
+
+if RESOURCE_IMPORT_ERROR is None:  # pragma: no branch
+    _RUSAGE_WHO = getattr(resource, 'RUSAGE_THREAD', resource.RUSAGE_SELF)
+
+_IO_PATH = next(
+    (
+        path
+        for path in ('/proc/thread-self/io', '/proc/self/io')
+        if os.path.exists(path)
+    ),
+    None,
+)
+
+# ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+_MAXRSS_BYTES = 1 if sys.platform == 'darwin' else 1024
+
+
+class ResourceUsage(NamedTuple):
+    """Resources used while executing a task.
+
+    Attributes:
+        user_time: Seconds of CPU time in user mode.
+        system_time: Seconds of CPU time in kernel mode.
+        max_rss_delta: Bytes the peak resident set size of the process
+            grew by.
+        voluntary_context_switches: Context switches because the task
+            waited on a resource (e.g., I/O).
+        involuntary_context_switches: Context switches because the task was
+            preempted (e.g., the host is oversubscribed).
+        read_bytes: Bytes read by read syscalls including from the page
+            cache and sockets or `None` if unavailable.
+        write_bytes: Bytes written by write syscalls or `None` if
+            unavailable.
+    """
+
+    user_time: float
+    system_time: float
+    max_rss_delta: int
+    voluntary_context_switches: int
+    involuntary_context_switches: int
+    read_bytes: int | None
+    write_bytes: int | None
+
+
+class ResourceSnapshot(NamedTuple):
+    """Resource counters at a point in time.
+
+    Take a snapshot with
+    [`ResourceSnapshot.take()`][webs.executor.resources.ResourceSnapshot.take].
+    """
+
+    rusage: resource.struct_rusage
+    read_bytes: int | None
+    write_bytes: int | None
+
+    @classmethod
+    def take(cls) -> ResourceSnapshot:
+        """Take a snapshot of the resource counters of the current thread.
+
+        Raises:
+            ImportError: If the `resource` module is not available.
+        """
+        if RESOURCE_IMPORT_ERROR is not None:  # pragma: no cover
+            raise RESOURCE_IMPORT_ERROR
+
+        rusage = resource.getrusage(_RUSAGE_WHO)
+        if _IO_PATH is None:  # pragma: no cover
+            return cls(rusage, None, None)
+
+        read_bytes = write_bytes = None
+        with open(_IO_PATH) as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key == 'rchar':
+                    read_bytes = int(value)
+                elif key == 'wchar':
+                    write_bytes = int(value)
+        return cls(rusage, read_bytes, write_bytes)
+
+    def usage(self, end: ResourceSnapshot) -> ResourceUsage:
+        """Get the resources used between this snapshot and a later one."""
+        start, stop = self.rusage, end.rusage
+        return ResourceUsage(
+            user_time=stop.ru_utime - start.ru_utime,
+            system_time=stop.ru_stime - start.ru_stime,
+            max_rss_delta=(stop.ru_maxrss - start.ru_maxrss) * _MAXRSS_BYTES,
+            voluntary_context_switches=stop.ru_nvcsw - start.ru_nvcsw,
+            involuntary_context_switches=stop.ru_nivcsw - start.ru_nivcsw,
+            read_bytes=(
+                None
+                if self.read_bytes is None or end.read_bytes is None
+                else end.read_bytes - self.read_bytes
+            ),
+            write_bytes=(
+                None
+                if self.write_bytes is None or end.write_bytes is None
+                else end.write_bytes - self.write_bytes
+            ),
+        )
@@ -0,0 +1,328 @@
+"""Retry failed tasks with failure classification and backoff.
+
+A [`RetryEngine`][webs.executor.retry.RetryEngine] resubmits tasks which
+fail with a transient error (e.g., the loss of a worker process) according
+to a [`RetryPolicy`][webs.executor.retry.RetryPolicy]. Errors which would
+occur again if the task was re-executed (e.g., a `ZeroDivisionError`) are
+permanent and are not retried. Only the failed task is resubmitted;
+dependents of the task wait on the client-side future of the task and are
+not resubmitted.
+
+A policy can be set per function with
+[`retry_policy()`][webs.executor.retry.retry_policy] which takes precedence
+over the default policy of the engine.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable[..., Any])
+T = TypeVar('T')
+
+RETRY_POLICY_ATTRIBUTE = 'retry_policy'
+"""Name of the function attribute containing the retry policy."""
+
+TRANSIENT_EXCEPTION_NAMES = frozenset(
+    {
+        # Python
+        'BrokenExecutor',
+        'BrokenProcessPool',
+        'BrokenThreadPool',
+        # Dask
+        'CommClosedError',
+        'KilledWorker',
+        # Globus Compute and Parsl
+        'ManagerLost',
+        'WorkerLost',
+        # Ray
+        'NodeDiedError',
+        'ObjectLostError',
+        'WorkerCrashedError',
+    },
+)
+"""Names of exception types caused by the loss of a worker or connection.
+
+Exceptions are matched by the names of the classes in their MRO so the
+optional compute executor packages do not need to be imported.
+"""
+
+TRANSIENT_EXCEPTION_TYPES: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    MemoryError,
+    TimeoutError,
+)
+"""Exception types which may not occur again if a task is re-executed."""
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """Task retry policy.
+
+    The delay before retry `n` (starting at one) is
+    `min(initial_delay * backoff_factor ** (n - 1), max_delay)`.
+
+    Attributes:
+        max_retries: Maximum number of times a task is resubmitted.
+        initial_delay: Seconds before the first retry.
+        backoff_factor: Multiplier of the delay after each retry.
+        max_delay: Maximum seconds before a retry.
+        transient: Additional exception types which are retried.
+        permanent: Exception types which are never retried. Takes precedence
+            over `transient` and the default transient exceptions.
+    """
+
+    max_retries: int = 3
+    initial_delay: float = 1.0
+    backoff_factor: float = 2.0
+    max_delay: float = 60.0
+    transient: tuple[type[BaseException], ...] = ()
+    permanent: tuple[type[BaseException], ...] = ()
+
+    def delay(self, retry: int) -> float:
+        """Get the seconds to wait before a retry.
+
+        Args:
+            retry: Retry number starting at one.
+        """
+        delay = self.initial_delay * self.backoff_factor ** (retry - 1)
+        return min(delay, self.max_delay)
+
+    def is_transient(self, exception: BaseException) -> bool:
+        """Check if an exception is transient and should be retried."""
+        if isinstance(exception, (CancelledError, *self.permanent)):
+            return False
+        transient = (*TRANSIENT_EXCEPTION_TYPES, *self.transient)
+        if isinstance(exception, transient):
+            return True
+        return any(
+            cls.__name__ in TRANSIENT_EXCEPTION_NAMES
+            for cls in type(exception).__mro__
+        )
+
+
+def retry_policy(policy: RetryPolicy) -> Callable[[F], F]:
+    """Set the retry policy of a task function.
+
+    Example:
+        ```python
+        @retry_policy(RetryPolicy(max_retries=5, initial_delay=0.1))
+        def simulate(x: float) -> float:
+            ...
+        ```
+
+    Args:
+        policy: Retry policy of tasks of the decorated function.
+    """
+
+    def _decorator(function: F) -> F:
+        setattr(function, RETRY_POLICY_ATTRIBUTE, policy)
+        return function
+
+    return _decorator
+
+
+class RetryFuture(Future, Generic[T]):  # type: ignore[type-arg]
+    """Client-side future of a task which may be retried.
+
+    Note:
+        This class should not be instantiated by clients.
+
+    Attributes:
+        attempts: Futures of each attempt of the task returned by the compute
+            executor.
+        first_failure_time: Time the first attempt failed or `None` if no
+            attempt has failed.
+
+    Args:
+        attempt: Future of the first attempt.
+        policy: Retry policy of the task.
+        resubmit: Callable which submits the task again and returns the
+            future of the new attempt.
+    """
+
+    def __init__(
+        self,
+        attempt: Any,
+        policy: RetryPolicy,
+        resubmit: Callable[[], Any],
+    ) -> None:
+        super().__init__()
+        self.attempts: list[Any] = [attempt]
+        self.policy = policy
+        self.first_failure_time: float | None = None
+        self._resubmit = resubmit
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def retries(self) -> int:
+        """Number of times the task was resubmitted."""
+        return len(self.attempts) - 1
+
+    def cancel(self) -> bool:
+        """Attempt to cancel the task.
+
+        Returns:
+            `True` if the current attempt was cancelled or the task was \
+            waiting to be resubmitted.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+                return super().cancel()
+            attempt = self.attempts[-1]
+        # The done callback of the attempt cancels this future.
+        return attempt.cancel() and super().cancel()
+
+
+class RetryEngine:
+    """Resubmits tasks which fail with transient errors.
+
+    Attributes:
+        retries: Total number of task resubmissions.
+        recovered: Number of tasks which failed and then completed
+            successfully after being resubmitted.
+        exhausted: Number of tasks which failed with a transient error after
+            the maximum number of retries.
+
+    Args:
+        default_policy: Policy of task functions without a policy set by
+            [`retry_policy()`][webs.executor.retry.retry_policy]. If `None`,
+            only tasks of functions with a policy are retried.
+    """
+
+    def __init__(self, default_policy: RetryPolicy | None = None) -> None:
+        self.default_policy = default_policy
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self._recovery_times: list[float] = []
+        self._lock = threading.Lock()
+
+    @property
+    def mean_time_to_recovery(self) -> float | None:
+        """Mean seconds from the first failure of a task to its completion.
+
+        Only tasks which recovered are included. `None` if no tasks
+        recovered.
+        """
+        with self._lock:
+            if len(self._recovery_times) == 0:
+                return None
+            return sum(self._recovery_times) / len(self._recovery_times)
+
+    def get_policy(self, function: Callable[..., Any]) -> RetryPolicy | None:
+        """Get the retry policy of a task function."""
+        return getattr(function, RETRY_POLICY_ATTRIBUTE, self.default_policy)
+
+    def track(
+        self,
+        policy: RetryPolicy,
+        future: Any,
+        resubmit: Callable[[], Any],
+    ) -> RetryFuture[Any]:
+        """Track a submitted task.
+
+        Args:
+            policy: Retry policy of the task.
+            future: Future returned by the compute executor for the task.
+            resubmit: Callable which submits the task again and returns the
+                future of the new attempt.
+
+        Returns:
+            Future which is completed by the first successful attempt or \
+            the first attempt which fails with an error that is not retried.
+        """
+        client_future: RetryFuture[Any] = RetryFuture(future, policy, resubmit)
+        future.add_done_callback(
+            lambda attempt: self._attempt_callback(client_future, attempt),
+        )
+        return client_future
+
+    def _attempt_callback(
+        self,
+        client_future: RetryFuture[Any],
+        attempt: Any,
+    ) -> None:
+        if client_future.done():
+            return
+        if attempt.cancelled():
+            # Cancelled by RetryFuture.cancel().
+            Future.cancel(client_future)
+            return
+
+        try:
+            result = attempt.result()
+        except BaseException as e:
+            error: BaseException | None = e
+        else:
+            error = None
+
+        now = time.time()
+        if error is None:
+            if client_future.first_failure_time is not None:
+                with self._lock:
+                    self.recovered += 1
+                    self._recovery_times.append(
+                        now - client_future.first_failure_time,
+                    )
+            client_future.set_result(result)
+            return
+
+        if client_future.first_failure_time is None:
+            client_future.first_failure_time = now
+        policy = client_future.policy
+        if not policy.is_transient(error):
+            client_future.set_exception(error)
+            return
+        if client_future.retries >= policy.max_retries:
+            with self._lock:
+                self.exhausted += 1
+            client_future.set_exception(error)
+            return
+
+        delay = policy.delay(client_future.retries + 1)
+        logger.warning(
+            f'Task failed with transient error ({type(error).__name__}), '
+            f'retrying in {delay:.2f}s',
+        )
+        with client_future._lock:
+            timer = threading.Timer(delay, self._resubmit, (client_future,))
+            timer.daemon = True
+            client_future._timer = timer
+            timer.start()
+
+    def _resubmit(self, client_future: RetryFuture[Any]) -> None:
+        with client_future._lock:
+            if client_future.done():
+                return
+            client_future._timer = None
+
+        try:
+            attempt = client_future._resubmit()
+        except Exception as e:
+            # Failing to submit (e.g., the compute executor is broken) is
+            # handled the same as a failed attempt.
+            attempt = Future()
+            attempt.set_exception(e)
+
+        with client_future._lock:
+            client_future.attempts.append(attempt)
+        with self._lock:
+            self.retries += 1
+        attempt.add_done_callback(
+            lambda attempt: self._attempt_callback(client_future, attempt),
+        )
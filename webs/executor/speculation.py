@@ -0,0 +1,322 @@
+"""Speculative re-execution of straggler tasks.
+
+A [`StragglerMonitor`][webs.executor.speculation.StragglerMonitor] tracks
+the distribution of execution times of each task function. A background
+thread periodically checks running tasks, and when a task has been running
+for longer than a multiple of a percentile of the execution times of its
+function, a duplicate of the task is submitted to the compute executor. The
+first attempt to complete successfully provides the result of the task and
+the other attempts are cancelled where the compute executor allows.
+
+Warning:
+    Speculative copies of a task may execute concurrently, so tasks must be
+    idempotent (e.g., not append to shared files).
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import math
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class SpeculativeFuture(Future, Generic[T]):  # type: ignore[type-arg]
+    """Client-side future of a task which may be speculatively re-executed.
+
+    The future is completed by the first attempt of the task to complete
+    successfully or by the last attempt if all attempts fail.
+
+    Note:
+        This class should not be instantiated by clients.
+
+    Attributes:
+        attempts: Futures of each attempt of the task returned by the compute
+            executor. The first attempt is the original task.
+        winner: Index of the attempt which completed the future or `None`
+            if the future has not completed.
+    """
+
+    def __init__(self, attempt: Any) -> None:
+        super().__init__()
+        self.attempts: list[Any] = [attempt]
+        self.winner: int | None = None
+        # Time the first attempt was first observed running.
+        self._start_time: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def copies(self) -> int:
+        """Number of speculative copies launched."""
+        return len(self.attempts) - 1
+
+    def cancel(self) -> bool:
+        """Attempt to cancel all attempts of the task.
+
+        Returns:
+            `True` if all attempts were cancelled.
+        """
+        with self._lock:
+            attempts = list(self.attempts)
+        if all(attempt.cancel() for attempt in attempts):
+            # The future may have already been cancelled by the done
+            # callback of the last attempt.
+            return super().cancel()
+        return False
+
+
+def _running(future: Any) -> bool:
+    # Futures without a running state (e.g., Dask futures) are assumed to be
+    # running once submitted.
+    running = getattr(future, 'running', None)
+    return running is None or running() or future.done()
+
+
+class StragglerMonitor:
+    """Monitor of running tasks which launches copies of stragglers.
+
+    A task is a straggler if it has been running for longer than
+    `multiple` times the `percentile` of the execution times of previous
+    tasks of the same function. The running time of a task is measured from
+    when the task is first observed running by the monitor (or from when the
+    task is submitted if the compute executor does not report when tasks are
+    running).
+
+    Note:
+        Time a task spends queued is counted as running time if the compute
+        executor reports queued tasks as running (e.g., a
+        [`DAGExecutor`][webs.executor.dag.DAGExecutor] without
+        `max_running`) or does not report when tasks are running (e.g.,
+        Dask). The `process-pool` and `thread-pool` executors submit at most
+        one task per worker so queued tasks are not mistaken for stragglers.
+
+    Attributes:
+        launched: Number of speculative copies launched.
+        won: Number of speculative copies which completed before the
+            original task.
+
+    Args:
+        percentile: Percentile (0 to 100) of execution times of a function.
+        multiple: Multiple of the percentile execution time after which a
+            running task is a straggler.
+        min_samples: Minimum number of completed tasks of a function before
+            tasks of that function are considered for speculation.
+        max_copies: Maximum number of speculative copies of a task.
+        interval: Seconds between checks of running tasks.
+        max_samples: Maximum number of the most recent execution times to
+            retain per function.
+
+    Raises:
+        ValueError: If `percentile` is not in (0, 100] or `multiple` is less
+            than one.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        percentile: float = 90,
+        multiple: float = 2.0,
+        min_samples: int = 10,
+        max_copies: int = 1,
+        interval: float = 0.1,
+        max_samples: int = 1000,
+    ) -> None:
+        if not 0 < percentile <= 100:  # noqa: PLR2004
+            raise ValueError('percentile must be in (0, 100].')
+        if multiple < 1:
+            raise ValueError('multiple must be >= 1.')
+        self.percentile = percentile
+        self.multiple = multiple
+        self.min_samples = min_samples
+        self.max_copies = max_copies
+        self.interval = interval
+        self.max_samples = max_samples
+
+        self.launched = 0
+        self.won = 0
+
+        self._lock = threading.Lock()
+        self._samples: dict[str, collections.deque[float]] = {}
+        self._tracked: dict[
+            SpeculativeFuture[Any],
+            tuple[str, Callable[[], Any]],
+        ] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(self, function_name: str, duration: float) -> None:
+        """Record the execution time of a completed task.
+
+        Args:
+            function_name: Name of the task function.
+            duration: Execution time of the task in seconds.
+        """
+        with self._lock:
+            if function_name not in self._samples:
+                self._samples[function_name] = collections.deque(
+                    maxlen=self.max_samples,
+                )
+            self._samples[function_name].append(duration)
+
+    def threshold(self, function_name: str) -> float | None:
+        """Get the running time after which a task is a straggler.
+
+        Args:
+            function_name: Name of the task function.
+
+        Returns:
+            Seconds or `None` if fewer than `min_samples` tasks of the \
+            function have completed.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(function_name, ()))
+        if len(samples) == 0 or len(samples) < self.min_samples:
+            return None
+        # Nearest-rank percentile.
+        rank = math.ceil(self.percentile / 100 * len(samples))
+        return self.multiple * samples[max(rank, 1) - 1]
+
+    def track(
+        self,
+        function_name: str,
+        future: Any,
+        resubmit: Callable[[], Any],
+    ) -> SpeculativeFuture[Any]:
+        """Track a submitted task.
+
+        Args:
+            function_name: Name of the task function.
+            future: Future returned by the compute executor for the task.
+            resubmit: Callable which submits a copy of the task to the
+                compute executor and returns the future of the copy.
+
+        Returns:
+            Future which is completed by the first attempt of the task to \
+            complete successfully.
+        """
+        client_future: SpeculativeFuture[Any] = SpeculativeFuture(future)
+        with self._lock:
+            self._tracked[client_future] = (function_name, resubmit)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='webs-straggler-monitor',
+                    daemon=True,
+                )
+                self._thread.start()
+        future.add_done_callback(
+            lambda attempt: self._attempt_callback(client_future, attempt),
+        )
+        return client_future
+
+    def close(self) -> None:
+        """Stop the monitor thread.
+
+        Tracked tasks still complete but no further copies are launched.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _attempt_callback(
+        self,
+        client_future: SpeculativeFuture[Any],
+        attempt: Any,
+    ) -> None:
+        error: BaseException | None
+        try:
+            result = attempt.result()
+        except BaseException as e:
+            result, error = None, e
+        else:
+            error = None
+
+        with client_future._lock:
+            if client_future.done():
+                return
+            if all(a.cancelled() for a in client_future.attempts):
+                # Cancelled by SpeculativeFuture.cancel().
+                Future.cancel(client_future)
+                return
+            remaining = [a for a in client_future.attempts if not a.done()]
+            if error is not None and len(remaining) > 0:
+                # Wait for another attempt to succeed.
+                return
+            client_future.winner = client_future.attempts.index(attempt)
+            losers = remaining
+
+        with self._lock:
+            self._tracked.pop(client_future, None)
+            if client_future.winner > 0:
+                self.won += 1
+
+        if error is None:
+            client_future.set_result(result)
+        else:
+            client_future.set_exception(error)
+        for loser in losers:
+            loser.cancel()
+
+    def _launch(self, client_future: SpeculativeFuture[Any]) -> None:
+        with self._lock:
+            tracked = self._tracked.get(client_future)
+        if tracked is None:
+            return
+        _, resubmit = tracked
+        try:
+            copy = resubmit()
+        except Exception:
+            logger.exception('Failed to launch speculative copy of task')
+            return
+
+        with client_future._lock:
+            client_future.attempts.append(copy)
+        with self._lock:
+            self.launched += 1
+        copy.add_done_callback(
+            lambda attempt: self._attempt_callback(client_future, attempt),
+        )
+        if client_future.done():
+            # The task completed while the copy was being submitted.
+            copy.cancel()
+
+    def _check(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            tracked = list(self._tracked.items())
+
+        thresholds: dict[str, float | None] = {}
+        for client_future, (function_name, _) in tracked:
+            if client_future.done():
+                continue
+            if client_future._start_time is None:
+                if _running(client_future.attempts[0]):
+                    client_future._start_time = now
+                continue
+            if function_name not in thresholds:
+                thresholds[function_name] = self.threshold(function_name)
+            threshold = thresholds[function_name]
+            if threshold is None:
+                continue
+            # Each additional copy must wait another threshold.
+            copies = client_future.copies
+            elapsed = now - client_future._start_time
+            if copies < self.max_copies and elapsed > threshold * (copies + 1):
+                self._launch(client_future)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self._check()
+            except Exception:  # pragma: no cover
+                logger.exception('Error checking for straggler tasks')
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-import dataclasses
+import collections
+import cProfile
+import functools
+import itertools
+import os
+import queue
 import socket
 import sys
 import time
@@ -16,6 +21,7 @@ from typing import Generator
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import NamedTuple
 from typing import Sequence
 from typing import TypeVar
 
@@ -35,6 +41,30 @@ from dask.distributed import wait as wait_dask
 
 from webs.data.null import NullTransformer
 from webs.data.transform import TaskDataTransformer
+from webs.executor import aio
+from webs.executor.cache import cache_key
+from webs.executor.cache import CacheKeyRef
+from webs.executor.cache import TaskCache
+from webs.executor.clock import ClockOffset
+from webs.executor.clock import ClockOffsetEstimator
+from webs.executor.dag import _get_chunks
+from webs.executor.dag import DAGExecutor
+from webs.executor.dag import TASK_PRIORITY_ATTRIBUTE
+from webs.executor.dask import DaskDistributedExecutor
+from webs.executor.metrics import TaskMetrics
+from webs.executor.payload import PayloadSize
+from webs.executor.payload import pickled_size
+from webs.executor.payload import total_pickled_size
+from webs.executor.profiling import TaskProfiler
+from webs.executor.ray import RayExecutor
+from webs.executor.references import References
+from webs.executor.references import ReferenceTracker
+from webs.executor.resources import ResourceSnapshot
+from webs.executor.resources import ResourceUsage
+from webs.executor.retry import RetryEngine
+from webs.executor.retry import RetryFuture
+from webs.executor.speculation import SpeculativeFuture
+from webs.executor.speculation import StragglerMonitor
 from webs.record import NullRecordLogger
 from webs.record import RecordLogger
 
@@ -42,61 +72,269 @@ P = ParamSpec('P')
 T = TypeVar('T')
 
 
-@dataclasses.dataclass
-class ExecutionInfo:
-    """Task execution information."""
+_HOSTNAME = socket.gethostname()
+
+# Wall-clock anchor of this process. Timestamps are taken with the
+# monotonic time.perf_counter_ns() and only converted to wall-clock time
+# when a record is created.
+_ANCHOR_WALL_TIME = time.time()
+_ANCHOR_PERF_NS = time.perf_counter_ns()
+
+
+def _wall_time(perf_ns: int) -> float:
+    return _ANCHOR_WALL_TIME + (perf_ns - _ANCHOR_PERF_NS) / 1e9
+
+
+class ExecutionInfo(NamedTuple):
+    """Task execution information.
+
+    Timestamps are `time.perf_counter_ns()` values of the process which
+    executed the task so are only comparable to each other. The
+    `wall_time` anchors the timestamps to the wall clock of the host.
+
+    Attributes:
+        hostname: Name of the host which executed the task.
+        wall_time: Wall-clock time in seconds since the epoch at
+            `execution_start_ns`.
+        resources: Resources used by the task function or `None` if
+            resource usage was not captured.
+        payload: Serialized sizes of the task arguments and result or
+            `None` if payload sizes were not captured.
+    """
 
     hostname: str
-    execution_start_time: float
-    execution_end_time: float
-    task_start_time: float
-    task_end_time: float
-    input_transform_start_time: float
-    input_transform_end_time: float
-    result_transform_start_time: float
-    result_transform_end_time: float
+    wall_time: float
+    execution_start_ns: int
+    execution_end_ns: int
+    task_start_ns: int
+    task_end_ns: int
+    input_transform_start_ns: int
+    input_transform_end_ns: int
+    result_transform_start_ns: int
+    result_transform_end_ns: int
+    resources: ResourceUsage | None = None
+    payload: PayloadSize | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the start to the end of execution."""
+        return (self.execution_end_ns - self.execution_start_ns) / 1e9
+
+    def to_record(
+        self,
+        clock_offset: ClockOffset | None = None,
+    ) -> dict[str, Any]:
+        """Get the record of the execution with wall-clock timestamps.
+
+        The record only has a `resources` field if resource usage was
+        captured and a `payload` field if payload sizes were captured.
+
+        Args:
+            clock_offset: Estimated offset of the clock of the host from the
+                clock of the client. If provided, timestamps are corrected
+                to the clock of the client and the record has
+                `clock_offset` and `clock_offset_error` fields.
+        """
+        wall_time, start = self.wall_time, self.execution_start_ns
+        if clock_offset is not None:
+            wall_time -= clock_offset.offset
+        record: dict[str, Any] = {
+            'hostname': self.hostname,
+            'execution_start_time': wall_time,
+            'execution_end_time': (
+                wall_time + (self.execution_end_ns - start) / 1e9
+            ),
+            'task_start_time': wall_time + (self.task_start_ns - start) / 1e9,
+            'task_end_time': wall_time + (self.task_end_ns - start) / 1e9,
+            'input_transform_start_time': (
+                wall_time + (self.input_transform_start_ns - start) / 1e9
+            ),
+            'input_transform_end_time': (
+                wall_time + (self.input_transform_end_ns - start) / 1e9
+            ),
+            'result_transform_start_time': (
+                wall_time + (self.result_transform_start_ns - start) / 1e9
+            ),
+            'result_transform_end_time': (
+                wall_time + (self.result_transform_end_ns - start) / 1e9
+            ),
+        }
+        if self.resources is not None:
+            record['resources'] = self.resources._asdict()
+        if self.payload is not None:
+            record['payload'] = self.payload._asdict()
+        if clock_offset is not None:
+            record['clock_offset'] = clock_offset.offset
+            record['clock_offset_error'] = clock_offset.error
+        return record
 
 
-@dataclasses.dataclass
 class TaskInfo:
-    """Task information."""
+    """Task information.
 
-    task_id: str
-    function_name: str
-    parent_task_ids: list[str]
-    submit_time: float
-    received_time: float | None = None
-    execution: ExecutionInfo | None = None
+    Client-side timestamps are `time.perf_counter_ns()` values of the
+    client process. Use
+    [`to_record()`][webs.executor.workflow.TaskInfo.to_record] to get the
+    information with wall-clock timestamps.
+
+    Args:
+        task_id: Unique ID of the task.
+        function_name: Name of the task function.
+        parent_task_ids: IDs of the tasks this task depends on.
+        submit_ns: Time the task was submitted.
+        received_ns: Time the result of the task was received.
+        execution: Execution information returned with the result.
+        cache_hit: If the result was found in the task cache.
+        speculative_copies: Number of speculative copies launched.
+        retries: Number of times the task was resubmitted.
+        first_failure_time: Wall-clock time the first attempt failed.
+        clock_offset: Estimated offset of the clock of the host which
+            executed the task used to correct the execution timestamps.
+    """
+
+    __slots__ = (
+        'cache_hit',
+        'clock_offset',
+        'execution',
+        'first_failure_time',
+        'function_name',
+        'parent_task_ids',
+        'received_ns',
+        'retries',
+        'speculative_copies',
+        'submit_ns',
+        'task_id',
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        task_id: str,
+        function_name: str,
+        parent_task_ids: list[str],
+        submit_ns: int,
+        *,
+        received_ns: int | None = None,
+        execution: ExecutionInfo | None = None,
+        cache_hit: bool = False,
+        speculative_copies: int = 0,
+        retries: int = 0,
+        first_failure_time: float | None = None,
+        clock_offset: ClockOffset | None = None,
+    ) -> None:
+        self.task_id = task_id
+        self.function_name = function_name
+        self.parent_task_ids = parent_task_ids
+        self.submit_ns = submit_ns
+        self.received_ns = received_ns
+        self.execution = execution
+        self.cache_hit = cache_hit
+        self.speculative_copies = speculative_copies
+        self.retries = retries
+        self.first_failure_time = first_failure_time
+        self.clock_offset = clock_offset
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(task_id={self.task_id!r}, '
+            f'function_name={self.function_name!r})'
+        )
+
+    @property
+    def submit_time(self) -> float:
+        """Wall-clock time the task was submitted."""
+        return _wall_time(self.submit_ns)
+
+    @property
+    def received_time(self) -> float | None:
+        """Wall-clock time the result was received or `None`."""
+        if self.received_ns is None:
+            return None
+        return _wall_time(self.received_ns)
+
+    def to_record(self) -> dict[str, Any]:
+        """Get the record of the task with wall-clock timestamps."""
+        return {
+            'task_id': self.task_id,
+            'function_name': self.function_name,
+            'parent_task_ids': self.parent_task_ids,
+            'submit_time': self.submit_time,
+            'received_time': self.received_time,
+            'execution': (
+                None
+                if self.execution is None
+                else self.execution.to_record(self.clock_offset)
+            ),
+            'cache_hit': self.cache_hit,
+            'speculative_copies': self.speculative_copies,
+            'retries': self.retries,
+            'first_failure_time': self.first_failure_time,
+        }
 
 
-@dataclasses.dataclass
 class _TaskResult(Generic[T]):
-    result: T
-    info: ExecutionInfo
+    __slots__ = ('info', 'result')
+
+    def __init__(self, result: T, info: ExecutionInfo) -> None:
+        self.result = result
+        self.info = info
 
 
 class _TaskWrapper(Generic[P, T]):
     """Workflow task wrapper.
 
+    A single wrapper can be shared by many tasks of the same function (e.g.,
+    tasks submitted together with
+    [`submit_many()`][webs.executor.workflow.WorkflowExecutor.submit_many]).
+
     Args:
         function: Function that represents the work associated with the task.
-        task_id: Unique UUID of the task.
+        task_id: Unique UUID of the task or batch of tasks. A new UUID is
+            generated if `None`.
+        data_transformer: Data transformer used to resolve the task
+            arguments and transform the task result.
+        capture_resources: Capture the resources used by the function (see
+            [`ResourceUsage`][webs.executor.resources.ResourceUsage]).
+        capture_payload: Capture the serialized sizes of the arguments and
+            result (see
+            [`PayloadSize`][webs.executor.payload.PayloadSize]).
+        profiler: Optional profiler which selects tasks to execute under
+            `cProfile`.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         function: Callable[P, T],
         *,
-        task_id: uuid.UUID,
+        task_id: uuid.UUID | None = None,
         data_transformer: TaskDataTransformer[Any],
+        capture_resources: bool = False,
+        capture_payload: bool = False,
+        profiler: TaskProfiler | None = None,
     ) -> None:
         self.function = function
         self.task_id = uuid.uuid4() if task_id is None else task_id
         self.data_transformer = data_transformer
+        self.capture_resources = capture_resources
+        self.capture_payload = capture_payload
+        self.profiler = profiler
+        # Forward the explicit priority of the function to compute executors
+        # which schedule tasks by priority.
+        priority = getattr(function, TASK_PRIORITY_ATTRIBUTE, None)
+        if priority is not None:
+            setattr(self, TASK_PRIORITY_ATTRIBUTE, priority)
 
     def __call__(self, *args: Any, **kwargs: Any) -> _TaskResult[T]:
         """Call the function associated with the task."""
-        execution_start_time = time.time()
+        return self._execute(args, kwargs)[0]
+
+    def _execute(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> tuple[_TaskResult[T], T]:
+        # Returns the task result and the result before it was transformed.
+        wall_time = time.time()
+        execution_start_ns = time.perf_counter_ns()
         args = tuple(
             arg.result if isinstance(arg, _TaskResult) else arg for arg in args
         )
@@ -105,33 +343,296 @@ class _TaskWrapper(Generic[P, T]):
             for k, v in kwargs.items()
         }
 
-        input_transform_start_time = time.time()
+        sent_args, sent_kwargs = args, kwargs
+        input_transform_start_ns = time.perf_counter_ns()
         args = self.data_transformer.resolve_iterable(args)
         kwargs = self.data_transformer.resolve_mapping(kwargs)
-        input_transform_end_time = time.time()
+        input_transform_end_ns = time.perf_counter_ns()
+
+        profiler, profile = self.profiler, None
+        if profiler is not None and profiler.sample(self.function.__name__):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12 and later allow only one active profiler so
+                # concurrent tasks in other threads are not profiled.
+                profile = None
+        snapshot = ResourceSnapshot.take() if self.capture_resources else None
+
+        task_start_ns = time.perf_counter_ns()
+        try:
+            raw_result = self.function(*args, **kwargs)
+        finally:
+            if profile is not None:
+                profile.disable()
+        task_end_ns = time.perf_counter_ns()
+
+        resources = (
+            None
+            if snapshot is None
+            else snapshot.usage(ResourceSnapshot.take())
+        )
+        if profiler is not None and profile is not None:
+            profiler.write(profile, self.function.__name__)
+
+        result_transform_start_ns = time.perf_counter_ns()
+        result = self.data_transformer.transform(raw_result)
+        result_transform_end_ns = time.perf_counter_ns()
+
+        execution_end_ns = time.perf_counter_ns()
+
+        # Sizes are measured after the execution ends so pickling does not
+        # inflate the execution time.
+        payload = (
+            self._payload_size(
+                (sent_args, sent_kwargs),
+                (args, kwargs),
+                raw_result,
+                result,
+            )
+            if self.capture_payload
+            else None
+        )
 
-        task_start_time = time.time()
-        result = self.function(*args, **kwargs)
-        task_end_time = time.time()
+        info = ExecutionInfo(
+            _HOSTNAME,
+            wall_time,
+            execution_start_ns,
+            execution_end_ns,
+            task_start_ns,
+            task_end_ns,
+            input_transform_start_ns,
+            input_transform_end_ns,
+            result_transform_start_ns,
+            result_transform_end_ns,
+            resources,
+            payload,
+        )
+        return _TaskResult(result, info), raw_result
 
-        result_transform_start_time = time.time()
-        result = self.data_transformer.transform(result)
-        result_transform_end_time = time.time()
+    def _payload_size(
+        self,
+        sent: tuple[tuple[Any, ...], dict[str, Any]],
+        resolved: tuple[tuple[Any, ...], dict[str, Any]],
+        raw_result: Any,
+        result: Any,
+    ) -> PayloadSize:
+        # Arguments which were identifiers when sent were moved out-of-band
+        # by the transformer so their resolved objects are counted as
+        # transformed bytes.
+        is_identifier = self.data_transformer.transformer.is_identifier
+        transformed = [
+            value
+            for raw, value in zip(
+                (*sent[0], *sent[1].values()),
+                (*resolved[0], *resolved[1].values()),
+            )
+            if is_identifier(raw)
+        ]
+        result_transformed = (
+            pickled_size(raw_result) if is_identifier(result) else 0
+        )
+        return PayloadSize(
+            args_bytes=pickled_size(sent),
+            args_transformed_bytes=total_pickled_size(transformed),
+            result_bytes=pickled_size(result),
+            result_transformed_bytes=result_transformed,
+        )
 
-        execution_end_time = time.time()
 
-        info = ExecutionInfo(
-            hostname=socket.gethostname(),
-            execution_start_time=execution_start_time,
-            execution_end_time=execution_end_time,
-            task_start_time=task_start_time,
-            task_end_time=task_end_time,
-            input_transform_start_time=input_transform_start_time,
-            input_transform_end_time=input_transform_end_time,
-            result_transform_start_time=result_transform_start_time,
-            result_transform_end_time=result_transform_end_time,
+class _TaskChunkWrapper(Generic[P, T]):
+    """Workflow task chunk wrapper.
+
+    Executes a chunk of tasks of the same function in a single invocation.
+    The positional arguments of each task in the chunk are passed flattened
+    so that the compute executor sees any task dependencies.
+
+    Args:
+        task: Wrapper of the function to invoke on each element.
+        arity: Number of positional arguments of each task in the chunk.
+    """
+
+    def __init__(self, task: _TaskWrapper[P, T], *, arity: int) -> None:
+        self.task = task
+        self.arity = arity
+        priority = getattr(task, TASK_PRIORITY_ATTRIBUTE, None)
+        if priority is not None:
+            setattr(self, TASK_PRIORITY_ATTRIBUTE, priority)
+
+    def __call__(self, *args: Any) -> list[_TaskResult[T] | BaseException]:
+        """Call the function associated with the task on each element.
+
+        Returns:
+            List with one item per element in the chunk. Each item is the \
+            result of the element or the exception raised by the element.
+        """
+        results: list[_TaskResult[T] | BaseException] = []
+        for i in range(0, len(args), self.arity):
+            try:
+                results.append(self.task(*args[i : i + self.arity]))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class _TaskChainWrapper:
+    """Workflow task chain wrapper.
+
+    Executes a linear chain of tasks in a single invocation. The result of
+    a stage is passed to the next stage directly rather than being
+    transformed and resolved again. The arguments of all stages, except for
+    references to the previous stage, are passed flattened so that the
+    compute executor sees any task dependencies.
+
+    Args:
+        tasks: Wrapper of the function of each stage.
+        templates: Positional and keyword arguments of each stage where each
+            argument is the index of the flattened argument or `None` to
+            reference the result of the previous stage.
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[_TaskWrapper[Any, Any]],
+        templates: Sequence[
+            tuple[tuple[int | None, ...], dict[str, int | None]]
+        ],
+    ) -> None:
+        self.tasks = tasks
+        self.templates = templates
+        # A chain is as important as the most important stage.
+        priorities = [
+            priority
+            for priority in (
+                getattr(task, TASK_PRIORITY_ATTRIBUTE, None) for task in tasks
+            )
+            if priority is not None
+        ]
+        if len(priorities) > 0:
+            setattr(self, TASK_PRIORITY_ATTRIBUTE, max(priorities))
+
+    def __call__(self, *args: Any) -> list[_TaskResult[Any] | BaseException]:
+        """Call the function of each stage of the chain in order.
+
+        Returns:
+            List with one item per stage in the chain. Each item is the \
+            result of the stage or the exception raised by the stage. If a \
+            stage raises an exception, all later stages are also given the \
+            exception.
+        """
+        results: list[_TaskResult[Any] | BaseException] = []
+        previous = None
+        for task, (arg_template, kwarg_template) in zip(
+            self.tasks,
+            self.templates,
+        ):
+            stage_args = tuple(
+                previous if i is None else args[i] for i in arg_template
+            )
+            stage_kwargs = {
+                k: previous if i is None else args[i]
+                for k, i in kwarg_template.items()
+            }
+            try:
+                result, previous = task._execute(stage_args, stage_kwargs)
+            except Exception as e:
+                results.extend([e] * (len(self.tasks) - len(results)))
+                break
+            results.append(result)
+        return results
+
+
+def _split_chunk_future(
+    future: Future[list[_TaskResult[T] | BaseException]],
+    size: int,
+) -> list[Future[_TaskResult[T]]]:
+    # Create one future per element of a chunk task. The element futures are
+    # marked as running because a single element cannot be cancelled once
+    # the chunk has been submitted.
+    futures: list[Future[_TaskResult[T]]] = [Future() for _ in range(size)]
+    for element in futures:
+        element.set_running_or_notify_cancel()
+
+    def _callback(chunk: Future[list[_TaskResult[T] | BaseException]]) -> None:
+        try:
+            results = chunk.result()
+        except BaseException as e:
+            for element in futures:
+                element.set_exception(e)
+            return
+
+        for element, result in zip(futures, results):
+            if isinstance(result, BaseException):
+                element.set_exception(result)
+            else:
+                element.set_result(result)
+
+    future.add_done_callback(_callback)
+    return futures
+
+
+class _Previous:
+    def __repr__(self) -> str:
+        return 'PREVIOUS'
+
+
+PREVIOUS: Any = _Previous()
+"""Reference to the result of the previous stage of a task chain.
+
+See [`ChainStage`][webs.executor.workflow.ChainStage].
+"""
+
+
+class ChainStage:
+    """Stage of a linear task chain.
+
+    A stage is a function and its arguments. The result of the previous
+    stage in the chain is passed where the
+    [`PREVIOUS`][webs.executor.workflow.PREVIOUS] placeholder appears in the
+    arguments or as the first positional argument if the placeholder is not
+    used.
+
+    Example:
+        ```python
+        executor.chain(
+            ChainStage(syrk, tile, lower),
+            ChainStage(gemm, PREVIOUS, lower_i, lower_j),
         )
-        return _TaskResult(result, info)
+        ```
+
+    Args:
+        function: Function of the stage.
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+    def _arguments(
+        self,
+        first: bool,
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        # Get the arguments with the reference to the previous stage.
+        referenced = any(
+            arg is PREVIOUS for arg in (*self.args, *self.kwargs.values())
+        )
+        if first and referenced:
+            raise ValueError(
+                'The first stage of a chain cannot reference PREVIOUS.',
+            )
+        if first or referenced:
+            return self.args, self.kwargs
+        return (PREVIOUS, *self.args), self.kwargs
 
 
 class TaskFuture(Generic[T]):
@@ -149,6 +650,15 @@ class TaskFuture(Generic[T]):
         data_transformer: Data transformer used to resolve the task result.
     """
 
+    __slots__ = (
+        '__weakref__',
+        '_cache',
+        '_cache_key',
+        '_data_transformer',
+        '_future',
+        'info',
+    )
+
     def __init__(
         self,
         future: Future[_TaskResult[T]],
@@ -158,6 +668,37 @@ class TaskFuture(Generic[T]):
         self.info = info
         self._future = future
         self._data_transformer = data_transformer
+        # Set by the executor if the task is cacheable.
+        self._cache_key: str | None = None
+        # Set by the executor if a transformed result should be stored in
+        # the cache once resolved.
+        self._cache: TaskCache | None = None
+
+    def __await__(self) -> Generator[Any, None, T]:
+        """Wait for the task within a running event loop.
+
+        Waiting is notified by a done callback so no thread is blocked.
+        See [`webs.executor.aio`][webs.executor.aio].
+        """
+        return aio.result(self).__await__()
+
+    def add_done_callback(
+        self,
+        callback: Callable[[TaskFuture[T]], Any],
+    ) -> None:
+        """Attach a callable that will be called when the task finishes.
+
+        The callback is registered directly on the future returned by the
+        compute executor, so it is invoked by the compute executor's callback
+        mechanism (typically in a different thread).
+
+        Args:
+            callback: Callable that will be called with this task future as
+                its only argument when the task completes or is cancelled.
+                If the task has already completed or been cancelled,
+                `callback` will be called immediately.
+        """
+        self._future.add_done_callback(lambda _: callback(self))
 
     def cancel(self) -> bool:
         """Attempt to cancel the task.
@@ -192,9 +733,121 @@ class TaskFuture(Generic[T]):
         """
         task_result = self._future.result(timeout=timeout)
         result = self._data_transformer.resolve(task_result.result)
+        if self._cache is not None and (
+            self._data_transformer.transformer.is_identifier(
+                task_result.result,
+            )
+        ):
+            assert self._cache_key is not None
+            self._cache.put(self._cache_key, result)
         return result
 
 
+class CompletionQueue(Generic[T]):
+    """Queue of tasks which yields tasks in the order they complete.
+
+    Tasks are added to the queue with
+    [`add()`][webs.executor.workflow.CompletionQueue.add] and are
+    placed in an internal queue by a done callback when the task completes.
+    Retrieving the next completed task is O(1), unlike calling
+    [`as_completed()`][webs.executor.workflow.as_completed] repeatedly on a
+    shrinking collection of tasks which re-registers waiters on all of the
+    remaining tasks each time.
+
+    Example:
+        ```python
+        queue = CompletionQueue(executor.submit(f, x) for x in xs)
+        while len(queue) > 0:
+            task = queue.get()
+            if condition(task.result()):
+                queue.add(executor.submit(f, task.result()))
+        ```
+
+    Args:
+        tasks: Optional iterable of initial tasks to add to the queue.
+    """
+
+    def __init__(self, tasks: Iterable[TaskFuture[T]] = ()) -> None:
+        self._completed: queue.Queue[TaskFuture[T]] = queue.Queue()
+        self._size = 0
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self) -> int:
+        """Number of tasks added to the queue that have not been retrieved.
+
+        This includes tasks which have not completed yet.
+        """
+        return self._size
+
+    def add(self, task: TaskFuture[T]) -> None:
+        """Add a task to the queue.
+
+        The task can be retrieved with
+        [`get()`][webs.executor.workflow.CompletionQueue.get] once it has
+        completed.
+        """
+        self._size += 1
+        task.add_done_callback(self._completed.put)
+
+    def get(self, timeout: float | None = None) -> TaskFuture[T]:
+        """Remove and return the next completed task.
+
+        Args:
+            timeout: If no task has completed, wait up to `timeout` seconds
+                for a task to complete. If `None`, wait until a task
+                completes.
+
+        Returns:
+            The next completed (finished or cancelled) task.
+
+        Raises:
+            queue.Empty: If the queue contains no tasks or no task completed
+                within `timeout` seconds.
+        """
+        if self._size == 0:
+            raise queue.Empty('The completion queue contains no tasks.')
+        task = self._completed.get(timeout=timeout)
+        self._size -= 1
+        return task
+
+    def get_nowait(self) -> TaskFuture[T]:
+        """Remove and return the next completed task without blocking.
+
+        Raises:
+            queue.Empty: If no task in the queue has completed.
+        """
+        task = self._completed.get_nowait()
+        self._size -= 1
+        return task
+
+
+def _task_dependency(task: TaskFuture[Any], native: bool = True) -> Any:
+    # Tasks served from the cache are not known to the compute executor so
+    # the result is passed to the child instead of the future.
+    if task.info.cache_hit:
+        return task._future.result().result
+    if native or isinstance(task._future, Future):
+        return task._future
+    return _as_concurrent_future(task._future)
+
+
+def _as_concurrent_future(future: Any) -> Future[Any]:
+    # Chain a future-like object (e.g., a Dask future) to a Python future so
+    # it can be waited on by a DAGExecutor.
+    client_future: Future[Any] = Future()
+    client_future.set_running_or_notify_cancel()
+
+    def _callback(done: Any) -> None:
+        try:
+            client_future.set_result(done.result())
+        except BaseException as e:
+            client_future.set_exception(e)
+
+    future.add_done_callback(_callback)
+    return client_future
+
+
 def _result_or_cancel(
     future: TaskFuture[T],
     timeout: float | None = None,
@@ -211,23 +864,191 @@ def _result_or_cancel(
         del future
 
 
+# Translation tables which set the version (4) and variant (RFC 4122) bits of
+# random bytes. Applied to bytes 6 and 8 of each 16-byte UUID.
+_UUID4_VERSION_TABLE = bytes((b & 0x0F) | 0x40 for b in range(256))
+_UUID4_VARIANT_TABLE = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
+def _uuid4_batch(count: int) -> list[str]:
+    # Equivalent to [str(uuid.uuid4()) for _ in range(count)] but reads all
+    # of the random bytes with a single os.urandom() call and avoids
+    # constructing intermediate UUID objects.
+    data = bytearray(os.urandom(16 * count))
+    data[6::16] = data[6::16].translate(_UUID4_VERSION_TABLE)
+    data[8::16] = data[8::16].translate(_UUID4_VARIANT_TABLE)
+    h = data.hex()
+    return [
+        f'{h[i : i + 8]}-{h[i + 8 : i + 12]}-{h[i + 12 : i + 16]}-'
+        f'{h[i + 16 : i + 20]}-{h[i + 20 : i + 32]}'
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+class _TaskWindow(Generic[T]):
+    """Window of in-flight tasks used by `WorkflowExecutor.imap()`.
+
+    Args:
+        executor: Executor to submit tasks to.
+        function: Function to map onto the arguments.
+        arguments: Iterator of positional argument tuples, consumed lazily.
+        ordered: Pop tasks in submission order rather than completion order.
+    """
+
+    def __init__(
+        self,
+        executor: WorkflowExecutor,
+        function: Callable[..., T],
+        arguments: Iterator[tuple[Any, ...]],
+        *,
+        ordered: bool,
+    ) -> None:
+        self.executor = executor
+        self.function = function
+        self.arguments = arguments
+        self.ordered = ordered
+        # Ordered mode keeps tasks in submission order. Unordered mode
+        # retrieves tasks in the order they complete.
+        self._pending: collections.deque[TaskFuture[T]] = collections.deque()
+        self._completed: CompletionQueue[T] = CompletionQueue()
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._completed)
+
+    def submit(self, count: int) -> None:
+        """Submit tasks for up to `count` more arguments."""
+        args_list = list(itertools.islice(self.arguments, count))
+        for task in self.executor.submit_many(self.function, args_list):
+            if self.ordered:
+                self._pending.append(task)
+            else:
+                self._completed.add(task)
+
+    def pop(self, timeout: float | None = None) -> TaskFuture[T]:
+        """Remove and return the next task.
+
+        Raises:
+            TimeoutError: If no task completes within `timeout` seconds in
+                unordered mode.
+        """
+        if self.ordered:
+            return self._pending.popleft()
+        try:
+            return self._completed.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError() from None
+
+
 class WorkflowExecutor:
     """Workflow executor.
 
     Args:
         compute_executor: Compute executor.
+        cache: Optional task result cache. If provided, a task with the same
+            function and arguments as a previously completed task is not
+            executed. Instead, the returned future is completed immediately
+            with the cached result and the task record is marked as a cache
+            hit. Task futures passed as arguments are keyed by the cache key
+            of the parent task. Results transformed by the data transformer
+            are only stored once resolved by
+            [`TaskFuture.result()`][webs.executor.workflow.TaskFuture.result]
+            so they are not resolved again to be cached.
+        native_dependencies: Pass the futures of parent tasks directly to
+            the compute executor so compute executors with native
+            dependency support (e.g., Dask and Ray) schedule child tasks and
+            move data without involving the client. Otherwise, the client
+            waits for the parent tasks to complete before submitting a
+            child task with the results of its parents.
+        fuse_chains: Execute each task chain submitted with
+            [`chain()`][webs.executor.workflow.WorkflowExecutor.chain] as a
+            single invocation on the compute executor. Otherwise, each stage
+            of a chain is submitted as a separate task. The futures of the
+            stages of a fused chain are client-side futures so children of
+            a stage are submitted by the client once the chain completes
+            unless the compute executor is a
+            [`DAGExecutor`][webs.executor.dag.DAGExecutor].
+        straggler_monitor: Optional monitor which records the execution time
+            of every task and speculatively re-executes tasks submitted with
+            [`submit()`][webs.executor.workflow.WorkflowExecutor.submit] or
+            [`submit_many()`][webs.executor.workflow.WorkflowExecutor.submit_many]
+            which run for much longer than other tasks of the same function.
+            The future of a speculated task is a client-side future so
+            children of the task are submitted by the client once the task
+            completes unless the compute executor is a
+            [`DAGExecutor`][webs.executor.dag.DAGExecutor].
+        retry_engine: Engine which resubmits tasks submitted with
+            [`submit()`][webs.executor.workflow.WorkflowExecutor.submit] or
+            [`submit_many()`][webs.executor.workflow.WorkflowExecutor.submit_many]
+            which fail with a transient error. If `None`, only tasks of
+            functions with a policy set by
+            [`retry_policy()`][webs.executor.retry.retry_policy] are
+            retried. Same as speculation, the future of a task with a retry
+            policy is a client-side future.
+        metrics: Optional live metrics updated as tasks complete. Use
+            [`metrics_text()`][webs.executor.workflow.WorkflowExecutor.metrics_text]
+            to render the metrics.
+        capture_resources: Capture the CPU time, peak memory growth,
+            context switches, and I/O of each task function (see
+            [`ResourceUsage`][webs.executor.resources.ResourceUsage]) in
+            the `resources` field of the execution information.
+        capture_payload: Capture the serialized sizes of the arguments and
+            result of each task, split into the bytes passed inline and the
+            bytes moved out-of-band by the data transformer (see
+            [`PayloadSize`][webs.executor.payload.PayloadSize]), in the
+            `payload` field of the execution information. Sizes are
+            measured by pickling on the worker after the task completes.
+        profiler: Optional profiler which executes a sample of tasks under
+            `cProfile`. The task profiles are merged when the executor is
+            shut down.
+        clock_estimator: Optional estimator of the clock offsets of worker
+            hosts which is updated by each completed task. If provided, the
+            execution timestamps in task records are corrected to the clock
+            of the client.
+        evict_unreferenced: Count the references of pending tasks and live
+            task futures to each identifier created by the data transformer
+            and evict the object of an identifier once it is unreferenced
+            (see
+            [`ReferenceTracker`][webs.executor.references.ReferenceTracker]).
+            The transformer must support eviction.
+
+    Raises:
+        ValueError: If the data transformer evicts objects on resolve and
+            tasks may be speculatively re-executed or retried by default.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         compute_executor: Executor,
         config,
         *,
         data_transformer: TaskDataTransformer[Any] | None = None,
         record_logger: RecordLogger | None = None,
+        cache: TaskCache | None = None,
+        native_dependencies: bool = True,
+        fuse_chains: bool = False,
+        straggler_monitor: StragglerMonitor | None = None,
+        retry_engine: RetryEngine | None = None,
+        metrics: TaskMetrics | None = None,
+        capture_resources: bool = False,
+        capture_payload: bool = False,
+        profiler: TaskProfiler | None = None,
+        clock_estimator: ClockOffsetEstimator | None = None,
+        evict_unreferenced: bool = False,
     ) -> None:
         self.compute_executor = compute_executor
         self.config = config
+        self.cache = cache
+        self.native_dependencies = native_dependencies
+        self.fuse_chains = fuse_chains
+        self.straggler_monitor = straggler_monitor
+        self.metrics = metrics
+        self.capture_resources = capture_resources
+        self.capture_payload = capture_payload
+        self.profiler = profiler
+        self.clock_estimator = clock_estimator
+        self.retry_engine = (
+            retry_engine if retry_engine is not None else RetryEngine()
+        )
         self.data_transformer = (
             data_transformer
             if data_transformer is not None
@@ -236,10 +1057,39 @@ class WorkflowExecutor:
         self.record_logger = (
             record_logger if record_logger is not None else NullRecordLogger()
         )
+        if self.data_transformer.evict_on_resolve and (
+            straggler_monitor is not None
+            or self.retry_engine.default_policy is not None
+        ):
+            raise ValueError(
+                'Eviction on resolve is incompatible with speculation and '
+                'retries because each attempt of a task resolves the same '
+                'arguments.',
+            )
+        self.references = (
+            ReferenceTracker(
+                self.data_transformer.transformer.is_identifier,
+                self.data_transformer.evict,
+            )
+            if evict_unreferenced
+            else None
+        )
+        # Skip creating records which would be discarded.
+        self._log_records = not isinstance(
+            self.record_logger,
+            NullRecordLogger,
+        )
 
         # Internal bookkeeping
         self._running_tasks: dict[Future[Any], TaskFuture[Any]] = {}
         self._total_tasks = 0
+        # Used to wait for parent tasks on the client when dependencies are
+        # not passed to the compute executor.
+        self._client_dag = (
+            compute_executor
+            if isinstance(compute_executor, DAGExecutor)
+            else DAGExecutor(compute_executor)
+        )
 
     def __enter__(self) -> Self:
         return self
@@ -257,12 +1107,270 @@ class WorkflowExecutor:
         """Total number of tasks submitted for execution."""
         return self._total_tasks
 
+    def metrics_text(self) -> str:
+        """Render the live metrics in the Prometheus text format.
+
+        Raises:
+            RuntimeError: If the executor was created without metrics.
+        """
+        if self.metrics is None:
+            raise RuntimeError('Executor was created without metrics.')
+        return self.metrics.render(
+            submitted=self._total_tasks,
+            in_flight=len(self._running_tasks),
+        )
+
     def _task_done_callback(self, future: Future[Any]) -> None:
         task_future = self._running_tasks.pop(future)
-        execution_info = future.result().info
-        task_future.info.received_time = time.time()
-        task_future.info.execution = execution_info
-        self.record_logger.log(dataclasses.asdict(task_future.info))
+        if self.metrics is not None and (
+            future.cancelled() or future.exception() is not None
+        ):
+            self.metrics.record_failure()
+        task_result = future.result()
+        if self.references is not None:
+            self.references.hold(task_future, task_result.result)
+        info = task_future.info
+        info.received_ns = time.perf_counter_ns()
+        info.execution = task_result.info
+        attempt = future
+        if isinstance(future, SpeculativeFuture):
+            info.speculative_copies = future.copies
+            attempt = future.attempts[future.winner or 0]
+        if isinstance(attempt, RetryFuture):
+            info.retries = attempt.retries
+            info.first_failure_time = attempt.first_failure_time
+        if self.clock_estimator is not None:
+            execution = task_result.info
+            info.clock_offset = self.clock_estimator.update(
+                execution.hostname,
+                info.submit_time,
+                execution.wall_time,
+                execution.wall_time + execution.duration,
+                _wall_time(info.received_ns),
+            )
+        if self._log_records:
+            self.record_logger.log(info.to_record())
+        if self.metrics is not None:
+            self.metrics.record(info)
+
+        if self.straggler_monitor is not None:
+            self.straggler_monitor.record(
+                info.function_name,
+                task_result.info.duration,
+            )
+
+        if (
+            self.cache is not None
+            and task_future._cache_key is not None
+            and not self.data_transformer.transformer.is_identifier(
+                task_result.result,
+            )
+        ):
+            self.cache.put(task_future._cache_key, task_result.result)
+
+    def _transform_arguments(
+        self,
+        args: Iterable[Any],
+        kwargs: dict[str, Any],
+        parents: Iterable[TaskFuture[Any]],
+    ) -> tuple[tuple[Any, ...], dict[str, Any], References | None]:
+        # Transform the arguments of a task and acquire the references of
+        # the task if unreferenced objects are evicted.
+        if self.references is None:
+            return (
+                self.data_transformer.transform_iterable(args),
+                self.data_transformer.transform_mapping(kwargs),
+                None,
+            )
+        with self.references.lock:
+            args = self.data_transformer.transform_iterable(args)
+            kwargs = self.data_transformer.transform_mapping(kwargs)
+            references = self.references.acquire(
+                (*args, *kwargs.values()),
+                parents,
+            )
+        return args, kwargs, references
+
+    def _release_when_done(
+        self,
+        futures: Iterable[Future[Any]],
+        references: Iterable[References | None],
+    ) -> None:
+        # Release the references of each task when its future is done.
+        if self.references is None:
+            return
+        for future, task_references in zip(futures, references):
+            if task_references is not None:
+                self.references.release_when_done(future, task_references)
+
+    def _native_future(self, future: Any) -> bool:
+        # Check if a future is of the native future type of the compute
+        # executor. Client-side futures (e.g., of speculated, retried, or
+        # fused tasks) are not known to the compute executor.
+        if isinstance(self.compute_executor, DaskDistributedExecutor):
+            return isinstance(future, DaskFuture)
+        if isinstance(self.compute_executor, RayExecutor):
+            # Ray futures are Python futures of an object reference.
+            return hasattr(future, 'object_ref')
+        # Other executors (e.g., Parsl) return subclasses of Python futures.
+        return type(future) is not Future and not isinstance(
+            future,
+            (SpeculativeFuture, RetryFuture),
+        )
+
+    def _client_side(self, args: Iterable[Any]) -> bool:
+        # Check if the arguments contain futures which must be waited on by
+        # the client rather than passed to the compute executor.
+        if self.native_dependencies:
+            if isinstance(self.compute_executor, DAGExecutor):
+                return False
+            return any(
+                isinstance(arg, (Future, DaskFuture))
+                and not self._native_future(arg)
+                for arg in args
+            )
+        return any(isinstance(arg, Future) for arg in args)
+
+    def _compute_submit(
+        self,
+        function: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Future[Any]:
+        if self._client_side((*args, *kwargs.values())):
+            return self._client_dag.submit(function, *args, **kwargs)
+        return self.compute_executor.submit(function, *args, **kwargs)
+
+    def _compute_submit_many(
+        self,
+        function: Callable[..., Any],
+        arg_tuples: Sequence[tuple[Any, ...]],
+        kwargs_list: Sequence[dict[str, Any]],
+    ) -> list[Future[Any]]:
+        batch_submit = getattr(self.compute_executor, 'submit_many', None)
+        if batch_submit is not None and not self._client_side(
+            arg
+            for args, kwargs in zip(arg_tuples, kwargs_list)
+            for arg in (*args, *kwargs.values())
+        ):
+            return batch_submit(function, arg_tuples, kwargs_list)
+        return [
+            self._compute_submit(function, args, kwargs)
+            for args, kwargs in zip(arg_tuples, kwargs_list)
+        ]
+
+    def _check_retry_policy(self, function: Callable[..., Any]) -> None:
+        # Arguments evicted when resolved by the first attempt of a task
+        # cannot be resolved by a retry.
+        if (
+            self.data_transformer.evict_on_resolve
+            and self.retry_engine.get_policy(function) is not None
+        ):
+            raise ValueError(
+                f'Function {function.__name__} has a retry policy which is '
+                'incompatible with eviction on resolve.',
+            )
+
+    def _track_attempts(
+        self,
+        function: Callable[..., Any],
+        function_name: str,
+        future: Future[Any],
+        resubmit: Callable[[], Future[Any]],
+    ) -> Future[Any]:
+        # Wrap the future of a task with client-side futures which retry or
+        # speculatively re-execute the task.
+        submit_copy = resubmit
+        policy = self.retry_engine.get_policy(function)
+        if policy is not None:
+            retry_engine = self.retry_engine
+            future = retry_engine.track(policy, future, resubmit)
+
+            def _submit_copy() -> Future[Any]:
+                # Speculative copies are also retried.
+                return retry_engine.track(policy, resubmit(), resubmit)
+
+            submit_copy = _submit_copy
+
+        if self.straggler_monitor is not None:
+            future = self.straggler_monitor.track(
+                function_name,
+                future,
+                submit_copy,
+            )
+        return future
+
+    def _register_tasks(
+        self,
+        futures: Sequence[Future[_TaskResult[T]]],
+        infos: Sequence[TaskInfo],
+    ) -> list[TaskFuture[T]]:
+        task_futures: list[TaskFuture[T]] = []
+        for future, info in zip(futures, infos):
+            task_future = TaskFuture(future, info, self.data_transformer)
+            self._running_tasks[future] = task_future
+            future.add_done_callback(self._task_done_callback)
+            task_futures.append(task_future)
+        return task_futures
+
+    def _get_cache_key(
+        self,
+        function: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        refs: dict[int, CacheKeyRef] = {}
+        for arg in (*args, *kwargs.values()):
+            if isinstance(arg, TaskFuture):
+                if arg._cache_key is None:
+                    return None
+                refs[id(arg)] = CacheKeyRef(arg._cache_key)
+        return cache_key(
+            function,
+            tuple(refs.get(id(arg), arg) for arg in args),
+            {k: refs.get(id(v), v) for k, v in kwargs.items()},
+        )
+
+    def _cached_task(
+        self,
+        function: Callable[P, T],
+        key: str,
+        result: T,
+        parents: list[str],
+    ) -> TaskFuture[T]:
+        now = time.perf_counter_ns()
+        execution = ExecutionInfo(
+            hostname=_HOSTNAME,
+            wall_time=_wall_time(now),
+            execution_start_ns=now,
+            execution_end_ns=now,
+            task_start_ns=now,
+            task_end_ns=now,
+            input_transform_start_ns=now,
+            input_transform_end_ns=now,
+            result_transform_start_ns=now,
+            result_transform_end_ns=now,
+        )
+        info = TaskInfo(
+            task_id=str(uuid.uuid4()),
+            function_name=function.__name__,
+            parent_task_ids=parents,
+            submit_ns=now,
+            received_ns=now,
+            execution=execution,
+            cache_hit=True,
+        )
+        # The cached result is stored untransformed so the future resolves
+        # to the result and children are passed the result directly.
+        future: Future[_TaskResult[T]] = Future()
+        future.set_running_or_notify_cancel()
+        future.set_result(_TaskResult(result, execution))
+
+        task_future = TaskFuture(future, info, self.data_transformer)
+        task_future._cache_key = key
+        if self._log_records:
+            self.record_logger.log(info.to_record())
+        return task_future
 
     def submit(
         self,
@@ -287,47 +1395,415 @@ class WorkflowExecutor:
             representing the result of the execution of the callable
             accessible via \
             [`TaskFuture.result()`][webs.executor.workflow.TaskFuture.result].
+
+        Raises:
+            ValueError: If the data transformer evicts objects on resolve and
+                `function` has a retry policy.
         """
+        self._check_retry_policy(function)
+        parent_futures = [
+            arg
+            for arg in (*args, *kwargs.values())
+            if isinstance(arg, TaskFuture)
+        ]
+        parents = [str(parent.info.task_id) for parent in parent_futures]
+
+        key = None
+        if self.cache is not None:
+            key = self._get_cache_key(function, args, kwargs)
+            if key is not None:
+                hit, result = self.cache.get(key)
+                if hit:
+                    return self._cached_task(function, key, result, parents)
+
         task_id = uuid.uuid4()
         task = _TaskWrapper(
             function,
             task_id=task_id,
             data_transformer=self.data_transformer,
+            capture_resources=self.capture_resources,
+            capture_payload=self.capture_payload,
+            profiler=self.profiler,
         )
-
-        parents = [
-            str(arg.info.task_id)
-            for arg in (*args, *kwargs.values())
-            if isinstance(arg, TaskFuture)
-        ]
         info = TaskInfo(
             task_id=str(task_id),
             function_name=function.__name__,
             parent_task_ids=parents,
-            submit_time=time.time(),
+            submit_ns=time.perf_counter_ns(),
         )
 
         # Extract executor futures from inside TaskFuture objects
+        native = self.native_dependencies
         args = tuple(
-            arg._future if isinstance(arg, TaskFuture) else arg for arg in args
+            _task_dependency(arg, native)
+            if isinstance(arg, TaskFuture)
+            else arg
+            for arg in args
         )
         kwargs = {
-            k: v._future if isinstance(v, TaskFuture) else v
+            k: _task_dependency(v, native) if isinstance(v, TaskFuture) else v
             for k, v in kwargs.items()
         }
 
-        args = self.data_transformer.transform_iterable(args)
-        kwargs = self.data_transformer.transform_mapping(kwargs)
+        args, kwargs, references = self._transform_arguments(
+            args,
+            kwargs,
+            parent_futures,
+        )
 
-        future = self.compute_executor.submit(task, *args, **kwargs)
+        future = self._compute_submit(task, args, kwargs)
         self._total_tasks += 1
+        future = self._track_attempts(
+            function,
+            info.function_name,
+            future,
+            functools.partial(self._compute_submit, task, args, kwargs),
+        )
+        self._release_when_done([future], [references])
 
         task_future = TaskFuture(future, info, self.data_transformer)
+        task_future._cache_key = key
+        if key is not None:
+            task_future._cache = self.cache
         self._running_tasks[future] = task_future
         future.add_done_callback(self._task_done_callback)
 
         return task_future
 
+    def submit_many(
+        self,
+        function: Callable[P, T],
+        arg_tuples: Sequence[tuple[Any, ...]],
+        kwargs_list: Sequence[dict[str, Any]] | None = None,
+    ) -> list[TaskFuture[T]]:
+        """Schedule a batch of calls of the same callable.
+
+        This is equivalent to calling
+        [`submit()`][webs.executor.workflow.WorkflowExecutor.submit] once per
+        element of `arg_tuples` but amortizes the per-task overheads across
+        the batch. All of the tasks share a single task wrapper, task UUIDs
+        are generated in bulk, and the tasks are passed to the compute
+        executor in a single call if the compute executor provides a
+        `submit_many()` method (e.g.,
+        [`DaskDistributedExecutor`][webs.executor.dask.DaskDistributedExecutor]
+        and [`RayExecutor`][webs.executor.ray.RayExecutor]). Otherwise, the
+        tasks are submitted one at a time.
+
+        Args:
+            function: Callable to execute.
+            arg_tuples: Sequence of positional arguments, one tuple per task.
+            kwargs_list: Optional sequence of keyword arguments, one mapping
+                per task. Must be the same length as `arg_tuples`.
+
+        Returns:
+            List of [`TaskFuture`][webs.executor.workflow.TaskFuture] objects \
+            in the same order as `arg_tuples`.
+
+        Note:
+            If the executor has a task cache, each task is submitted
+            individually with
+            [`submit()`][webs.executor.workflow.WorkflowExecutor.submit] so
+            that the cache is checked for each task.
+
+        Raises:
+            ValueError: If `arg_tuples` and `kwargs_list` have different
+                lengths or if the data transformer evicts objects on resolve
+                and `function` has a retry policy.
+        """
+        count = len(arg_tuples)
+        if kwargs_list is None:
+            kwargs_list = [{}] * count
+        elif len(kwargs_list) != count:
+            raise ValueError(
+                f'Got {count} argument tuples but {len(kwargs_list)} '
+                'keyword argument mappings.',
+            )
+        if count == 0:
+            return []
+        self._check_retry_policy(function)
+        if self.cache is not None:
+            return [
+                self.submit(function, *args, **kwargs)
+                for args, kwargs in zip(arg_tuples, kwargs_list)
+            ]
+
+        task_ids = _uuid4_batch(count)
+        task = _TaskWrapper(
+            function,
+            task_id=uuid.UUID(task_ids[0]),
+            data_transformer=self.data_transformer,
+            capture_resources=self.capture_resources,
+            capture_payload=self.capture_payload,
+            profiler=self.profiler,
+        )
+        function_name = function.__name__
+        submit_ns = time.perf_counter_ns()
+        transform = not isinstance(
+            self.data_transformer.transformer,
+            NullTransformer,
+        )
+
+        infos: list[TaskInfo] = []
+        submit_args: list[tuple[Any, ...]] = []
+        submit_kwargs: list[dict[str, Any]] = []
+        task_references: list[References | None] = []
+        for task_id, args, kwargs in zip(task_ids, arg_tuples, kwargs_list):
+            parents: list[str] = []
+            parent_futures: list[TaskFuture[Any]] = []
+            if any(isinstance(arg, TaskFuture) for arg in args) or any(
+                isinstance(v, TaskFuture) for v in kwargs.values()
+            ):
+                parent_futures = [
+                    arg
+                    for arg in (*args, *kwargs.values())
+                    if isinstance(arg, TaskFuture)
+                ]
+                parents = [
+                    str(parent.info.task_id) for parent in parent_futures
+                ]
+                args = tuple(  # noqa: PLW2901
+                    _task_dependency(arg, self.native_dependencies)
+                    if isinstance(arg, TaskFuture)
+                    else arg
+                    for arg in args
+                )
+                kwargs = {  # noqa: PLW2901
+                    k: _task_dependency(v, self.native_dependencies)
+                    if isinstance(v, TaskFuture)
+                    else v
+                    for k, v in kwargs.items()
+                }
+
+            if transform:
+                args, kwargs, references = self._transform_arguments(  # noqa: PLW2901
+                    args,
+                    kwargs,
+                    parent_futures,
+                )
+                task_references.append(references)
+
+            infos.append(
+                TaskInfo(
+                    task_id=task_id,
+                    function_name=function_name,
+                    parent_task_ids=parents,
+                    submit_ns=submit_ns,
+                ),
+            )
+            submit_args.append(args)
+            submit_kwargs.append(kwargs)
+
+        futures = self._compute_submit_many(task, submit_args, submit_kwargs)
+        self._total_tasks += count
+        if (
+            self.straggler_monitor is not None
+            or self.retry_engine.get_policy(function) is not None
+        ):
+            futures = [
+                self._track_attempts(
+                    function,
+                    function_name,
+                    future,
+                    functools.partial(
+                        self._compute_submit,
+                        task,
+                        args,
+                        kwargs,
+                    ),
+                )
+                for future, args, kwargs in zip(
+                    futures,
+                    submit_args,
+                    submit_kwargs,
+                )
+            ]
+        self._release_when_done(futures, task_references)
+
+        return self._register_tasks(futures, infos)
+
+    def _submit_chunks(
+        self,
+        function: Callable[P, T],
+        iterables: Sequence[Iterable[Any]],
+        chunksize: int,
+    ) -> list[TaskFuture[T]]:
+        task = _TaskWrapper(
+            function,
+            data_transformer=self.data_transformer,
+            capture_resources=self.capture_resources,
+            capture_payload=self.capture_payload,
+            profiler=self.profiler,
+        )
+        chunk_task = _TaskChunkWrapper(task, arity=len(iterables))
+        function_name = function.__name__
+
+        chunk_sizes: list[int] = []
+        chunk_args: list[tuple[Any, ...]] = []
+        chunk_references: list[References | None] = []
+        infos: list[TaskInfo] = []
+        for chunk in _get_chunks(*iterables, chunksize=chunksize):
+            submit_ns = time.perf_counter_ns()
+            task_ids = _uuid4_batch(len(chunk))
+            for task_id, args in zip(task_ids, chunk):
+                parents = [
+                    str(arg.info.task_id)
+                    for arg in args
+                    if isinstance(arg, TaskFuture)
+                ]
+                infos.append(
+                    TaskInfo(
+                        task_id=task_id,
+                        function_name=function_name,
+                        parent_task_ids=parents,
+                        submit_ns=submit_ns,
+                    ),
+                )
+            chunk_sizes.append(len(chunk))
+            args, _, references = self._transform_arguments(
+                (
+                    _task_dependency(arg, self.native_dependencies)
+                    if isinstance(arg, TaskFuture)
+                    else arg
+                    for args in chunk
+                    for arg in args
+                ),
+                {},
+                (
+                    arg
+                    for args in chunk
+                    for arg in args
+                    if isinstance(arg, TaskFuture)
+                ),
+            )
+            chunk_args.append(args)
+            chunk_references.append(references)
+
+        chunk_futures = self._compute_submit_many(
+            chunk_task,
+            chunk_args,
+            [{}] * len(chunk_args),
+        )
+        self._release_when_done(chunk_futures, chunk_references)
+
+        futures = [
+            element
+            for chunk_future, size in zip(chunk_futures, chunk_sizes)
+            for element in _split_chunk_future(chunk_future, size)
+        ]
+        self._total_tasks += len(futures)
+
+        return self._register_tasks(futures, infos)
+
+    def chain(self, *stages: ChainStage) -> list[TaskFuture[Any]]:
+        """Schedule a linear chain of tasks.
+
+        Each stage of the chain depends on the result of the previous stage
+        (see [`ChainStage`][webs.executor.workflow.ChainStage]). If the
+        executor was created with `fuse_chains=True`, the chain is executed
+        as a single invocation on the compute executor. This avoids a
+        scheduling round trip and a result transform and resolve per stage
+        while still producing a task future and task record per stage.
+
+        Note:
+            Fused chains are not memoized by the task cache.
+
+        Args:
+            stages: Stages of the chain in execution order.
+
+        Returns:
+            List of [`TaskFuture`][webs.executor.workflow.TaskFuture] objects \
+            with one per stage.
+
+        Raises:
+            ValueError: If the first stage references
+                [`PREVIOUS`][webs.executor.workflow.PREVIOUS].
+        """
+        arguments = [
+            stage._arguments(first=i == 0) for i, stage in enumerate(stages)
+        ]
+        if not self.fuse_chains:
+            tasks: list[TaskFuture[Any]] = []
+            for stage, (args, kwargs) in zip(stages, arguments):
+                tasks.append(
+                    self.submit(
+                        stage.function,
+                        *(tasks[-1] if a is PREVIOUS else a for a in args),
+                        **{
+                            k: tasks[-1] if v is PREVIOUS else v
+                            for k, v in kwargs.items()
+                        },
+                    ),
+                )
+            return tasks
+        if len(stages) == 0:
+            return []
+
+        task_ids = _uuid4_batch(len(stages))
+        submit_ns = time.perf_counter_ns()
+        flat_args: list[Any] = []
+        infos: list[TaskInfo] = []
+        templates: list[
+            tuple[tuple[int | None, ...], dict[str, int | None]]
+        ] = []
+
+        def _template(arg: Any) -> int | None:
+            if arg is PREVIOUS:
+                return None
+            flat_args.append(arg)
+            return len(flat_args) - 1
+
+        for i, (stage, (args, kwargs)) in enumerate(zip(stages, arguments)):
+            parents = [
+                task_ids[i - 1] if arg is PREVIOUS else str(arg.info.task_id)
+                for arg in (*args, *kwargs.values())
+                if arg is PREVIOUS or isinstance(arg, TaskFuture)
+            ]
+            infos.append(
+                TaskInfo(
+                    task_id=task_ids[i],
+                    function_name=stage.function.__name__,
+                    parent_task_ids=parents,
+                    submit_ns=submit_ns,
+                ),
+            )
+            templates.append(
+                (
+                    tuple(_template(arg) for arg in args),
+                    {k: _template(v) for k, v in kwargs.items()},
+                ),
+            )
+
+        chain_task = _TaskChainWrapper(
+            [
+                _TaskWrapper(
+                    stage.function,
+                    task_id=uuid.UUID(task_id),
+                    data_transformer=self.data_transformer,
+                    capture_resources=self.capture_resources,
+                    capture_payload=self.capture_payload,
+                    profiler=self.profiler,
+                )
+                for stage, task_id in zip(stages, task_ids)
+            ],
+            templates,
+        )
+        submit_args, _, references = self._transform_arguments(
+            (
+                _task_dependency(arg, self.native_dependencies)
+                if isinstance(arg, TaskFuture)
+                else arg
+                for arg in flat_args
+            ),
+            {},
+            (arg for arg in flat_args if isinstance(arg, TaskFuture)),
+        )
+        chain_future = self._compute_submit(chain_task, submit_args, {})
+        self._release_when_done([chain_future], [references])
+        futures = _split_chunk_future(chain_future, len(stages))
+        self._total_tasks += len(futures)
+
+        return self._register_tasks(futures, infos)
+
     def map(
         self,
         function: Callable[P, T],
@@ -343,20 +1819,31 @@ class WorkflowExecutor:
             iterables: Variable number of iterables.
             timeout: The maximum number of seconds to wait. If None, then there
                 is no limit on the wait time.
-            chunksize: Currently no supported. If greater than one, the
-                iterables will be chopped into chunks of size chunksize
-                and submitted to the executor. If set to one, the items in the
-                list will be sent one at a time.
+            chunksize: If greater than one, the iterables will be chopped into
+                chunks of size chunksize and each chunk is executed by a
+                single invocation on the compute executor. A task record is
+                still created for each element of a chunk. If set to one,
+                the items in the list will be sent one at a time. Ignored
+                if the executor has a task cache.
 
         Returns:
             An iterator equivalent to: `map(func, *iterables)` but the calls \
             may be evaluated out-of-order.
+
+        Raises:
+            ValueError: if chunksize is less than one.
         """
         # Source: https://github.com/python/cpython/blob/ec1398e117fb142cc830495503dbdbb1ddafe941/Lib/concurrent/futures/_base.py#L583-L625
+        if chunksize < 1:
+            raise ValueError('chunksize must be >= 1.')
+
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        tasks = [self.submit(function, *args) for args in zip(*iterables)]
+        if chunksize == 1 or self.cache is not None:
+            tasks = self.submit_many(function, list(zip(*iterables)))
+        else:
+            tasks = self._submit_chunks(function, iterables, chunksize)
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
@@ -375,6 +1862,78 @@ class WorkflowExecutor:
 
         return _result_iterator()
 
+    def imap(
+        self,
+        function: Callable[P, T],
+        *iterables: Iterable[Any],
+        max_in_flight: int,
+        ordered: bool = True,
+        timeout: float | None = None,
+    ) -> Iterator[T]:
+        """Map a function onto lazy iterables with a bounded task window.
+
+        Unlike [`map()`][webs.executor.workflow.WorkflowExecutor.map], which
+        submits a task for every element up front, at most `max_in_flight`
+        tasks are outstanding at any time. The iterables are consumed lazily
+        and a new task is submitted each time a result is yielded, so the
+        memory used by the driver (and the backlog in the compute executor)
+        does not grow with the length of the iterables.
+
+        Args:
+            function: A callable that will take as many arguments as there are
+                passed iterables.
+            iterables: Variable number of iterables. These can be lazy
+                (e.g., generators).
+            max_in_flight: Maximum number of submitted tasks whose results
+                have not been yielded yet.
+            ordered: Yield results in the order of the iterables. Otherwise,
+                results are yielded as the tasks complete.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+
+        Returns:
+            An iterator of the results of `function` applied to each set \
+            of arguments.
+
+        Raises:
+            TimeoutError: If `timeout` is specified and the next result is not
+                available before the deadline.
+            ValueError: if `max_in_flight` is less than one.
+        """
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight must be >= 1.')
+
+        end_time = None if timeout is None else timeout + time.monotonic()
+        window: _TaskWindow[T] = _TaskWindow(
+            self,
+            function,
+            zip(*iterables),
+            ordered=ordered,
+        )
+        window.submit(max_in_flight)
+
+        # Yield must be hidden in closure so that the first window of futures
+        # is submitted before the first iterator value is required.
+        def _result_iterator() -> Generator[T, None, None]:
+            while len(window) > 0:
+                remaining = (
+                    None
+                    if end_time is None
+                    else max(0, end_time - time.monotonic())
+                )
+                task = window.pop(remaining)
+                if end_time is not None:
+                    remaining = max(0, end_time - time.monotonic())
+                result = _result_or_cancel(task, remaining)
+                # Careful not to keep a reference to the completed task
+                del task
+                # The replacement is only submitted once the result is
+                # obtained so at most max_in_flight tasks are outstanding.
+                window.submit(1)
+                yield result
+
+        return _result_iterator()
+
     def shutdown(
         self,
         wait: bool = True,
@@ -388,6 +1947,21 @@ class WorkflowExecutor:
             cancel_futures: Cancel all pending futures that the executor
                 has not started running. Only used in Python 3.9 and later.
         """
+        if self.straggler_monitor is not None:
+            self.straggler_monitor.close()
+
+        if wait and not cancel_futures:
+            # Tasks waiting to be retried are not known to the compute
+            # executor so must be waited on before the compute executor is
+            # shutdown.
+            wait_python(
+                [
+                    future
+                    for future in list(self._running_tasks.copy())
+                    if isinstance(future, RetryFuture)
+                ],
+            )
+
         if sys.version_info >= (3, 9):  # pragma: >=3.9 cover
             self.compute_executor.shutdown(
                 wait=wait,
@@ -396,6 +1970,32 @@ class WorkflowExecutor:
         else:  # pragma: <3.9 cover
             self.compute_executor.shutdown(wait=wait)
 
+        if self.profiler is not None:
+            self.profiler.merge()
+
+
+def _waitable_futures(
+    tasks: Sequence[TaskFuture[T]],
+) -> tuple[dict[Any, TaskFuture[T]], bool]:
+    # Map the futures to wait on to their tasks and check if the futures
+    # are all Dask futures. Otherwise, Dask futures are chained to Python
+    # futures so a mix of future types (e.g., client-side futures of
+    # speculated tasks and Dask futures) is waited on by concurrent.futures.
+    if len(tasks) > 0 and all(
+        isinstance(task._future, DaskFuture) for task in tasks
+    ):
+        return {task._future: task for task in tasks}, True
+
+    futures: dict[Any, TaskFuture[T]] = {}
+    for task in tasks:
+        future = task._future
+        if isinstance(future, DaskFuture):
+            future = _as_concurrent_future(future)
+        elif not isinstance(future, Future):  # pragma: no cover
+            raise ValueError(f'Unsupported future type {type(future)}.')
+        futures[future] = task
+    return futures, False
+
 
 def as_completed(
     tasks: Sequence[TaskFuture[T]],
@@ -413,17 +2013,16 @@ def as_completed(
         Iterator which yields futures as they complete (finished or cancelled \
         futures).
     """
-    futures = {task._future: task for task in tasks}
+    futures, dask = _waitable_futures(tasks)
 
     kwargs = {'timeout': timeout}
-    if len(tasks) == 0 or isinstance(tasks[0]._future, Future):
-        _as_completed = as_completed_python
-    elif isinstance(tasks[0]._future, DaskFuture):
+    _as_completed: Callable[..., Iterable[Any]]
+    if dask:
         _as_completed = as_completed_dask
         if sys.version_info < (3, 9):  # pragma: <3.9 cover
             kwargs = {}
-    else:  # pragma: no cover
-        raise ValueError(f'Unsupported future type {type(tasks[0])}.')
+    else:
+        _as_completed = as_completed_python
 
     for completed in _as_completed(futures.keys(), **kwargs):
         yield futures[completed]
@@ -446,14 +2045,8 @@ def wait(
         Tuple containing the set of completed tasks and the set of not \
         completed tasks.
     """
-    futures = {task._future: task for task in tasks}
-
-    if len(tasks) == 0 or isinstance(tasks[0]._future, Future):
-        _wait = wait_python
-    elif isinstance(tasks[0]._future, DaskFuture):
-        _wait = wait_dask
-    else:  # pragma: no cover
-        raise ValueError(f'Unsupported future type {type(tasks[0])}.')
+    futures, dask = _waitable_futures(tasks)
+    _wait = wait_dask if dask else wait_python
 
     completed_futures, not_completed_futures = _wait(
         list(futures.keys()),
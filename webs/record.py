@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import logging
 import pathlib
+import queue
 import sys
+import threading
+import time
 from types import TracebackType
 from typing import Any
 from typing import Dict
@@ -18,6 +22,7 @@ if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
 else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
+logger = logging.getLogger(__name__)
 
 Record: TypeAlias = Dict[str, Any]
 """Record type."""
@@ -77,6 +82,151 @@ class JSONRecordLogger:
         self._handle.close()
 
 
+class AsyncJSONRecordLogger:
+    """JSON lines record logger which writes in a background thread.
+
+    Records are added to a bounded queue by
+    [`log()`][webs.record.AsyncJSONRecordLogger.log] and serialized and
+    written in batches by a dedicated writer thread so the caller (typically
+    a done callback in the thread of a compute executor) is not blocked by
+    serialization or file I/O. The file is flushed at least every
+    `flush_interval` seconds while records are being logged.
+
+    If the queue is full, [`log()`][webs.record.AsyncJSONRecordLogger.log]
+    blocks until there is space so no records are dropped. All queued
+    records are written before
+    [`close()`][webs.record.AsyncJSONRecordLogger.close] returns.
+
+    Args:
+        filepath: Filepath to log to.
+        flush_interval: Maximum seconds between flushes of the file.
+        batch_size: Maximum records serialized and written per batch.
+        max_queue_size: Maximum records waiting to be written.
+    """
+
+    def __init__(
+        self,
+        filepath: pathlib.Path | str,
+        *,
+        flush_interval: float = 1.0,
+        batch_size: int = 1024,
+        max_queue_size: int = 65536,
+    ) -> None:
+        self._filepath = pathlib.Path(filepath)
+        self._handle = open(self._filepath, 'a')  # noqa: SIM115
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: queue.Queue[Record | None] = queue.Queue(max_queue_size)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name='webs-record-writer',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def log(self, record: Record) -> None:
+        """Log a record.
+
+        The record must not be modified after being logged.
+
+        Raises:
+            RuntimeError: If the logger is closed.
+        """
+        if self._closed:
+            raise RuntimeError('Cannot log a record to a closed logger.')
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """Write all queued records and close the logger."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._handle.close()
+
+    def _write(self, batch: list[Record]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(json.dumps(record))
+            except (TypeError, ValueError):
+                logger.exception('Failed to serialize record')
+        if len(lines) > 0:
+            self._handle.write('\n'.join(lines) + '\n')
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        stop = False
+        while not stop:
+            batch: list[Record] = []
+            try:
+                record = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                pass
+            else:
+                # Drain up to a batch without waiting.
+                while record is not None:
+                    batch.append(record)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                stop = record is None
+
+            self._write(batch)
+            now = time.monotonic()
+            if stop or now - last_flush >= self.flush_interval:
+                self._handle.flush()
+                last_flush = now
+
+
+class MultiRecordLogger:
+    """Record logger which logs each record to multiple loggers.
+
+    Args:
+        loggers: Record loggers. Closing this logger closes each logger.
+    """
+
+    def __init__(self, *loggers: RecordLogger) -> None:
+        self.loggers = loggers
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def log(self, record: Record) -> None:
+        """Log a record to each logger."""
+        for record_logger in self.loggers:
+            record_logger.log(record)
+
+    def close(self) -> None:
+        """Close each logger."""
+        for record_logger in self.loggers:
+            record_logger.close()
+
+
 class NullRecordLogger:
     """Null/no-op record logger."""
 
@@ -1,17 +1,42 @@
 from __future__ import annotations
 
 import pathlib
+import sys
 from datetime import datetime
+from typing import Callable
+from typing import Literal
 from typing import Optional
 from typing import Union
 
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
 from pydantic import Field
+from pydantic import field_validator
+from pydantic import model_validator
 from pydantic import SerializeAsAny
 
+from webs.columnar import ColumnarRecordLogger
 from webs.config import Config
 from webs.data.config import FilterConfig
 from webs.data.config import TransformerConfig
+from webs.executor.cache import TaskCache
+from webs.executor.clock import ClockOffsetEstimator
 from webs.executor.config import ExecutorConfig
+from webs.executor.metrics import MetricsFileWriter
+from webs.executor.metrics import MetricsServer
+from webs.executor.metrics import TaskMetrics
+from webs.executor.profiling import TaskProfiler
+from webs.executor.retry import RetryEngine
+from webs.executor.retry import RetryPolicy
+from webs.executor.speculation import StragglerMonitor
+from webs.record import AsyncJSONRecordLogger
+from webs.record import JSONRecordLogger
+from webs.record import MultiRecordLogger
+from webs.record import RecordLogger
+from webs.trace import ChromeTraceRecordLogger
 
 
 class RunConfig(Config):
@@ -23,6 +48,67 @@ class RunConfig(Config):
             is used.
         log_level: Logging level for `stdout`.
         run_dir: Runtime directory.
+        task_record_file_name: Task record file name.
+        task_record_logger: Task record logger type. `json` writes each
+            record when the task completes, `json-async` writes records
+            in batches from a background thread, and `columnar` writes
+            chunks of records in the columnar format of
+            [`webs.columnar`][webs.columnar] to a directory named by
+            `task_record_file_name` without the suffix.
+        task_record_flush_interval: Maximum seconds between flushes of the
+            task record file with the `json-async` logger.
+        task_trace_file_name: Chrome trace file name. If set, task records
+            are also written as a Chrome trace (see
+            [`webs.trace`][webs.trace]) while the workflow runs.
+        task_cache: Enable the task result memoization cache.
+        task_cache_dir: Directory of the on-disk tier of the task cache.
+        task_cache_memory_items: Maximum results in the in-memory tier of
+            the task cache.
+        task_cache_disk_bytes: Maximum bytes of the on-disk tier of the
+            task cache.
+        native_dependencies: Pass parent task futures to the compute
+            executor rather than waiting on parent tasks in the client.
+        fuse_chains: Execute declared task chains as a single task.
+        transform_dedup: Transform objects with the same content once and
+            reuse the identifier.
+        transform_eviction: Evict transformed objects once they are no
+            longer referenced by pending tasks or task futures
+            (`unreferenced`) or once they are resolved (`resolve`). If
+            `None`, transformed objects are never evicted. Eviction on
+            resolve cannot be used with deduplication, speculation, or
+            retries.
+        capture_resources: Capture the resource usage of each task in the
+            task records.
+        capture_payload: Capture the serialized sizes of the arguments and
+            result of each task in the task records.
+        profile_functions: Comma separated names of the task functions to
+            profile or `*` to profile all functions. Profiles are written
+            to the `profiles` directory of the run directory.
+        profile_rate: Fraction of the tasks of the selected functions to
+            profile.
+        clock_offsets: Estimate the clock offset of each worker host and
+            correct the execution timestamps in the task records to the
+            clock of the client.
+        speculation: Enable speculative re-execution of straggler tasks.
+        speculation_percentile: Percentile of the execution times of a
+            function used to detect stragglers.
+        speculation_multiple: Multiple of the percentile execution time
+            after which a running task is a straggler.
+        speculation_min_samples: Minimum completed tasks of a function
+            before its tasks are speculated.
+        retries: Maximum number of times a task which fails with a
+            transient error is resubmitted.
+        retry_initial_delay: Seconds before the first retry of a task.
+        retry_backoff_factor: Multiplier of the retry delay after each
+            retry.
+        retry_max_delay: Maximum seconds before a retry.
+        metrics_port: Serve live metrics in the Prometheus text format on
+            this localhost port.
+        metrics_file_name: Periodically rewrite this file with live metrics
+            in the Prometheus text format.
+        metrics_interval: Seconds between rewrites of the metrics file.
+        metrics_window: Seconds of the rolling window of the latency
+            histograms and completion rate.
     """
 
     log_file_level: Union[int, str] = Field(  # noqa: UP007
@@ -41,6 +127,174 @@ class RunConfig(Config):
         'tasks.json',
         description='task record JSON file name',
     )
+    task_record_logger: Literal['json', 'json-async', 'columnar'] = Field(
+        'json',
+        description=(
+            'task record logger ("json" writes records synchronously, '
+            '"json-async" writes batches in a background thread, and '
+            '"columnar" writes NumPy chunks to a directory named by the '
+            'record file name without the suffix)'
+        ),
+    )
+    task_record_flush_interval: float = Field(
+        1.0,
+        description=(
+            'maximum seconds between flushes of the task record file with '
+            'the "json-async" logger'
+        ),
+    )
+    task_trace_file_name: Optional[str] = Field(  # noqa: UP007
+        None,
+        description=(
+            'also write task records to this Chrome trace file which can be '
+            'viewed with Perfetto'
+        ),
+    )
+    task_cache: bool = Field(
+        False,
+        description='enable the task result memoization cache',
+    )
+    task_cache_dir: Optional[str] = Field(  # noqa: UP007
+        None,
+        description=(
+            'task cache directory which can be shared across runs '
+            '(defaults to "task-cache" in the run directory)'
+        ),
+    )
+    task_cache_memory_items: int = Field(
+        1024,
+        description='maximum results in the in-memory tier of the task cache',
+    )
+    task_cache_disk_bytes: int = Field(
+        2**30,
+        description='maximum bytes of the on-disk tier of the task cache',
+    )
+    native_dependencies: bool = Field(
+        True,
+        description=(
+            'pass parent task futures to the compute executor (otherwise '
+            'the client waits on parent tasks before submitting children)'
+        ),
+    )
+    fuse_chains: bool = Field(
+        False,
+        description='execute declared task chains as a single task',
+    )
+    transform_dedup: bool = Field(
+        False,
+        description=(
+            'transform objects with the same content once and reuse the '
+            'identifier'
+        ),
+    )
+    transform_eviction: Optional[Literal['unreferenced', 'resolve']] = Field(  # noqa: UP007
+        None,
+        description=(
+            'evict transformed objects once unreferenced by tasks '
+            '(unreferenced) or once resolved by a single consumer (resolve)'
+        ),
+    )
+    capture_resources: bool = Field(
+        False,
+        description=(
+            'capture the CPU time, peak memory growth, context switches, '
+            'and I/O of each task in the task records'
+        ),
+    )
+    capture_payload: bool = Field(
+        False,
+        description=(
+            'capture the serialized sizes of the arguments and result of '
+            'each task in the task records'
+        ),
+    )
+    profile_functions: Optional[str] = Field(  # noqa: UP007
+        None,
+        description=(
+            'comma separated names of task functions to profile with '
+            'cProfile ("*" profiles all functions)'
+        ),
+    )
+    profile_rate: float = Field(
+        1.0,
+        description='fraction of the tasks of profiled functions to profile',
+    )
+    clock_offsets: bool = Field(
+        False,
+        description=(
+            'estimate the clock offset of each worker host and correct the '
+            'execution timestamps in the task records'
+        ),
+    )
+    speculation: bool = Field(
+        False,
+        description='speculatively re-execute straggler tasks',
+    )
+    speculation_percentile: float = Field(
+        90,
+        description=(
+            'percentile of the execution times of a function used to detect '
+            'stragglers'
+        ),
+    )
+    speculation_multiple: float = Field(
+        2.0,
+        description=(
+            'multiple of the percentile execution time after which a running '
+            'task is a straggler'
+        ),
+    )
+    speculation_min_samples: int = Field(
+        10,
+        description=(
+            'minimum completed tasks of a function before its tasks are '
+            'speculated'
+        ),
+    )
+    retries: int = Field(
+        0,
+        description=(
+            'maximum number of times a task which fails with a transient '
+            'error (e.g., worker loss) is resubmitted'
+        ),
+    )
+    retry_initial_delay: float = Field(
+        1.0,
+        description='seconds before the first retry of a task',
+    )
+    retry_backoff_factor: float = Field(
+        2.0,
+        description='multiplier of the retry delay after each retry',
+    )
+    retry_max_delay: float = Field(
+        60.0,
+        description='maximum seconds before a retry',
+    )
+    metrics_port: Optional[int] = Field(  # noqa: UP007
+        None,
+        description=(
+            'serve live metrics in the Prometheus text format on this '
+            'localhost port (0 chooses an unused port)'
+        ),
+    )
+    metrics_file_name: Optional[str] = Field(  # noqa: UP007
+        None,
+        description=(
+            'periodically rewrite this file with live metrics in the '
+            'Prometheus text format'
+        ),
+    )
+    metrics_interval: float = Field(
+        10.0,
+        description='seconds between rewrites of the metrics file',
+    )
+    metrics_window: float = Field(
+        60.0,
+        description=(
+            'seconds of the rolling window of the live latency histograms '
+            'and completion rate'
+        ),
+    )
     run_dir_format: str = Field(
         'runs/{name}-{timestamp}',
         description=(
@@ -49,6 +303,144 @@ class RunConfig(Config):
         ),
     )
 
+    @field_validator('task_cache_dir', mode='before')
+    @classmethod
+    def _resolve_task_cache_dir(cls, path: str | None) -> str | None:
+        # Resolve relative to the invocation directory because the run
+        # changes the working directory to the run directory.
+        return None if path is None else str(pathlib.Path(path).resolve())
+
+    @model_validator(mode='after')
+    def _check_transform_eviction(self) -> Self:
+        # Objects evicted on resolve can only be resolved once but
+        # deduplicated objects are shared by many tasks and each attempt of
+        # a speculated or retried task resolves the same arguments.
+        if self.transform_eviction != 'resolve':
+            return self
+        if self.transform_dedup:
+            raise ValueError(
+                'transform_eviction=resolve is incompatible with '
+                'transform_dedup.',
+            )
+        if self.speculation or self.retries > 0:
+            raise ValueError(
+                'transform_eviction=resolve is incompatible with speculation '
+                'and retries.',
+            )
+        return self
+
+    def get_record_logger(self) -> RecordLogger:
+        """Create the task record logger."""
+        record_logger: RecordLogger
+        if self.task_record_logger == 'columnar':
+            path = pathlib.Path(self.task_record_file_name)
+            record_logger = ColumnarRecordLogger(path.with_suffix(''))
+        elif self.task_record_logger == 'json-async':
+            record_logger = AsyncJSONRecordLogger(
+                self.task_record_file_name,
+                flush_interval=self.task_record_flush_interval,
+            )
+        else:
+            record_logger = JSONRecordLogger(self.task_record_file_name)
+
+        if self.task_trace_file_name is None:
+            return record_logger
+        return MultiRecordLogger(
+            record_logger,
+            ChromeTraceRecordLogger(self.task_trace_file_name),
+        )
+
+    def get_task_cache(self) -> TaskCache | None:
+        """Create the task cache if enabled."""
+        if not self.task_cache:
+            return None
+        return TaskCache(
+            'task-cache'
+            if self.task_cache_dir is None
+            else self.task_cache_dir,
+            max_memory_items=self.task_cache_memory_items,
+            max_disk_bytes=self.task_cache_disk_bytes,
+        )
+
+    def get_retry_engine(self) -> RetryEngine:
+        """Create the retry engine.
+
+        The default retry policy is only set if `retries` is greater than
+        zero but tasks of functions with a policy are always retried.
+        """
+        policy = (
+            RetryPolicy(
+                max_retries=self.retries,
+                initial_delay=self.retry_initial_delay,
+                backoff_factor=self.retry_backoff_factor,
+                max_delay=self.retry_max_delay,
+            )
+            if self.retries > 0
+            else None
+        )
+        return RetryEngine(policy)
+
+    def get_task_profiler(self) -> TaskProfiler | None:
+        """Create the task profiler if any functions are profiled."""
+        if self.profile_functions is None:
+            return None
+        functions = (
+            None
+            if self.profile_functions.strip() == '*'
+            else [f.strip() for f in self.profile_functions.split(',')]
+        )
+        return TaskProfiler(
+            'profiles',
+            functions=functions,
+            rate=self.profile_rate,
+        )
+
+    def get_clock_estimator(self) -> ClockOffsetEstimator | None:
+        """Create the clock offset estimator if enabled."""
+        return ClockOffsetEstimator() if self.clock_offsets else None
+
+    def get_task_metrics(self) -> TaskMetrics | None:
+        """Create the live task metrics if a metrics exporter is enabled."""
+        if self.metrics_port is None and self.metrics_file_name is None:
+            return None
+        return TaskMetrics(window=self.metrics_window)
+
+    def get_metrics_exporters(
+        self,
+        render: Callable[[], str],
+    ) -> list[MetricsServer | MetricsFileWriter]:
+        """Start the enabled live metrics exporters.
+
+        Args:
+            render: Callable which returns the metrics text (e.g.,
+                [`WorkflowExecutor.metrics_text()`][webs.executor.workflow.WorkflowExecutor.metrics_text]).
+
+        Returns:
+            Started exporters which must be closed by the caller.
+        """
+        exporters: list[MetricsServer | MetricsFileWriter] = []
+        if self.metrics_port is not None:
+            exporters.append(MetricsServer(render, port=self.metrics_port))
+        if self.metrics_file_name is not None:
+            exporters.append(
+                MetricsFileWriter(
+                    render,
+                    self.metrics_file_name,
+                    interval=self.metrics_interval,
+                ),
+            )
+        return exporters
+
+    def get_straggler_monitor(self) -> StragglerMonitor | None:
+        """Create the straggler monitor if speculation is enabled."""
+        if not self.speculation:
+            return None
+        return StragglerMonitor(
+            percentile=self.speculation_percentile,
+            multiple=self.speculation_multiple,
+            min_samples=self.speculation_min_samples,
+        )
+
 
 class BenchmarkConfig(Config):
     """Workflow benchmark configuration.
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import functools
 import logging
 import os
@@ -20,10 +21,10 @@ from webs.data.config import TransformerChoicesConfig
 from webs.data.transform import TaskDataTransformer
 from webs.executor.config import ExecutorChoicesConfig
 from webs.executor.config import get_executor_config
+from webs.executor.metrics import MetricsServer
 from webs.executor.workflow import WorkflowExecutor
 from webs.logging import init_logging
 from webs.logging import RUN_LOG_LEVEL
-from webs.record import JSONRecordLogger
 from webs.run.config import BenchmarkConfig
 from webs.run.config import RunConfig
 from webs.workflow import get_registered_workflow
@@ -154,17 +155,47 @@ def run(config: BenchmarkConfig) -> None:
     data_transformer = TaskDataTransformer(
         transformer=config.transformer.get_transformer(),
         filter_=config.filter.get_filter(),
+        dedup=config.run.transform_dedup,
+        evict_on_resolve=config.run.transform_eviction == 'resolve',
     )
-    record_logger = JSONRecordLogger(config.run.task_record_file_name)
+    record_logger = config.run.get_record_logger()
+    task_cache = config.run.get_task_cache()
+    straggler_monitor = config.run.get_straggler_monitor()
+    retry_engine = config.run.get_retry_engine()
+    task_metrics = config.run.get_task_metrics()
+    clock_estimator = config.run.get_clock_estimator()
     executor = WorkflowExecutor(
         compute_executor,
         config=config,
         data_transformer=data_transformer,
         record_logger=record_logger,
+        cache=task_cache,
+        native_dependencies=config.run.native_dependencies,
+        fuse_chains=config.run.fuse_chains,
+        straggler_monitor=straggler_monitor,
+        retry_engine=retry_engine,
+        metrics=task_metrics,
+        capture_resources=config.run.capture_resources,
+        capture_payload=config.run.capture_payload,
+        profiler=config.run.get_task_profiler(),
+        clock_estimator=clock_estimator,
+        evict_unreferenced=config.run.transform_eviction == 'unreferenced',
     )
 
-    with workflow, record_logger, executor:
-        workflow.run(executor=executor, run_dir=cwd)
+    with contextlib.ExitStack() as stack:
+        # Exporters are closed last so they report the final metrics.
+        for exporter in config.run.get_metrics_exporters(
+            executor.metrics_text,
+        ):
+            stack.enter_context(exporter)
+            if isinstance(exporter, MetricsServer):
+                logger.log(
+                    RUN_LOG_LEVEL,
+                    'Serving metrics at '
+                    f'http://127.0.0.1:{exporter.port}/metrics',
+                )
+        with workflow, record_logger, executor:
+            workflow.run(executor=executor, run_dir=cwd)
 
     runtime = time.perf_counter() - start
     logger.log(
@@ -172,6 +203,35 @@ def run(config: BenchmarkConfig) -> None:
         f'Finished workflow (name={config.name}, '
         f'runtime={runtime:.2f}s, tasks={executor.tasks_executed})',
     )
+    if task_cache is not None:
+        logger.log(
+            RUN_LOG_LEVEL,
+            f'Task cache (hits={task_cache.hits}, misses={task_cache.misses})',
+        )
+    if straggler_monitor is not None:
+        logger.log(
+            RUN_LOG_LEVEL,
+            f'Speculative copies (launched={straggler_monitor.launched}, '
+            f'won={straggler_monitor.won})',
+        )
+    if retry_engine.retries > 0:
+        recovery = retry_engine.mean_time_to_recovery
+        recovery_str = 'n/a' if recovery is None else f'{recovery:.2f}s'
+        logger.log(
+            RUN_LOG_LEVEL,
+            f'Task retries (retries={retry_engine.retries}, '
+            f'recovered={retry_engine.recovered}, '
+            f'exhausted={retry_engine.exhausted}, '
+            f'mean_time_to_recovery={recovery_str})',
+        )
+    if clock_estimator is not None:
+        for hostname, offset in sorted(clock_estimator.offsets.items()):
+            logger.log(
+                RUN_LOG_LEVEL,
+                f'Clock offset (host={hostname}, '
+                f'offset={offset.offset * 1e3:.3f}ms, '
+                f'error={offset.error * 1e3:.3f}ms)',
+            )
 
 
 def main(argv: Sequence[str] | None = None) -> int:  # noqa: D103
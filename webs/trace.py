@@ -0,0 +1,274 @@
+"""Chrome trace export of task records.
+
+Task records are converted to the
+[Trace Event Format](https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU)
+which can be viewed with [Perfetto](https://ui.perfetto.dev) or
+`chrome://tracing`.
+
+Each host is a process in the trace. The tasks executed on a host are
+packed into lanes (threads in the trace) such that the tasks in a lane do
+not overlap, so the number of lanes of a host is the number of tasks which
+executed concurrently on that host. Each task is a slice with child slices
+for the input transform, task function, and result transform phases, and
+flow arrows connect each parent task to its children.
+
+Traces can be written live during a run with the
+[`ChromeTraceRecordLogger`][webs.trace.ChromeTraceRecordLogger] or from
+existing task records with [`write_trace()`][webs.trace.write_trace].
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import threading
+from types import TracebackType
+from typing import Any
+from typing import Iterable
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from webs.record import Record
+
+_PHASES = (
+    (
+        'input_transform',
+        'input_transform_start_time',
+        'input_transform_end_time',
+    ),
+    ('task', 'task_start_time', 'task_end_time'),
+    (
+        'result_transform',
+        'result_transform_start_time',
+        'result_transform_end_time',
+    ),
+)
+
+
+def _us(seconds: float) -> float:
+    return seconds * 1e6
+
+
+class TraceEventBuilder:
+    """Builds trace events from task records.
+
+    Records can be added in any order, but lanes are only optimally packed
+    if records are added in order of execution start time.
+    """
+
+    def __init__(self) -> None:
+        self._hosts: dict[str, int] = {}
+        # End times of the last task in each lane of each host.
+        self._lanes: dict[int, list[float]] = {}
+        # Host, lane, and end time of each task.
+        self._tasks: dict[str, tuple[int, int, float]] = {}
+        # Flows to children of tasks which have not been added.
+        self._pending: dict[str, list[int]] = {}
+        self._flows = 0
+
+    def _lane(self, pid: int, start: float, end: float) -> tuple[int, bool]:
+        # Get the first lane where the task fits and if the lane is new.
+        lanes = self._lanes[pid]
+        for tid, lane_end in enumerate(lanes):
+            if lane_end <= start:
+                lanes[tid] = end
+                return tid, False
+        lanes.append(end)
+        return len(lanes) - 1, True
+
+    def _flow_start(self, flow: int, parent: tuple[int, int, float]) -> Any:
+        pid, tid, end = parent
+        # The start of a flow binds to the slice enclosing the timestamp so
+        # use a timestamp just before the end of the parent.
+        return {
+            'name': 'dependency',
+            'cat': 'dependency',
+            'ph': 's',
+            'id': flow,
+            'pid': pid,
+            'tid': tid,
+            'ts': end - 0.5,
+        }
+
+    def events(self, record: Record) -> list[dict[str, Any]]:
+        """Get the trace events of a task record.
+
+        Returns:
+            List of events. Empty if the task was not executed.
+        """
+        execution = record['execution']
+        if execution is None or record.get('cache_hit', False):
+            return []
+
+        events: list[dict[str, Any]] = []
+        hostname = execution['hostname']
+        pid = self._hosts.get(hostname)
+        if pid is None:
+            pid = len(self._hosts)
+            self._hosts[hostname] = pid
+            self._lanes[pid] = []
+            events.append(
+                {
+                    'name': 'process_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'args': {'name': hostname},
+                },
+            )
+
+        start = _us(execution['execution_start_time'])
+        end = _us(execution['execution_end_time'])
+        tid, new_lane = self._lane(pid, start, end)
+        if new_lane:
+            events.append(
+                {
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': tid,
+                    'args': {'name': f'lane {tid}'},
+                },
+            )
+
+        task_id = record['task_id']
+        events.append(
+            {
+                'name': record['function_name'],
+                'cat': 'task',
+                'ph': 'X',
+                'pid': pid,
+                'tid': tid,
+                'ts': start,
+                'dur': end - start,
+                'args': {
+                    'task_id': task_id,
+                    'parent_task_ids': record['parent_task_ids'],
+                    'queue_time': (
+                        execution['execution_start_time']
+                        - record['submit_time']
+                    ),
+                    'retries': record.get('retries', 0),
+                    'speculative_copies': record.get('speculative_copies', 0),
+                },
+            },
+        )
+        for name, phase_start, phase_end in _PHASES:
+            events.append(
+                {
+                    'name': name,
+                    'cat': 'phase',
+                    'ph': 'X',
+                    'pid': pid,
+                    'tid': tid,
+                    'ts': _us(execution[phase_start]),
+                    'dur': _us(execution[phase_end] - execution[phase_start]),
+                },
+            )
+
+        self._tasks[task_id] = (pid, tid, end)
+        # Flows to children added before this task.
+        for flow in self._pending.pop(task_id, ()):
+            events.append(self._flow_start(flow, self._tasks[task_id]))
+
+        for parent_id in record['parent_task_ids']:
+            flow = self._flows
+            self._flows += 1
+            parent = self._tasks.get(parent_id)
+            if parent is None:
+                self._pending.setdefault(parent_id, []).append(flow)
+            else:
+                events.append(self._flow_start(flow, parent))
+            events.append(
+                {
+                    'name': 'dependency',
+                    'cat': 'dependency',
+                    'ph': 'f',
+                    'bp': 'e',
+                    'id': flow,
+                    'pid': pid,
+                    'tid': tid,
+                    'ts': start,
+                },
+            )
+        return events
+
+
+class ChromeTraceRecordLogger:
+    """Record logger which writes task records as a Chrome trace.
+
+    Events are written as each record is logged. The file is a valid JSON
+    array once the logger is closed, and trace viewers can also load the
+    file if the run did not finish.
+
+    Note:
+        The host, lane, and end time of every task are retained to draw
+        flow arrows to children logged later.
+
+    Note:
+        This class is thread-safe. Records are converted to events and
+        written while holding a lock so records logged concurrently by done
+        callbacks are not interleaved.
+
+    Args:
+        filepath: Trace file path.
+    """
+
+    def __init__(self, filepath: pathlib.Path | str) -> None:
+        self._filepath = pathlib.Path(filepath)
+        self._handle = open(self._filepath, 'w')  # noqa: SIM115
+        self._handle.write('[')
+        self._builder = TraceEventBuilder()
+        self._first = True
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def log(self, record: Record) -> None:
+        """Log a record."""
+        with self._lock:
+            for event in self._builder.events(record):
+                self._handle.write('\n' if self._first else ',\n')
+                self._handle.write(json.dumps(event))
+                self._first = False
+
+    def close(self) -> None:
+        """Close the logger."""
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.write('\n]\n')
+                self._handle.close()
+
+
+def write_trace(
+    records: Iterable[Record],
+    filepath: pathlib.Path | str,
+) -> None:
+    """Write task records to a Chrome trace file.
+
+    Records are sorted by execution start time so the tasks of each host
+    are packed into the fewest lanes.
+
+    Args:
+        records: Task records.
+        filepath: Trace file path.
+    """
+    executed = sorted(
+        (r for r in records if r['execution'] is not None),
+        key=lambda r: r['execution']['execution_start_time'],
+    )
+    with ChromeTraceRecordLogger(filepath) as logger:
+        for record in executed:
+            logger.log(record)
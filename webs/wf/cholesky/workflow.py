@@ -12,6 +12,8 @@ else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
 from webs.context import ContextManagerAddIn
+from webs.executor.workflow import ChainStage
+from webs.executor.workflow import PREVIOUS
 from webs.executor.workflow import TaskFuture
 from webs.executor.workflow import WorkflowExecutor
 from webs.logging import WORK_LOG_LEVEL
@@ -55,6 +57,29 @@ def create_psd_matrix(n: int) -> np.ndarray:
     return psd
 
 
+class _Tiles:
+    # Tiles of a matrix which are replaced by the task which last updated
+    # them.
+
+    def __init__(self, matrix: np.ndarray, block_size: int) -> None:
+        self.matrix = matrix
+        self.block_size = block_size
+        self.n = matrix.shape[0]
+        self.updated: dict[tuple[int, int], TaskFuture[np.ndarray]] = {}
+
+    def index(self, i: int, j: int) -> tuple[slice, slice]:
+        end_i = min(i + self.block_size, self.n)
+        end_j = min(j + self.block_size, self.n)
+        return slice(i, end_i), slice(j, end_j)
+
+    def __getitem__(
+        self,
+        key: tuple[int, int],
+    ) -> np.ndarray | TaskFuture[np.ndarray]:
+        updated = self.updated.get(key)
+        return self.matrix[self.index(*key)] if updated is None else updated
+
+
 class CholeskyWorkflow(ContextManagerAddIn):
     """Cholesky workflow.
 
@@ -105,55 +130,62 @@ class CholeskyWorkflow(ContextManagerAddIn):
             logger.log(WORK_LOG_LEVEL, f'Input matrix: {matrix.shape}')
         logger.log(WORK_LOG_LEVEL, f'Block size: {block_size}')
 
+        # All tasks are submitted before waiting on any results so the
+        # executor sees the whole task graph and can prioritize tasks on the
+        # critical path.
+        tiles = _Tiles(matrix, block_size)
+        lower_tasks: dict[tuple[int, int], TaskFuture[np.ndarray]] = {}
         for k in range(0, n, block_size):
-            end_k = min(k + block_size, n)
-            lower_tasks: dict[tuple[int, int], TaskFuture[np.ndarray]] = {}
-
-            lower_tasks[(k, k)] = executor.submit(
-                potrf,
-                matrix[k:end_k, k:end_k],
-            )
-
-            for i in range(k + block_size, n, block_size):
-                end_i = min(i + block_size, n)
+            self._submit_panel(executor, tiles, lower_tasks, k)
+            self._submit_trailing_update(executor, tiles, lower_tasks, k)
 
-                lower_tasks[(i, k)] = executor.submit(
-                    trsm,
-                    lower_tasks[(k, k)],
-                    matrix[i:end_i, k:end_k],
-                )
+        for (i, j), tile in lower_tasks.items():
+            lower[tiles.index(i, j)] = tile.result()
 
-            gemm_tasks: dict[tuple[int, int], TaskFuture[np.ndarray]] = {}
+        for (i, j), updated in tiles.updated.items():
+            matrix[tiles.index(i, j)] = updated.result()
 
-            for i in range(k + block_size, n, block_size):
-                end_i = min(i + block_size, n)
-                for j in range(i, n, block_size):
-                    end_j = min(j + block_size, n)
+        if matrix.shape[0] <= max_print_size:
+            logger.log(WORK_LOG_LEVEL, f'Output matrix:\n{lower}')
+        else:
+            logger.log(WORK_LOG_LEVEL, f'Output matrix: {lower.shape}')
 
-                    syrk_task = executor.submit(
-                        syrk,
-                        matrix[i:end_i, j:end_j],
-                        lower_tasks[(i, k)],
-                    )
+    def _submit_panel(
+        self,
+        executor: WorkflowExecutor,
+        tiles: _Tiles,
+        lower_tasks: dict[tuple[int, int], TaskFuture[np.ndarray]],
+        k: int,
+    ) -> None:
+        # Factor the diagonal tile of column k and solve for the tiles
+        # below it.
+        lower_tasks[(k, k)] = executor.submit(potrf, tiles[(k, k)])
+        for i in range(k + tiles.block_size, tiles.n, tiles.block_size):
+            lower_tasks[(i, k)] = executor.submit(
+                trsm,
+                lower_tasks[(k, k)],
+                tiles.matrix[tiles.index(i, k)],
+            )
 
-                    gemm_tasks[(i, j)] = executor.submit(
+    def _submit_trailing_update(
+        self,
+        executor: WorkflowExecutor,
+        tiles: _Tiles,
+        lower_tasks: dict[tuple[int, int], TaskFuture[np.ndarray]],
+        k: int,
+    ) -> None:
+        # Update the tiles of the trailing matrix with the solved tiles of
+        # column k.
+        for i in range(k + tiles.block_size, tiles.n, tiles.block_size):
+            for j in range(i, tiles.n, tiles.block_size):
+                # The result of syrk is only consumed by gemm so the tasks
+                # are declared as a chain which can be fused.
+                _, tiles.updated[(i, j)] = executor.chain(
+                    ChainStage(syrk, tiles[(i, j)], lower_tasks[(i, k)]),
+                    ChainStage(
                         gemm,
-                        syrk_task,
+                        PREVIOUS,
                         lower_tasks[(i, k)],
                         lower_tasks[(j, k)],
-                    )
-
-            for (i, j), tile in lower_tasks.items():
-                end_i = min(i + block_size, n)
-                end_j = min(j + block_size, n)
-                lower[i:end_i, j:end_j] = tile.result()
-
-            for (i, j), tile in gemm_tasks.items():
-                end_i = min(i + block_size, n)
-                end_j = min(j + block_size, n)
-                matrix[i:end_i, j:end_j] = tile.result()
-
-        if matrix.shape[0] <= max_print_size:
-            logger.log(WORK_LOG_LEVEL, f'Output matrix:\n{lower}')
-        else:
-            logger.log(WORK_LOG_LEVEL, f'Output matrix: {lower.shape}')
+                    ),
+                )
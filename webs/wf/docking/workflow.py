@@ -18,8 +18,9 @@ from time import monotonic
 import pandas as pd
 
 from webs.context import ContextManagerAddIn
-from webs.executor.workflow import as_completed
-from webs.executor.workflow import TaskFuture
+from webs.executor.workflow import ChainStage
+from webs.executor.workflow import CompletionQueue
+from webs.executor.workflow import PREVIOUS
 from webs.executor.workflow import WorkflowExecutor
 from webs.wf.docking.config import DockingWorkflowConfig
 from webs.wf.docking.train import run_model
@@ -290,7 +291,7 @@ class DockingWorkflow(ContextManagerAddIn):
             executor: Workflow task executor.
             run_dir: Run directory.
         """
-        futures: list[TaskFuture[tuple[str, float] | str]] = []
+        futures: CompletionQueue[tuple[str, float] | str] = CompletionQueue()
         train_data = []
         smiles_simulated = []
         initial_count = 5
@@ -317,26 +318,29 @@ class DockingWorkflow(ContextManagerAddIn):
             vina_conf_file = pathlib.Path(f'{fname}-config.txt')
             output_ligand_pdbqt = pathlib.Path(f'{fname}-out.pdb')
 
-            smi_future = executor.submit(smi_to_pdb, smiles, pdb_file=pdb_file)
-            element_future = executor.submit(
-                set_element,
+            (
                 smi_future,
-                output_pdb=output_pdb,
-                tcl_path=self.tcl_path,
-            )
-            pdbqt_future = executor.submit(
-                pdb_to_pdbqt,
                 element_future,
-                pdbqt_file=pdbqt_file,
-            )
-            config_future = executor.submit(
-                make_autodock_config,
-                self.receptor,
                 pdbqt_future,
-                vina_conf_file,
-                output_ligand_pdbqt,
+                config_future,
+                dock_future,
+            ) = executor.chain(
+                ChainStage(smi_to_pdb, smiles, pdb_file=pdb_file),
+                ChainStage(
+                    set_element,
+                    output_pdb=output_pdb,
+                    tcl_path=self.tcl_path,
+                ),
+                ChainStage(pdb_to_pdbqt, pdbqt_file=pdbqt_file),
+                ChainStage(
+                    make_autodock_config,
+                    self.receptor,
+                    PREVIOUS,
+                    vina_conf_file,
+                    output_ligand_pdbqt,
+                ),
+                ChainStage(autodock_vina, smiles),
             )
-            dock_future = executor.submit(autodock_vina, config_future, smiles)
             _ = executor.submit(
                 cleanup,
                 dock_future,
@@ -347,18 +351,16 @@ class DockingWorkflow(ContextManagerAddIn):
                 output_ligand_pdbqt,
             )
 
-            futures.append(dock_future)
+            futures.add(dock_future)
 
         # wait for all the futures to finish
         while len(futures) > 0:
-            future = next(as_completed(futures))
+            future = futures.get()
             dock_score = future.result()
 
             assert isinstance(dock_score, tuple), dock_score
             smiles, score = dock_score
 
-            futures.remove(future)
-
             logger.info(f'Computation for {smiles} succeeded: {score}')
 
             train_data.append(
@@ -384,7 +386,7 @@ class DockingWorkflow(ContextManagerAddIn):
             )
 
             train_data = []
-            futures = []
+            futures = CompletionQueue()
             batch_count = 0
             for smiles in predictions['smiles']:
                 if smiles not in smiles_simulated:
@@ -396,33 +398,28 @@ class DockingWorkflow(ContextManagerAddIn):
                     vina_conf_file = pathlib.Path(f'{fname}-config.txt')
                     output_ligand_pdbqt = pathlib.Path(f'{fname}-out.pdb')
 
-                    smi_future = executor.submit(
-                        smi_to_pdb,
-                        smiles,
-                        pdb_file=pdb_file,
-                    )
-                    element_future = executor.submit(
-                        set_element,
+                    (
                         smi_future,
-                        output_pdb=output_pdb,
-                        tcl_path=self.tcl_path,
-                    )
-                    pdbqt_future = executor.submit(
-                        pdb_to_pdbqt,
                         element_future,
-                        pdbqt_file=pdb_file,
-                    )
-                    config_future = executor.submit(
-                        make_autodock_config,
-                        self.receptor,
                         pdbqt_future,
-                        vina_conf_file,
-                        output_ligand_pdbqt_file=output_ligand_pdbqt,
-                    )
-                    dock_future = executor.submit(
-                        autodock_vina,
                         config_future,
-                        smiles,
+                        dock_future,
+                    ) = executor.chain(
+                        ChainStage(smi_to_pdb, smiles, pdb_file=pdb_file),
+                        ChainStage(
+                            set_element,
+                            output_pdb=output_pdb,
+                            tcl_path=self.tcl_path,
+                        ),
+                        ChainStage(pdb_to_pdbqt, pdbqt_file=pdb_file),
+                        ChainStage(
+                            make_autodock_config,
+                            self.receptor,
+                            PREVIOUS,
+                            vina_conf_file,
+                            output_ligand_pdbqt_file=output_ligand_pdbqt,
+                        ),
+                        ChainStage(autodock_vina, smiles),
                     )
                     executor.submit(
                         cleanup,
@@ -434,7 +431,7 @@ class DockingWorkflow(ContextManagerAddIn):
                         output_ligand_pdbqt,
                     )
 
-                    futures.append(dock_future)
+                    futures.add(dock_future)
 
                     batch_count += 1
 
@@ -443,13 +440,12 @@ class DockingWorkflow(ContextManagerAddIn):
 
             # wait for all the workflows to complete
             while len(futures) > 0:
-                future = next(as_completed(futures))
+                future = futures.get()
                 dock_score = future.result()
 
                 assert isinstance(dock_score, tuple), dock_score
 
                 smiles, score = dock_score
-                futures.remove(future)
 
                 logger.info(f'Computation for {smiles} succeeded: {score}')
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from concurrent.futures import Executor
+import functools
 import logging
 import pathlib
 import random
@@ -16,6 +17,7 @@ else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
 from webs.context import ContextManagerAddIn
+from webs.executor.retry import RetryEngine
 from webs.executor.workflow import TaskFuture, WorkflowExecutor
 from webs.logging import WORK_LOG_LEVEL
 from webs.wf.failure.config import FailureWorkflowConfig
@@ -95,18 +97,41 @@ class FlawExecutor(WorkflowExecutor):
             failure_type: str,
             compute_executor: Executor, 
             config, 
-            *, 
-            data_transformer: TaskDataTransformer[Any] | None = None, 
-            record_logger: RecordLogger | None = None
+            **options: Any,
         ) -> None:
         self.failure_rate = failure_rate
         self.failure_type = failure_type
         self.submit_cnt = 0 # for certain failure choice
-        super().__init__(
-            compute_executor, 
-            config, 
-            data_transformer=data_transformer, 
-            record_logger=record_logger
+        # Remaining options (cache, retry engine, record logger, etc.) are
+        # the keyword arguments of WorkflowExecutor.
+        super().__init__(compute_executor, config, **options)
+
+    @classmethod
+    def from_executor(
+        cls,
+        failure_rate: float,
+        failure_type: str,
+        executor: WorkflowExecutor,
+    ) -> Self:
+        """Create a flaw executor with the options of another executor."""
+        return cls(
+            failure_rate,
+            failure_type,
+            executor.compute_executor,
+            executor.config,
+            data_transformer=executor.data_transformer,
+            record_logger=executor.record_logger,
+            cache=executor.cache,
+            native_dependencies=executor.native_dependencies,
+            fuse_chains=executor.fuse_chains,
+            straggler_monitor=executor.straggler_monitor,
+            retry_engine=executor.retry_engine,
+            metrics=executor.metrics,
+            capture_resources=executor.capture_resources,
+            capture_payload=executor.capture_payload,
+            profiler=executor.profiler,
+            clock_estimator=executor.clock_estimator,
+            evict_unreferenced=executor.references is not None,
         )
 
     def get_fail_task(self):
@@ -127,7 +152,13 @@ class FlawExecutor(WorkflowExecutor):
         fail_task = self.get_fail_task()
         # self.submit_cnt += 1
         # return super().submit(new_func, self.submit_cnt, fail_task, function, *args, **kwargs)
-        return super().submit(new_func, self.failure_rate, fail_task, function, *args, **kwargs)
+        # Copy the name and retry policy of the task function so records and
+        # retries are the same as for the unwrapped function.
+        flawed = functools.update_wrapper(
+            functools.partial(new_func, self.failure_rate, fail_task, function),
+            function,
+        )
+        return super().submit(flawed, *args, **kwargs)
 
 
 class FailurerWorkflow(ContextManagerAddIn):
@@ -168,13 +199,10 @@ class FailurerWorkflow(ContextManagerAddIn):
         
         # TODO: WorkflowExecutor init twice, should only be once
         # probably the cause of "Exception: attempt to clean up DFK when it has already been cleaned-up"
-        flaw_executor = FlawExecutor(
+        flaw_executor = FlawExecutor.from_executor(
             self.config.failure_rate,
             self.config.failure_type,
-            executor.compute_executor,
-            config=executor.config,
-            data_transformer=executor.data_transformer,
-            record_logger=executor.record_logger,
+            executor,
         )
         config_type = get_registered_workflow(self.config.true_workflow).config_type
         cfg = config_type(**default_config_dic)
@@ -66,6 +66,13 @@ recorded on an M3 MacBook Air.
    Result:
      Runtime: 52.12s
    ```
+6. **Many small map tasks executed in chunks:**
+   Each invocation on the executor runs `--map-chunksize` map tasks
+   which amortizes per-task overheads when the map tasks are small. A task
+   record is still logged for each map task.
+   ```bash
+   python -m webs.run mapreduce --executor process-pool --mode random --map-task-count 10000 --word-count 100 --map-chunksize 100
+   ```
 """  # noqa: E501
 
 from __future__ import annotations
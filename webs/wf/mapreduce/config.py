@@ -14,6 +14,10 @@ class MapreduceWorkflowConfig(Config):
     # Required arguments
     mode: str = Field(description='"random" or "enron" run mode')
     map_task_count: int = Field(description='number of map tasks')
+    map_chunksize: int = Field(
+        1,
+        description='number of map tasks to execute per invocation',
+    )
 
     # For the random run mode
     word_count: int = Field(500, description='[random] words per map task')
@@ -121,6 +121,7 @@ class MapreduceWorkflow(ContextManagerAddIn):
                 executor.map(
                     _map_function_for_enron_run_mode,
                     map_task_inputs,
+                    chunksize=self.config.map_chunksize,
                 ),
             )
         else:
@@ -132,7 +133,11 @@ class MapreduceWorkflow(ContextManagerAddIn):
             )
 
             map_counters.extend(
-                executor.map(map_function_for_random_run_mode, paragraphs),
+                executor.map(
+                    map_function_for_random_run_mode,
+                    paragraphs,
+                    chunksize=self.config.map_chunksize,
+                ),
             )
 
         logger.log(
@@ -15,7 +15,7 @@ import pandas as pd
 from matplotlib import pyplot as plt
 
 from webs.context import ContextManagerAddIn
-from webs.executor.workflow import as_completed
+from webs.executor.workflow import CompletionQueue
 from webs.executor.workflow import TaskFuture
 from webs.executor.workflow import WorkflowExecutor
 from webs.logging import WORK_LOG_LEVEL
@@ -80,6 +80,7 @@ class MoldesignWorkflow(ContextManagerAddIn):
         sim_futures: dict[TaskFuture[float], str] = {
             executor.submit(compute_vertical, mol): mol for mol in init_mols
         }
+        sim_queue = CompletionQueue(sim_futures)
         logger.log(WORK_LOG_LEVEL, 'Submitted initial computations')
         logger.info(f'Initial set: {init_mols}')
         already_ran = set()
@@ -87,9 +88,7 @@ class MoldesignWorkflow(ContextManagerAddIn):
         # Loop until you finish populating the initial set
         while len(sim_futures) > 0:
             # First, get the next completed computation from the list
-            future: TaskFuture[float] = next(
-                as_completed(list(sim_futures.keys())),
-            )
+            future = sim_queue.get()
 
             # Remove it from the list of still-running task and get the input
             smiles = sim_futures.pop(future)
@@ -107,6 +106,7 @@ class MoldesignWorkflow(ContextManagerAddIn):
                     smiles,
                 )
                 sim_futures[new_future] = smiles
+                sim_queue.add(new_future)
             else:
                 # If it succeeded, store the result
                 train_data_list.append(
@@ -165,7 +165,9 @@ class MoldesignWorkflow(ContextManagerAddIn):
             # Wait for every task in the current batch to complete, and store
             # successful results.
             new_results = []
-            for future in as_completed(list(sim_futures.keys())):
+            sim_queue = CompletionQueue(sim_futures)
+            while len(sim_queue) > 0:
+                future = sim_queue.get()
                 if future.exception() is None:
                     new_results.append(
                         {
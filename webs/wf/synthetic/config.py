@@ -26,3 +26,10 @@ class SyntheticWorkflowConfig(Config):
     bag_max_running: int = Field(
         description='max running tasks in bag workflow',
     )
+    batch_submit: bool = Field(
+        False,
+        description=(
+            'submit independent tasks in batches with submit_many '
+            '(bag and reduce workflows)'
+        ),
+    )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import contextlib
 import logging
 import pathlib
+import queue
 import sys
 import time
 
@@ -12,8 +14,9 @@ else:  # pragma: <3.11 cover
 
 from webs.context import ContextManagerAddIn
 from webs.executor.workflow import as_completed
+from webs.executor.workflow import ChainStage
+from webs.executor.workflow import CompletionQueue
 from webs.executor.workflow import TaskFuture
-from webs.executor.workflow import wait
 from webs.executor.workflow import WorkflowExecutor
 from webs.logging import WORK_LOG_LEVEL
 from webs.wf.synthetic.config import SyntheticWorkflowConfig
@@ -45,26 +48,49 @@ def noop_task(*data: bytes, output_size: int, sleep: float) -> bytes:
     return result
 
 
-def run_bag_of_tasks(
+def _submit_noop_tasks(
+    executor: WorkflowExecutor,
+    count: int,
+    task_data_bytes: int,
+    task_sleep: float,
+    *,
+    batch_submit: bool,
+) -> list[TaskFuture[bytes]]:
+    kwargs = {'output_size': task_data_bytes, 'sleep': task_sleep}
+    if batch_submit:
+        return executor.submit_many(
+            noop_task,
+            [(randbytes(task_data_bytes),) for _ in range(count)],
+            [kwargs] * count,
+        )
+    return [
+        executor.submit(noop_task, randbytes(task_data_bytes), **kwargs)
+        for _ in range(count)
+    ]
+
+
+def run_bag_of_tasks(  # noqa: PLR0913
     executor: WorkflowExecutor,
     task_count: int,
     task_data_bytes: int,
     task_sleep: float,
     max_running_tasks: int,
+    *,
+    batch_submit: bool = False,
 ) -> None:
     """Run bag of tasks workflow."""
     max_running_tasks = min(max_running_tasks, task_count)
     start = time.monotonic()
 
-    running_tasks = [
-        executor.submit(
-            noop_task,
-            randbytes(task_data_bytes),
-            output_size=task_data_bytes,
-            sleep=task_sleep,
-        )
-        for _ in range(max_running_tasks)
-    ]
+    running_tasks = CompletionQueue(
+        _submit_noop_tasks(
+            executor,
+            max_running_tasks,
+            task_data_bytes,
+            task_sleep,
+            batch_submit=batch_submit,
+        ),
+    )
     logger.log(
         WORK_LOG_LEVEL,
         f'Submitted {max_running_tasks} initial tasks',
@@ -74,22 +100,25 @@ def run_bag_of_tasks(
     submitted_tasks = len(running_tasks)
 
     while submitted_tasks < task_count:
-        finished_tasks, _ = wait(running_tasks, return_when='FIRST_COMPLETED')
+        # Block for the next completed task then drain any other tasks
+        # that have already completed so replacements are submitted together.
+        finished_tasks = [running_tasks.get()]
+        with contextlib.suppress(queue.Empty):
+            while True:
+                finished_tasks.append(running_tasks.get_nowait())
         for task in finished_tasks:
             assert task.exception() is None
-            running_tasks.remove(task)
             completed_tasks += 1
 
-        new_tasks = [
-            executor.submit(
-                noop_task,
-                randbytes(task_data_bytes),
-                output_size=task_data_bytes,
-                sleep=task_sleep,
-            )
-            for _ in finished_tasks
-        ]
-        running_tasks.extend(new_tasks)
+        new_tasks = _submit_noop_tasks(
+            executor,
+            min(len(finished_tasks), task_count - submitted_tasks),
+            task_data_bytes,
+            task_sleep,
+            batch_submit=batch_submit,
+        )
+        for task in new_tasks:
+            running_tasks.add(task)
         submitted_tasks += len(new_tasks)
 
         if completed_tasks % max_running_tasks == 0:
@@ -101,8 +130,9 @@ def run_bag_of_tasks(
                 f'{len(running_tasks)})',
             )
 
-    wait(running_tasks, return_when='ALL_COMPLETED')
-    completed_tasks += len(running_tasks)
+    while len(running_tasks) > 0:
+        assert running_tasks.get().exception() is None
+        completed_tasks += 1
     rate = completed_tasks / (time.monotonic() - start)
     logger.log(
         WORK_LOG_LEVEL,
@@ -156,17 +186,17 @@ def run_reduce(
     task_count: int,
     task_data_bytes: int,
     task_sleep: float,
+    *,
+    batch_submit: bool = False,
 ) -> None:
     """Run reduce worklow."""
-    map_tasks = [
-        executor.submit(
-            noop_task,
-            randbytes(task_data_bytes),
-            output_size=task_data_bytes,
-            sleep=task_sleep,
-        )
-        for _ in range(task_count)
-    ]
+    map_tasks = _submit_noop_tasks(
+        executor,
+        task_count,
+        task_data_bytes,
+        task_sleep,
+        batch_submit=batch_submit,
+    )
     logger.log(WORK_LOG_LEVEL, f'Submitted {task_count} initial tasks')
 
     reduce_task = executor.submit(
@@ -190,17 +220,20 @@ def run_sequential(
     """Run sequential workflow."""
     start = time.monotonic()
     initial_data = randbytes(task_data_bytes)
-    tasks: list[TaskFuture[bytes]] = []
-
-    for i in range(task_count):
-        input_data = initial_data if i == 0 else tasks[-1]
-        task = executor.submit(
+    # Each task only depends on the previous task so the tasks are declared
+    # as a chain which can be fused by the executor.
+    stages = [
+        ChainStage(
             noop_task,
-            input_data,
+            *((initial_data,) if i == 0 else ()),
             output_size=task_data_bytes,
             sleep=task_sleep,
         )
-        tasks.append(task)
+        for i in range(task_count)
+    ]
+    tasks: list[TaskFuture[bytes]] = executor.chain(*stages)
+
+    for i, task in enumerate(tasks):
         logger.log(
             WORK_LOG_LEVEL,
             f'Submitted task {i+1}/{task_count} '
@@ -228,6 +261,9 @@ class SyntheticWorkflow(ContextManagerAddIn):
         task_sleep: Seconds to sleep for in each task.
         bag_max_running: Maximum concurrently executing tasks in the "bag"
             workflow.
+        batch_submit: Submit independent tasks in batches with
+            [`submit_many()`][webs.executor.workflow.WorkflowExecutor.submit_many]
+            in the "bag" and "reduce" workflows.
     """
 
     name = 'synthetic'
@@ -240,12 +276,15 @@ class SyntheticWorkflow(ContextManagerAddIn):
         task_data_bytes: int,
         task_sleep: float,
         bag_max_running: int,
+        *,
+        batch_submit: bool = False,
     ) -> None:
         self.structure = structure
         self.task_count = task_count
         self.task_data_bytes = task_data_bytes
         self.task_sleep = task_sleep
         self.bag_max_running = bag_max_running
+        self.batch_submit = batch_submit
         super().__init__()
 
     @classmethod
@@ -264,6 +303,7 @@ class SyntheticWorkflow(ContextManagerAddIn):
             task_data_bytes=config.task_data_bytes,
             task_sleep=config.task_sleep,
             bag_max_running=config.bag_max_running,
+            batch_submit=config.batch_submit,
         )
 
     def run(self, executor: WorkflowExecutor, run_dir: pathlib.Path) -> None:
@@ -281,6 +321,7 @@ class SyntheticWorkflow(ContextManagerAddIn):
                 task_data_bytes=self.task_data_bytes,
                 task_sleep=self.task_sleep,
                 max_running_tasks=self.bag_max_running,
+                batch_submit=self.batch_submit,
             )
         elif self.structure == WorkflowStructure.DIAMOND:
             run_diamond(
@@ -295,6 +336,7 @@ class SyntheticWorkflow(ContextManagerAddIn):
                 task_count=self.task_count,
                 task_data_bytes=self.task_data_bytes,
                 task_sleep=self.task_sleep,
+                batch_submit=self.batch_submit,
             )
         elif self.structure == WorkflowStructure.SEQUENTIAL:
             run_sequential(